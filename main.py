@@ -1,27 +1,9 @@
 from puzzles.sudoku.sudoku_puzzle import Sudoku_Puzzle
 from puzzles.sudoku.seed_manager import *
+from puzzles.sudoku.generator import generate_many
 from puzzles.puzzle import Difficulty, Page_Size
 import argparse
 
-parser = argparse.ArgumentParser(description="Puzzle Generator")
-parser.add_argument("puzzle", nargs=1, help="Name of the puzzle. Options are: Sudoku, Wordsearch, ...")
-args = parser.parse_args()
-
-if args.puzzle[0] == "Sudoku":
-
-    difficulty = get_difficulty()
-
-    page_size = get_page_size()
-
-    puzzle = Sudoku_Puzzle()
-
-    puzzle.generate(difficulty)
-
-    puzzle.to_pdf(False, page_size, "test.pdf")
-
-if args.puzzle[0] == "Generate":
-    mutate_seed("fihkmjglelmgehfjikkejlgifmhigmjlhekfjflikehgmehkmfgljihligekmfjgkfhjmielmjefilkhg")
-
 def get_page_size() -> Page_Size:
     '''
     Method to get the page size from the user.
@@ -45,10 +27,13 @@ def get_page_size() -> Page_Size:
     # Return the page size given by the user input
     return sizes[user_input]
 
-def get_difficulty() -> Difficulty:
+def get_difficulty(user_input:str=None) -> Difficulty:
     '''
     Method to get the difficulty from the user.
 
+    Parameters:
+        - user_input (optional) - name of the difficulty already given by the user (default asks for one)
+
     Returns:
         - Difficulty given by the user
     '''
@@ -59,8 +44,9 @@ def get_difficulty() -> Difficulty:
                            "Hard" : Difficulty.HARD,
                            "Extreme" : Difficulty.EXTREME }
 
-    # Ask the user for the page size
-    user_input = input("Input a difficulty for the puzzle. Options are: Easy, Medium, Hard and Extreme: ")
+    # Ask the user for the difficulty if it has not been given
+    if user_input is None:
+        user_input = input("Input a difficulty for the puzzle. Options are: Easy, Medium, Hard and Extreme: ")
 
     # If they give bad input, repeat till they give valid input
     while user_input not in difficulties.keys():
@@ -68,3 +54,34 @@ def get_difficulty() -> Difficulty:
 
     # Return the difficulty given by the user input
     return difficulties[user_input]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Puzzle Generator")
+    parser.add_argument("puzzle", nargs=1, help="Name of the puzzle. Options are: Sudoku, Batch, Wordsearch, ...")
+    parser.add_argument("--count", type=int, default=100, help="Number of puzzles to generate in a batch (or seeds to generate by mutation)")
+    parser.add_argument("--difficulty", choices=["Easy", "Medium", "Hard", "Extreme"], default="Medium", help="Difficulty of the puzzles in a batch")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default is the number of cores)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the random number generators, for reproducible batches")
+    parser.add_argument("--output", default="puzzles.txt", help="File to write the batch of puzzles to")
+    args = parser.parse_args()
+
+    if args.puzzle[0] == "Sudoku":
+
+        difficulty = get_difficulty()
+
+        page_size = get_page_size()
+
+        puzzle = Sudoku_Puzzle()
+
+        puzzle.generate(difficulty)
+
+        puzzle.to_pdf(False, page_size, "test.pdf")
+
+    if args.puzzle[0] == "Generate":
+        mutate_seed("fihkmjglelmgehfjikkejlgifmhigmjlhekfjflikehgmehkmfgljihligekmfjgkfhjmielmjefilkhg", limit=args.count)
+
+    if args.puzzle[0] == "Batch":
+        # Write each puzzle as a line of its puzzle seed, solution seed and difficulty as it is generated
+        with open(args.output, "w") as file:
+            for puzzle_seed, solution_seed, difficulty in generate_many(args.count, get_difficulty(args.difficulty), workers=args.workers, seed=args.seed):
+                file.write(puzzle_seed + " " + solution_seed + " " + str(difficulty) + "\n")
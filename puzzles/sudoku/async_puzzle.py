@@ -0,0 +1,158 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+import asyncio
+import os
+
+# Imports from other parts of the project
+from ..puzzle import Difficulty, Page_Size
+from .sudoku_puzzle import Sudoku_Puzzle
+from .create_difficulty import Symmetry
+
+class Async_Sudoku:
+    '''
+    Class to generate sudoku puzzles and render them as pdf documents from asyncio code. The CPU work is
+    run in an executor (a pool of worker processes by default) and files are written in a thread, so the
+    event loop is not blocked. The number of jobs in the executor at once is limited, so callers wait for a
+    free slot instead of queueing unbounded work.
+
+    Cancelling a call which is waiting for a slot, or whose job has not started, stops the job. A job
+    which has started runs to the end in its worker, but its result is discarded.
+    '''
+
+    def __init__(self, executor:Executor=None, max_concurrent:int=None):
+        '''
+        Method to create the asyncio puzzle service.
+
+        Parameters:
+            - executor (optional) - process or thread executor to run the CPU work in (default is a pool of
+              worker processes, one for each core, which is shut down when the service is closed)
+            - max_concurrent (optional) - number of jobs run in the executor at once (default is the number
+              of cores)
+        '''
+
+        if executor is not None and not isinstance(executor, Executor):
+            raise Exception("Invalid Executor")
+
+        if max_concurrent is not None and (type(max_concurrent) is not int or max_concurrent < 1):
+            raise Exception("Invalid Max Concurrent")
+
+        # Use a pool of worker processes owned by the service if an executor is not given
+        self.__owned = executor is None
+        self.__executor = ProcessPoolExecutor() if executor is None else executor
+        self.__slots = asyncio.Semaphore(max_concurrent or os.cpu_count() or 1)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self) -> None:
+        '''
+        Method to close the service, shutting down its pool of worker processes (an executor given to the
+        service is left running).
+        '''
+
+        if self.__owned and self.__executor is not None:
+            # Shut the pool down in a thread, as waiting for running jobs would block the event loop
+            await asyncio.to_thread(self.__executor.shutdown, wait=True, cancel_futures=True)
+            self.__executor = None
+
+    async def generate(self, difficulty:Difficulty, seed:str=None, size:int=9, clues:int=None,
+                       symmetry:Symmetry=Symmetry.NONE) -> Sudoku_Puzzle:
+        '''
+        Method to generate a sudoku puzzle in the executor.
+
+        Parameters:
+            - difficulty - the level of difficulty the generated puzzle should have (Difficulty enum)
+            - seed (optional) - the seed to use for the puzzle, if not included it uses a random one
+            - size (optional) - the number of rows, columns and boxes in the grid (default is 9)
+            - clues (optional) - the number of filled cells the puzzle should have (default is as few as the
+              difficulty level allows)
+            - symmetry (optional) - the symmetry of the pattern of filled cells (Symmetry enum, default is none)
+
+        Returns:
+            - the generated puzzle
+        '''
+
+        return await self.__run(generate_puzzle, difficulty, seed, size, clues, symmetry)
+
+    async def to_pdf(self, puzzle:Sudoku_Puzzle, include_solution:bool, page_size:Page_Size, filepath:str) -> None:
+        '''
+        Method to render a sudoku puzzle as a pdf document in the executor and write it to a file in a thread.
+
+        Parameters:
+            - puzzle - the sudoku puzzle to render
+            - include_solution - boolean indicating whether to include the solution on the page
+            - page_size - the size of the page the pdf should be (Page_Size enum)
+            - filepath - string filepath denoting where to save the pdf document to
+        '''
+
+        if type(puzzle) is not Sudoku_Puzzle:
+            raise Exception("Invalid Puzzle")
+
+        document = await self.__run(render_pdf, puzzle, include_solution, page_size)
+        await asyncio.to_thread(write_file, filepath, document)
+
+    async def __run(self, function, *args):
+        '''
+        Method to run a function in the executor once a slot is free.
+
+        Parameters:
+            - function - module level function to run (so it can be sent to a worker process)
+            - args - arguments of the function
+
+        Returns:
+            - the result of the function
+        '''
+
+        if self.__executor is None:
+            raise Exception("Service Closed")
+
+        async with self.__slots:
+            return await asyncio.get_running_loop().run_in_executor(self.__executor, function, *args)
+
+def generate_puzzle(difficulty:Difficulty, seed:str, size:int, clues:int, symmetry:Symmetry) -> Sudoku_Puzzle:
+    '''
+    Method to generate a sudoku puzzle, run by the executor of the asyncio service.
+
+    Parameters:
+        - difficulty - the level of difficulty the generated puzzle should have (Difficulty enum)
+        - seed - the seed to use for the puzzle (None for a random one)
+        - size - the number of rows, columns and boxes in the grid
+        - clues - the number of filled cells the puzzle should have (None for as few as possible)
+        - symmetry - the symmetry of the pattern of filled cells (Symmetry enum)
+
+    Returns:
+        - the generated puzzle
+    '''
+
+    puzzle = Sudoku_Puzzle()
+    puzzle.generate(difficulty, seed=seed, size=size, clues=clues, symmetry=symmetry)
+    return puzzle
+
+def render_pdf(puzzle:Sudoku_Puzzle, include_solution:bool, page_size:Page_Size) -> bytes:
+    '''
+    Method to render a sudoku puzzle as a pdf document, run by the executor of the asyncio service.
+
+    Parameters:
+        - puzzle - the sudoku puzzle to render
+        - include_solution - boolean indicating whether to include the solution on the page
+        - page_size - the size of the page the pdf should be (Page_Size enum)
+
+    Returns:
+        - the bytes of the pdf document
+    '''
+
+    return puzzle.render_pdf(include_solution, page_size)
+
+def write_file(filepath:str, data:bytes) -> None:
+    '''
+    Method to write bytes to a file, run in a thread by the asyncio service.
+
+    Parameters:
+        - filepath - string filepath denoting where to save the file to
+        - data - the bytes to write
+    '''
+
+    with open(filepath, "wb") as file:
+        file.write(data)
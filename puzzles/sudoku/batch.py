@@ -0,0 +1,374 @@
+import numpy as np
+
+# Imports from other parts of the project
+from .sudoku import CELL_UNITS, UNIT_CELLS
+from .cell_value import Cell_Value
+
+# Index arrays of the cells in each unit (27 x 9) and of the units of each cell (81 x 3)
+UNIT_INDICES = np.array(UNIT_CELLS, dtype=np.intp)
+CELL_UNIT_INDICES = np.array(CELL_UNITS, dtype=np.intp)
+
+# Bit mask with a bit set for every cell value from one to nine (bit n represents value n)
+FULL_MASK = 0b1111111110
+
+# Shifts to move the bit of each value from one to nine into the lowest bit
+VALUE_SHIFTS = np.arange(1, 10, dtype=np.uint16)
+
+# Lookup tables from a bit mask of values to the number of values and to the value of a single value mask
+MASK_SIZES = np.array([bin(mask).count("1") for mask in range(1 << 10)], dtype=np.uint8)
+MASK_SINGLE = np.array([mask.bit_length() - 1 if bin(mask).count("1") == 1 else 0 for mask in range(1 << 10)], dtype=np.uint8)
+
+def seeds_to_array(seeds) -> np.ndarray:
+    '''
+    Method to convert a list of seeds into an array of the integer values of their cells.
+
+    Parameters:
+        - seeds - list of seeds of sudoku grids
+
+    Returns:
+        - N x 81 uint8 array of the cell values of each seed (in seed order)
+    '''
+
+    # Check all the seeds are the correct length
+    if any(type(seed) is not str or len(seed) != 81 for seed in seeds):
+        raise Exception("Invalid Seed")
+
+    # Decode all the seeds in one operation (this checks all the characters are valid)
+    values = Cell_Value.decode_seed("".join(seeds))
+
+    # Return the values with one row for each seed
+    return np.frombuffer(values, dtype=np.uint8).reshape(-1, 81).copy()
+
+def check_grids(grids) -> np.ndarray:
+    '''
+    Method to check a batch of sudoku grids is a valid array of cell values.
+
+    Parameters:
+        - grids - N x 81 array of integer cell values (in seed order)
+
+    Returns:
+        - the grids as an N x 81 uint8 array
+    '''
+
+    # Check the grids are a two dimensional array of integers with 81 cells in each row (other types would
+    # be truncated when narrowed)
+    grids = np.asarray(grids)
+    if not np.issubdtype(grids.dtype, np.integer) or grids.ndim != 2 or grids.shape[1] != 81:
+        raise Exception("Invalid Grids")
+
+    # Check the values are between 0 and 9 before narrowing them (so negative values do not wrap around)
+    if grids.size > 0 and (grids.min() < 0 or grids.max() > 9):
+        raise Exception("Invalid Grids")
+
+    # Return the grids with the smallest integer type (without copying grids which are already uint8)
+    return grids.astype(np.uint8, copy=False)
+
+def load_seed_file(file_path:str) -> np.ndarray:
+    '''
+    Method to load all the seeds in a seed file into an array of the integer values of their cells.
+
+    Parameters:
+        - file_path - path of a file with one seed on each line
+
+    Returns:
+        - N x 81 uint8 array of the cell values of each seed (in file order)
+    '''
+
+    # Read all of the seeds in the file, ignoring blank lines
+    with open(file_path, "r") as file:
+        seeds = [line.strip() for line in file if line.strip() != ""]
+
+    # Convert the seeds to an array
+    return seeds_to_array(seeds)
+
+def validate_grids(grids, empty_as_valid=False, chunk_size:int=65536) -> tuple:
+    '''
+    Method to check whether each of a batch of sudoku grids is valid, in vectorised passes over chunks
+    of the batch.
+
+    Parameters:
+        - grids - N x 81 array of integer cell values (in seed order), or the path of a seed file
+        - empty_as_valid (optional) - boolean indicating whether to accept empty cells as valid
+        - chunk_size (optional) - number of grids checked in each pass (limits the memory used)
+
+    Returns:
+        - boolean array of length N of whether each grid is valid
+        - integer array of length N of the index of the first invalid cell of each grid (-1 if valid), a
+          cell is invalid if its value is repeated in its row, column or box (or it is empty when empty
+          cells are not accepted)
+    '''
+
+    # Load the grids from the seed file if a file path is given
+    if type(grids) is str:
+        grids = load_seed_file(grids)
+
+    # Check the grids are valid (they are kept as uint8, so only one chunk at a time is widened)
+    grids = check_grids(grids)
+
+    # Check the chunk size is valid
+    if type(chunk_size) is not int or chunk_size < 1:
+        raise Exception("Invalid Chunk Size")
+
+    valid = np.empty(len(grids), dtype=bool)
+    first = np.empty(len(grids), dtype=np.intp)
+
+    # Loop through the grids a chunk at a time
+    for start in range(0, len(grids), chunk_size):
+        chunk = grids[start:start + chunk_size].astype(np.intp)
+        size = len(chunk)
+
+        # Get the bit of each filled cell's value (bit n for value n, no bit for an empty cell)
+        bits = np.left_shift(1, chunk).astype(np.uint16) & FULL_MASK
+
+        # A unit has no repeated values if adding the bits of its cells gives the same as combining them
+        units = bits[:, UNIT_INDICES]
+        repeated = (units.sum(axis=2, dtype=np.uint16) != np.bitwise_or.reduce(units, axis=2)).any(axis=1)
+
+        # Unless empty cells are accepted, a grid with an empty cell is not valid
+        empty = (chunk == 0).any(axis=1) if not empty_as_valid else np.zeros(size, dtype=bool)
+
+        valid[start:start + size] = ~(repeated | empty)
+        first[start:start + size] = -1
+
+        # Find the first invalid cell of each of the invalid grids
+        invalid = np.flatnonzero(~valid[start:start + size])
+        if len(invalid) > 0:
+            first[start + invalid] = __first_invalid_cells(chunk[invalid], empty_as_valid)
+
+    # Return whether each grid is valid and the first invalid cell of each grid
+    return valid, first
+
+def __first_invalid_cells(grids:np.ndarray, empty_as_valid:bool) -> np.ndarray:
+    '''
+    Method to find the first invalid cell of each of a batch of invalid sudoku grids.
+
+    Parameters:
+        - grids - N x 81 array of integer cell values of invalid grids
+        - empty_as_valid - boolean indicating whether to accept empty cells as valid
+
+    Returns:
+        - integer array of length N of the index of the first invalid cell of each grid
+    '''
+
+    size = len(grids)
+
+    # Count the number of times each value appears in each unit of each grid, by counting the occurrences
+    # of (grid, unit, value) numbered as (grid * 27 + unit) * 10 + value
+    units = grids[:, UNIT_INDICES] + (np.arange(size * 27).reshape(size, 27, 1) * 10)
+    counts = np.bincount(units.ravel(), minlength=size * 270).reshape(size, 270)
+
+    # Get the count of each cell's value in each of the cell's units (N x 81 x 3)
+    positions = CELL_UNIT_INDICES * 10 + grids[:, :, np.newaxis]
+    repeats = np.take_along_axis(counts, positions.reshape(size, 243), axis=1).reshape(size, 81, 3)
+
+    # A filled cell is invalid if its value appears more than once in any of its units
+    invalid = (repeats > 1).any(axis=2) & (grids != 0)
+
+    # Unless empty cells are accepted, empty cells are also invalid
+    if not empty_as_valid:
+        invalid |= grids == 0
+
+    # Return the index of the first invalid cell of each grid
+    return invalid.argmax(axis=1)
+
+class Sudoku_Batch:
+    '''
+    Class to hold a batch of partially filled Sudoku grids as an N x 81 array, and to fill in cells which
+    can be found by singles for the whole batch at once.
+    '''
+
+    def __init__(self, grids):
+        '''
+        Method to create a batch of sudoku grids.
+
+        Parameters:
+            - grids - N x 81 array of integer cell values (in seed order), a list of seeds or the path of a
+                      seed file
+        '''
+
+        # Load the grids from the seed file or the list of seeds if given
+        if type(grids) is str:
+            grids = load_seed_file(grids)
+        elif type(grids) is list:
+            grids = seeds_to_array(grids)
+
+        # Store a copy of the grids (so the original array is not changed)
+        self.__grids = check_grids(grids).copy()
+
+        # Whether each grid has been found to have no solution
+        self.__contradictions = np.zeros(len(self.__grids), dtype=bool)
+
+        # Number of rounds of singles in which cells were filled in each grid
+        self.__rounds = np.zeros(len(self.__grids), dtype=np.intp)
+
+    def __len__(self) -> int:
+        '''
+        Method to return the number of grids in the batch.
+        '''
+
+        return len(self.__grids)
+
+    def get_grids(self) -> np.ndarray:
+        '''
+        Method to get the cell values of the grids in the batch.
+
+        Returns:
+            - N x 81 uint8 array of the cell values of each grid
+        '''
+
+        return self.__grids.copy()
+
+    def get_seeds(self) -> list:
+        '''
+        Method to get the seeds of the grids in the batch.
+
+        Returns:
+            - list of the seed of each grid
+        '''
+
+        seeds = Cell_Value.encode_seed(self.__grids.tobytes())
+
+        return [seeds[index:index + 81] for index in range(0, len(seeds), 81)]
+
+    def get_rounds(self) -> np.ndarray:
+        '''
+        Method to get the number of rounds of singles in which cells were filled in each grid.
+
+        Returns:
+            - integer array of length N
+        '''
+
+        return self.__rounds.copy()
+
+    def contradictions(self) -> np.ndarray:
+        '''
+        Method to get which grids have been found to have no solution (a repeated value, an empty cell with
+        no candidates, or a value with no place left in a unit).
+
+        Returns:
+            - boolean array of length N
+        '''
+
+        return self.__contradictions.copy()
+
+    def solved(self) -> np.ndarray:
+        '''
+        Method to get which grids are completely and validly filled.
+
+        Returns:
+            - boolean array of length N
+        '''
+
+        return validate_grids(self.__grids)[0]
+
+    def candidates(self) -> np.ndarray:
+        '''
+        Method to get the candidate values of every cell of every grid in the batch.
+
+        Returns:
+            - N x 81 x 9 boolean array, where [n, i, v - 1] is whether value v is a candidate for cell i of
+              grid n (filled cells have no candidates)
+        '''
+
+        masks = self.__candidate_masks(self.__grids)[0]
+
+        return ((masks[:, :, np.newaxis] >> VALUE_SHIFTS) & 1).astype(bool)
+
+    @staticmethod
+    def __candidate_masks(grids:np.ndarray) -> tuple:
+        '''
+        Method to get the bit masks of the candidates of each cell in a batch of grids.
+
+        Parameters:
+            - grids - N x 81 array of integer cell values
+
+        Returns:
+            - N x 81 array of candidate bit masks (bit n set when value n is a candidate, 0 for filled cells)
+            - N x 27 array of bit masks of the values placed in each unit
+            - boolean array of length N of whether any value is repeated in a unit
+        '''
+
+        # Get the bit of each filled cell's value and combine them for each unit
+        bits = np.left_shift(1, grids.astype(np.uint16)).astype(np.uint16) & FULL_MASK
+        units = bits[:, UNIT_INDICES]
+        unit_masks = np.bitwise_or.reduce(units, axis=2)
+
+        # A value is repeated in a unit if adding the bits of its cells differs from combining them
+        repeated = (units.sum(axis=2, dtype=np.uint16) != unit_masks).any(axis=1)
+
+        # The candidates of an empty cell are the values not placed in any of its units
+        used = np.bitwise_or.reduce(unit_masks[:, CELL_UNIT_INDICES], axis=2)
+        masks = (~used & FULL_MASK) * (grids == 0)
+
+        return masks.astype(np.uint16), unit_masks, repeated
+
+    def propagate(self, hidden=True, chunk_size:int=4096) -> int:
+        '''
+        Method to fill in all the cells of every grid which can be found by naked singles (a cell with one
+        candidate) and hidden singles (a value with one place in a row, column or box), repeating in rounds
+        until no grid changes. Grids found to have no solution are marked as contradictions and left alone.
+
+        Parameters:
+            - hidden (optional) - boolean whether to also fill in hidden singles (default is True)
+            - chunk_size (optional) - number of grids propagated at a time (limits the memory used)
+
+        Returns:
+            - the largest number of rounds taken by any grid
+        '''
+
+        # Check the chunk size is valid
+        if type(chunk_size) is not int or chunk_size < 1:
+            raise Exception("Invalid Chunk Size")
+
+        rounds = 0
+
+        # Loop through the grids a chunk at a time
+        for start in range(0, len(self.__grids), chunk_size):
+            # Indices of the grids in the chunk which could still change
+            active = np.arange(start, min(start + chunk_size, len(self.__grids)))
+            active = active[~self.__contradictions[active]]
+
+            chunk_rounds = 0
+            while len(active) > 0:
+                grids = self.__grids[active]
+                masks, unit_masks, repeated = self.__candidate_masks(grids)
+                empty = grids == 0
+
+                # A grid has no solution if a value is repeated or an empty cell has no candidates
+                dead = repeated | (empty & (masks == 0)).any(axis=1)
+
+                # Fill in the naked singles
+                values = np.where(empty & (MASK_SIZES[masks] == 1), MASK_SINGLE[masks], 0).astype(np.uint8)
+
+                if hidden:
+                    # For each unit and value, whether each cell of the unit has the value as a candidate
+                    places = ((masks[:, UNIT_INDICES][..., np.newaxis] >> VALUE_SHIFTS) & 1).astype(np.uint8)
+                    counts = places.sum(axis=2)
+                    placed = ((unit_masks[..., np.newaxis] >> VALUE_SHIFTS) & 1).astype(bool)
+
+                    # A grid has no solution if a value has not been placed and has no place left in a unit
+                    dead |= ((counts == 0) & ~placed).any(axis=(1, 2))
+
+                    # Fill in the hidden singles in cells not already filled by a naked single
+                    grid, unit, value = np.nonzero((counts == 1) & ~placed)
+                    cells = UNIT_INDICES[unit, places[grid, unit, :, value].argmax(axis=1)]
+                    free = values[grid, cells] == 0
+                    values[grid[free], cells[free]] = value[free] + 1
+
+                # Leave the grids with no solution unchanged
+                values[dead] = 0
+                self.__contradictions[active[dead]] = True
+
+                # Update the grids which have changed
+                changed = (values != 0).any(axis=1)
+                self.__grids[active[changed]] = grids[changed] + values[changed]
+                self.__rounds[active[changed]] += 1
+
+                # Carry on with the grids which have changed
+                active = active[changed]
+                chunk_rounds += 1 if len(active) > 0 else 0
+
+            rounds = max(rounds, chunk_rounds)
+
+        # Return the largest number of rounds taken
+        return rounds
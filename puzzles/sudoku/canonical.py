@@ -0,0 +1,354 @@
+import itertools
+import random
+import math
+import numpy as np
+
+# Imports from other parts of the project
+from .cell_value import Cell_Value
+from .grid_layout import get_layout
+
+# Cache of the row orders allowed for each grid size (bands in any order, rows in any order within a band)
+row_orders = {}
+
+# Largest number of row orders searched when finding a canonical form (the row orders of 16 x 16 and
+# larger grids are far too many to list)
+MAX_ROW_ORDERS = 1 << 17
+
+# Cache of the orders of each number of items, as tables of every permutation
+permutations = {}
+
+class Grid_Transform:
+    '''
+    Class to hold a transform of the symmetry group of a sudoku grid, which keeps a valid grid valid.
+
+    A transform optionally transposes the grid (only for grids with square boxes), then reorders the
+    columns (stacks in any order, columns in any order within a stack) and the rows (bands in any order,
+    rows in any order within a band), then relabels the values.
+    '''
+
+    def __init__(self, size:int, transpose:bool, columns, rows, labels):
+        '''
+        Method to create a transform.
+
+        Parameters:
+            - size - number of rows, columns and boxes in the grid
+            - transpose - boolean indicating whether the grid is transposed first
+            - columns - column (of the transposed grid, if transposed) moved to each column
+            - rows - row (of the transposed grid, if transposed) moved to each row
+            - labels - new value of each value, starting with empty (which stays empty)
+        '''
+
+        layout = get_layout(size)
+
+        # Check that the transform keeps the rows, columns and boxes of the grid together
+        if type(transpose) is not bool or (transpose and layout.box_height != layout.box_width):
+            raise Exception("Invalid Transform")
+
+        if not Grid_Transform.__is_order(columns, size, layout.box_width) or not Grid_Transform.__is_order(rows, size, layout.box_height):
+            raise Exception("Invalid Transform")
+
+        if sorted(labels[1:]) != list(range(1, size + 1)) or labels[0] != 0:
+            raise Exception("Invalid Transform")
+
+        self.size = size
+        self.transpose = transpose
+        self.columns = tuple(columns)
+        self.rows = tuple(rows)
+        self.labels = tuple(labels)
+
+        # Index table of the cell of the seed moved to each cell (in seed order), and translation table of
+        # the seed characters of the values
+        if transpose:
+            self.__cells = [row * size + column for column in self.columns for row in self.rows]
+        else:
+            self.__cells = [column * size + row for column in self.columns for row in self.rows]
+
+        self.__table = str.maketrans(Cell_Value.encode_seed(bytes(range(size + 1))), Cell_Value.encode_seed(bytes(self.labels)))
+
+    def __eq__(self, other):
+        return type(other) is Grid_Transform and (self.size, self.transpose, self.columns, self.rows, self.labels) == \
+            (other.size, other.transpose, other.columns, other.rows, other.labels)
+
+    def __repr__(self):
+        return "Grid_Transform(size={}, transpose={}, columns={}, rows={}, labels={})".format(
+            self.size, self.transpose, self.columns, self.rows, self.labels)
+
+    def apply(self, seed:str) -> str:
+        '''
+        Method to transform the grid of a seed, by moving the cells with the transform's index table and
+        relabelling the values with a translation table.
+
+        Parameters:
+            - seed - seed of a complete or partial grid of the transform's size
+
+        Returns:
+            - seed of the transformed grid
+        '''
+
+        # Check the seed is the right length and only has values of the grid size
+        if type(seed) is not str or len(seed) != self.size * self.size:
+            raise Exception("Invalid Seed")
+        Cell_Value.decode_seed(seed, self.size)
+
+        return "".join(map(seed.__getitem__, self.__cells)).translate(self.__table)
+
+    @staticmethod
+    def random(size:int=9):
+        '''
+        Method to pick a random transform from the symmetry group of a grid size, each equally likely.
+
+        Parameters:
+            - size (optional) - the number of rows, columns and boxes in the grid (default is 9)
+
+        Returns:
+            - the random transform
+        '''
+
+        layout = get_layout(size)
+
+        # Pick an order of the stacks and bands, then of the columns and rows within each of them, from the
+        # precomputed tables of the orders of each number of items
+        orders = list()
+        for group in [layout.box_width, layout.box_height]:
+            groups = Grid_Transform.__permutations(size // group)
+            offsets = Grid_Transform.__permutations(group)
+            orders += [[start * group + offset for start in random.choice(groups) for offset in random.choice(offsets)]]
+
+        transpose = layout.box_height == layout.box_width and random.random() < 0.5
+        return Grid_Transform(size, transpose, orders[0], orders[1], [0] + random.sample(range(1, size + 1), size))
+
+    def inverse(self):
+        '''
+        Method to find the transform which undoes this transform.
+
+        Returns:
+            - the inverse transform
+        '''
+
+        columns = [0] * self.size
+        rows = [0] * self.size
+        labels = [0] * (self.size + 1)
+
+        for position in range(self.size):
+            columns[self.columns[position]] = position
+            rows[self.rows[position]] = position
+
+        for value in range(self.size + 1):
+            labels[self.labels[value]] = value
+
+        # Transposing swaps the roles of the rows and columns, so they are undone in the other order
+        if self.transpose:
+            columns, rows = rows, columns
+
+        return Grid_Transform(self.size, self.transpose, columns, rows, labels)
+
+    @staticmethod
+    def __permutations(count:int) -> list:
+        '''
+        Method to get the table of every order of a number of items, creating it the first time it is used.
+
+        Parameters:
+            - count - number of items
+
+        Returns:
+            - list of tuples of every order of the items
+        '''
+
+        if count not in permutations:
+            permutations[count] = list(itertools.permutations(range(count)))
+
+        return permutations[count]
+
+    @staticmethod
+    def __is_order(order, size:int, group:int) -> bool:
+        '''
+        Method to check a list of positions keeps groups of consecutive positions together.
+
+        Parameters:
+            - order - position moved to each position
+            - size - number of positions
+            - group - number of positions in each group
+
+        Returns:
+            - boolean indicating whether the order is a valid permutation of the groups
+        '''
+
+        if sorted(order) != list(range(size)):
+            return False
+
+        # Each run of a group's length must come from a single group
+        return all(len({position // group for position in order[start:start + group]}) == 1 for start in range(0, size, group))
+
+def canonicalize(seed:str, size:int=9) -> tuple:
+    '''
+    Method to find the canonical form of a complete or partial grid, the same for every grid which can be
+    made from it by the transforms of its symmetry group. The canonical form is the smallest seed of all
+    the transforms of the grid which label the values in the order they first appear in the seed.
+
+    The seed is built a column at a time, keeping only the transforms giving the smallest seed so far, so
+    every choice of transpose and row order is tried for the first column but few are left after that.
+
+    Parameters:
+        - seed - seed of a complete or partial grid
+        - size (optional) - the number of rows, columns and boxes in the grid, up to 12 (default is 9)
+
+    Returns:
+        - seed of the canonical form of the grid
+        - Grid_Transform which turns the grid into its canonical form
+    '''
+
+    layout = get_layout(size)
+
+    # Check the grid size has few enough row orders to search
+    if row_order_count(size) > MAX_ROW_ORDERS:
+        raise Exception("Invalid Size")
+
+    grid = seed_to_grid(seed, size)
+
+    # Check no values are repeated in a row or column, so each value appears at most once in a column
+    for lines in [grid, grid.T]:
+        ordered = np.sort(lines, axis=1)
+        if ((ordered[:, 1:] == ordered[:, :-1]) & (ordered[:, 1:] != 0)).any():
+            raise Exception("Invalid Seed")
+
+    # Every candidate transform starts from a choice of transpose and row order
+    grids = np.stack([grid, grid.T]) if layout.box_height == layout.box_width else grid[np.newaxis]
+    orders = __row_orders(layout)
+    flat_grids = grids.ravel()
+    partial = bool((grid == 0).any())
+
+    transposes = np.repeat(np.arange(len(grids)), len(orders))
+    rows = np.tile(orders, (len(grids), 1))
+    columns = np.zeros((len(rows), 0), dtype=np.intp)
+    labels = np.zeros((len(rows), size + 1), dtype=np.uint8)
+    counts = np.zeros(len(rows), dtype=np.uint8)
+    stack = np.arange(size) // layout.box_width
+
+    for position in range(size):
+        # Candidates of a partial grid often tie, so merge the candidates which would build the same
+        # columns from here on (the same labels and values left in each unused column, in row order)
+        if partial and len(rows) > 1:
+            left = grids[transposes[:, np.newaxis, np.newaxis], np.arange(size)[np.newaxis, :, np.newaxis], rows[:, np.newaxis, :]]
+            np.put_along_axis(left, columns[:, :, np.newaxis], size + 1, axis=1)
+
+            current = stack[columns[:, -1]] if position > 0 else np.zeros(len(rows), dtype=np.intp)
+            keys = np.ascontiguousarray(np.column_stack([left.reshape(len(left), -1), labels, current]).astype(np.uint8))
+            first = np.sort(np.unique(keys.view(np.dtype((np.void, keys.shape[1]))), return_index=True)[1])
+
+            transposes, rows, columns, labels, counts = transposes[first], rows[first], columns[first], labels[first], counts[first]
+
+        # Columns each candidate can place next, from an unused stack at the start of a stack and from
+        # the current stack otherwise
+        used = np.zeros((len(rows), size), dtype=bool)
+        np.put_along_axis(used, columns, True, axis=1)
+
+        if position % layout.box_width == 0:
+            used_stacks = np.zeros((len(rows), size // layout.box_width), dtype=bool)
+            np.put_along_axis(used_stacks, stack[columns], True, axis=1)
+            allowed = ~used_stacks[:, stack]
+        else:
+            allowed = (stack == stack[columns[:, -1]][:, np.newaxis]) & ~used
+
+        # Pairs of a candidate and a column it can place next, with the offsets of the pair's column, row
+        # order and labels in the flattened arrays
+        candidate, column = np.nonzero(allowed)
+        column_offsets = (transposes[candidate] * size + column) * size
+        row_offsets = candidate * size
+        label_offsets = candidate * (size + 1)
+        first_labels = counts[candidate].astype(np.intp) + 1
+        added = np.zeros(len(candidate), dtype=np.intp)
+
+        # Build the new column of each pair a row at a time, keeping only the pairs giving the smallest
+        # column so far. A value appearing for the first time is labelled after the values already
+        # labelled and the new values above it in the column
+        # (the first column of a complete grid is labelled in order for every pair, so all of them tie)
+        for row in range(size if partial or position > 0 else 0):
+            values = flat_grids.take(column_offsets + rows.ravel().take(row_offsets + row))
+            column_values = labels.ravel().take(label_offsets + values)
+
+            new = (values != 0) & (column_values == 0)
+            if new.any():
+                column_values = np.where(new, first_labels + added, column_values)
+                added += new
+
+            keep = column_values == column_values.min()
+            if not keep.all():
+                candidate, column, added = candidate[keep], column[keep], added[keep]
+                column_offsets, row_offsets, label_offsets, first_labels = \
+                    column_offsets[keep], row_offsets[keep], label_offsets[keep], first_labels[keep]
+
+        # Extend the candidates left with their new column and its labels
+        transposes, rows, labels, counts = transposes[candidate], rows[candidate], labels[candidate], counts[candidate]
+        columns = np.column_stack([columns[candidate], column])
+
+        values = flat_grids.take(((transposes * size + column) * size)[:, np.newaxis] + rows)
+        positions = (np.arange(len(rows)) * (size + 1))[:, np.newaxis] + values
+        new = (values != 0) & (labels.ravel().take(positions) == 0)
+        labels.ravel()[positions[new]] = (counts[:, np.newaxis] + np.cumsum(new, axis=1, dtype=np.uint8))[new]
+        counts = counts + new.sum(axis=1, dtype=np.uint8)
+
+    # Every candidate left gives the canonical form, so take the first (giving the values missing from a
+    # partial grid the labels left over, in order)
+    labels = labels[0].tolist()
+    missing = iter(sorted(set(range(1, size + 1)) - set(labels)))
+    labels = [0] + [label if label != 0 else next(missing) for label in labels[1:]]
+
+    transform = Grid_Transform(size, bool(transposes[0]), columns[0].tolist(), rows[0].tolist(), labels)
+    return transform.apply(seed), transform
+
+def row_order_count(size:int=9) -> int:
+    '''
+    Method to count the row orders allowed for a grid size, bands in any order and rows in any order
+    within a band.
+
+    Parameters:
+        - size (optional) - the number of rows, columns and boxes in the grid (default is 9)
+
+    Returns:
+        - the number of row orders
+    '''
+
+    layout = get_layout(size)
+    bands = size // layout.box_height
+    return math.factorial(bands) * math.factorial(layout.box_height) ** bands
+
+def __row_orders(layout) -> np.ndarray:
+    '''
+    Method to list the row orders allowed for a grid size, bands in any order and rows in any order
+    within a band.
+
+    Parameters:
+        - layout - layout of the grid size
+
+    Returns:
+        - array of the rows moved to each row, one order for each row
+    '''
+
+    if layout.size not in row_orders:
+        bands = [tuple(range(band * layout.box_height, (band + 1) * layout.box_height)) for band in range(layout.box_width)]
+
+        orders = list()
+        for band_order in itertools.permutations(bands):
+            for row_order in itertools.product(*[itertools.permutations(band) for band in band_order]):
+                orders += [sum(row_order, ())]
+
+        row_orders[layout.size] = np.array(orders, dtype=np.intp)
+
+    return row_orders[layout.size]
+
+def seed_to_grid(seed:str, size:int=9) -> np.ndarray:
+    '''
+    Method to convert a seed into an array of its cell values indexed by column then row.
+
+    Parameters:
+        - seed - seed of a complete or partial grid
+        - size (optional) - the number of rows, columns and boxes in the grid (default is 9)
+
+    Returns:
+        - size x size uint8 array of the cell values
+    '''
+
+    if type(seed) is not str or len(seed) != size * size:
+        raise Exception("Invalid Seed")
+
+    return np.frombuffer(bytes(Cell_Value.decode_seed(seed, size)), dtype=np.uint8).reshape(size, size)
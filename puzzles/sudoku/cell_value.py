@@ -1,5 +1,15 @@
 from enum import Enum
 
+# Largest integer value of a cell in any supported grid size (the seed character of a value is chr(value + 100))
+MAX_VALUE = 25
+
+# Seed characters of all the integer cell values, ordered by value
+SEED_CHARACTERS = bytes(range(100, 101 + MAX_VALUE))
+
+# Translation tables between the seed characters and the integer values of the cells
+SEED_TO_VALUE = bytes.maketrans(SEED_CHARACTERS, bytes(range(MAX_VALUE + 1)))
+VALUE_TO_SEED = bytes.maketrans(bytes(range(MAX_VALUE + 1)), SEED_CHARACTERS)
+
 class Cell_Value(Enum):
     '''
     Enum Class to hold the information on a cell in a Sudoku grid.
@@ -36,3 +46,44 @@ class Cell_Value(Enum):
 
         # Return a character dependent on the integer value of the value
         return chr(self.value + 100)
+
+    @staticmethod
+    def decode_seed(seed:str, size:int=9) -> bytes:
+        '''
+        Method to convert a seed into the integer values of its cells in one operation.
+
+        Parameters:
+            - seed - seed made up of the seed representations of cell values
+            - size (optional) - largest cell value allowed in the seed (default is 9)
+
+        Returns:
+            - bytes holding the integer value of each character of the seed
+        '''
+
+        # Convert the seed to bytes, any character outside of the byte range is not valid
+        try:
+            characters = seed.encode("latin-1")
+        except (AttributeError, UnicodeEncodeError):
+            raise Exception("Invalid Seed")
+
+        # Check all the characters in the seed are valid (deleting the valid characters leaves nothing)
+        if characters.translate(None, SEED_CHARACTERS[:size + 1]):
+            raise Exception("Invalid Seed")
+
+        # Translate the seed characters to the integer values
+        return characters.translate(SEED_TO_VALUE)
+
+    @staticmethod
+    def encode_seed(values) -> str:
+        '''
+        Method to convert the integer values of cells into a seed in one operation.
+
+        Parameters:
+            - values - bytes like object of integer cell values (between 0 and MAX_VALUE)
+
+        Returns:
+            - seed made up of the seed representation of each value
+        '''
+
+        # Translate the integer values to the seed characters
+        return bytes(values).translate(VALUE_TO_SEED).decode("latin-1")
@@ -1,265 +1,238 @@
-import math
 import random
+from enum import Enum
 
 # Imports from other parts of the project
+from ..puzzle import Difficulty
 from .sudoku import Sudoku
-from .cell_value import Cell_Value
+from .grader import grade_puzzle
 
-def generate_easy(puzzle : Sudoku) -> Sudoku:
+class Symmetry(Enum):
+    '''
+    Enum Class to hold the symmetry of the pattern of the clues left in a puzzle.
+
+    Can have a value of none, rotational (180 degrees about the centre) or mirror (left to right).
+    '''
+
+    NONE = 0
+    ROTATIONAL = 1
+    MIRROR = 2
+
+    def __str__(self):
+        '''
+        Method to return the string representation of the symmetry.
+        '''
+
+        return str(self.name)
+
+    def orbit(self, index:int, size:int) -> tuple:
+        '''
+        Method to find the cells which must be removed together with a cell to keep the pattern symmetric.
+
+        Parameters:
+            - index - index of the cell in seed order
+            - size - number of rows, columns and boxes in the grid
+
+        Returns:
+            - tuple of the index of the cell and the index of its symmetric cell (if it is a different cell)
+        '''
+
+        column, row = divmod(index, size)
+
+        # Find the index of the symmetric cell
+        if self == Symmetry.ROTATIONAL:
+            other = (size - 1 - column) * size + (size - 1 - row)
+        elif self == Symmetry.MIRROR:
+            other = (size - 1 - column) * size + row
+        else:
+            other = index
+
+        return (index,) if other == index else (index, other)
+
+def generate_easy(puzzle : Sudoku, clues=None, symmetry=Symmetry.NONE) -> Sudoku:
     '''
     Method to remove cells in the puzzle to create an easy sudoku.
 
     Parameters:
         - puzzle - full sudoku to remove cells from
+        - clues (optional) - number of filled cells to stop removing cells at (default removes all it can)
+        - symmetry (optional) - symmetry of the pattern of the filled cells (Symmetry enum, default is none)
 
     Returns:
         - puzzle with cells removed to a difficulty level easy
     '''
 
-    # Remove direct, box, row and column inferable cell values
-    puzzle = __remove_direct_inference(puzzle)
-    puzzle = __remove_box_inference(puzzle)
-    puzzle = __remove_row_inference(puzzle)
-    puzzle = __remove_column_inference(puzzle)
+    # Remove every cell which can be inferred with singles
+    return __remove_cells(puzzle, Difficulty.EASY, clues, symmetry)
 
-    # Return the easy difficulty puzzle
-    return puzzle
-
-def generate_medium(puzzle : Sudoku) -> Sudoku:
+def generate_medium(puzzle : Sudoku, clues=None, symmetry=Symmetry.NONE) -> Sudoku:
     '''
     Method to remove cells in the puzzle to create an medium sudoku.
 
     Parameters:
         - puzzle - full sudoku to remove cells from
+        - clues (optional) - number of filled cells to stop removing cells at (default removes all it can)
+        - symmetry (optional) - symmetry of the pattern of the filled cells (Symmetry enum, default is none)
 
     Returns:
         - puzzle with cells removed to a difficulty level medium
     '''
 
-    # Remove the cells to create an easy difficulty puzzle
-    puzzle = generate_easy(puzzle)
-
-    # Return the medium difficulty puzzle
-    return puzzle
+    # Remove every cell which leaves a puzzle that can still be solved at the medium difficulty level
+    return __remove_cells(puzzle, Difficulty.MEDIUM, clues, symmetry)
 
-def generate_hard(puzzle : Sudoku) -> Sudoku:
+def generate_hard(puzzle : Sudoku, clues=None, symmetry=Symmetry.NONE) -> Sudoku:
     '''
     Method to remove cells in the puzzle to create an hard sudoku.
 
     Parameters:
         - puzzle - full sudoku to remove cells from
+        - clues (optional) - number of filled cells to stop removing cells at (default removes all it can)
+        - symmetry (optional) - symmetry of the pattern of the filled cells (Symmetry enum, default is none)
 
     Returns:
         - puzzle with cells removed to a difficulty level hard
     '''
 
-    # Remove the cells to create an medium difficulty puzzle
-    puzzle = generate_medium(puzzle)
-
-    # Return the hard difficulty puzzle
-    return puzzle
+    # Remove every cell which leaves a puzzle that can still be solved at the hard difficulty level
+    return __remove_cells(puzzle, Difficulty.HARD, clues, symmetry)
 
-def generate_extreme(puzzle : Sudoku) -> Sudoku:
+def generate_extreme(puzzle : Sudoku, clues=None, symmetry=Symmetry.NONE) -> Sudoku:
     '''
     Method to remove cells in the puzzle to create an extreme sudoku.
 
     Parameters:
         - puzzle - full sudoku to remove cells from
+        - clues (optional) - number of filled cells to stop removing cells at (default removes all it can)
+        - symmetry (optional) - symmetry of the pattern of the filled cells (Symmetry enum, default is none)
 
     Returns:
         - puzzle with cells removed to a difficulty level extreme
     '''
 
-    # Remove the cells to create an hard difficulty puzzle
-    puzzle = generate_hard(puzzle)
+    # Remove every cell which leaves a puzzle with a unique solution
+    return __remove_cells(puzzle, Difficulty.EXTREME, clues, symmetry)
 
-    # Return the extreme difficulty puzzle
-    return puzzle
-
-def __remove_direct_inference(puzzle : Sudoku) -> Sudoku:
+def __remove_cells(puzzle : Sudoku, difficulty : Difficulty, clues=None, symmetry=Symmetry.NONE) -> Sudoku:
     '''
-    Method to remove cells in the puzzle which can be directly inferred by looking at the row, column
-    and box the cell is situated in.
+    Method to remove cells from the puzzle for as long as the puzzle can still be solved at the difficulty
+    level. The cells are taken from a worklist in a random order, together with their symmetric cell, and
+    are removed if each value can be inferred with singles when it is removed (checked on the live unit
+    masks of the puzzle) or, above the easy level, if the puzzle is still graded at the difficulty level
+    without them. Puzzles solved with the techniques have a unique solution, and the extreme level checks
+    the solution is unique with a count of the solutions which stops at the second one. Cells which can
+    not be removed are put straight back.
+
+    Removing cells only ever adds options to the other cells, so cells which can not be removed never
+    become removable later. The worklist is therefore at a fixed point once every cell has been tried.
 
     Parameters:
         - puzzle - sudoku to remove cells from
+        - difficulty - hardest difficulty level the puzzle may be after cells are removed
+        - clues (optional) - number of filled cells to stop removing cells at (default removes all it can)
+        - symmetry (optional) - symmetry of the pattern of the filled cells (Symmetry enum, default is none)
 
     Returns:
-        - Sudoku with directly inferable cells removed
+        - Sudoku with the cells removed
     '''
 
-    # Get a shuffled list of all indices of cells in the sudoku
-    indices = list(range(81))
-    random.shuffle(indices)
+    # Check that the clues and symmetry are valid
+    layout = puzzle._get_layout()
+    if clues is not None and (type(clues) is not int or clues < 0 or clues > layout.cells):
+        raise Exception("Invalid Clues")
 
-    # Loop through each of the indices
-    for index in indices:
-        # Get the coordinates of the index
-        row = index % 9 + 1
-        column = int(index / 9) + 1
+    if type(symmetry) is not Symmetry:
+        raise Exception("Invalid Symmetry")
 
-        # Ignore the cell if it is already empty
-        if puzzle.get_value(column, row) == Cell_Value.EMPTY:
-            continue
-
-        # If there is only one option for cell value with can be directly inferred, remove the cell value
-        if len(puzzle.cell_options(column, row)) == 1:
-            puzzle.set_value(column, row, Cell_Value.EMPTY)
+    # Worklist of the groups of filled cells which are removed together, in a random order
+    filled = [index for index in range(layout.cells) if puzzle._get_cell(index) != 0]
+    worklist = list({min(symmetry.orbit(index, layout.size)) : symmetry.orbit(index, layout.size) for index in filled}.values())
+    random.shuffle(worklist)
 
-    # Return the puzzle without directly inferable cells
-    return puzzle
+    # Number of filled cells left in the puzzle
+    count = len(filled)
 
-def __remove_box_inference(puzzle : Sudoku) -> Sudoku:
-    '''
-    Method to remove cells in the puzzle which can be inferred by looking at options for each empty
-    cell in the box it is situated in. It only removes a cell if the only place in the box for the value is
-    the cell being looked at
+    while worklist:
+        orbit = worklist.pop()
 
-    Parameters:
-        - puzzle - sudoku to remove cells from
+        # Skip the cells if removing them would leave fewer clues than requested
+        if clues is not None and count - len(orbit) < clues:
+            continue
 
-    Returns:
-        - Sudoku with box inferable cells removed
-    '''
+        # Skip the cells if any were already empty (so the pattern stays symmetric)
+        if any(puzzle._get_cell(index) == 0 for index in orbit):
+            continue
 
-    # Get a shuffled list of all indices of cells in the sudoku
-    indices = list(range(81))
-    random.shuffle(indices)
+        removed = []
+        inferred = True
 
-    # Loop through all cells
-    for index in indices:
-        # Get the coordinates of the index
-        row = index % 9 + 1
-        column = int(index / 9) + 1
+        # Remove the cells one at a time, checking each can be inferred with singles once it is removed
+        for index in orbit:
+            removed += [(index, puzzle._get_cell(index))]
+            puzzle._set_cell(index, 0)
 
-        # Calculate the top left corner index of the box that contains the cell
-        box_row = math.floor((row-1)/3) * 3 + 1
-        box_column = math.floor((column-1)/3) * 3 + 1
+            if inferred and not __singles_inference(puzzle, index, removed[-1][1]):
+                inferred = False
 
-        # Ignore the cell if it is already empty
-        if puzzle.get_value(column, row) == Cell_Value.EMPTY:
+        # Keep the cells empty if they could be inferred, or if the puzzle is still solvable at the level
+        if inferred or (difficulty != Difficulty.EASY and __graded_inference(puzzle, difficulty)):
+            count -= len(orbit)
             continue
 
-        # Change the cell to be empty (temporary)
-        cell_value = puzzle.get_value(column, row)
-        puzzle.set_value(column, row, Cell_Value.EMPTY)
-
-        # Loop through cells in the box finding if there is an empty cell which could hold the value
-        for search_row in range(box_row, box_row + 3):
-            for search_column in range(box_column, box_column + 3):
-                # Skip if it is the current cell
-                if search_column == column and search_row == row:
-                    continue
-
-                # Skip if the cell is not empty
-                if puzzle.get_value(search_column, search_row) != Cell_Value.EMPTY:
-                    continue
-
-                # If the cell value is an option in this cell, it cannot be removed
-                if cell_value in puzzle.cell_options(search_column, search_row):
-                    puzzle.set_value(column, row, cell_value)
-                    break
-            else:
-                continue
-            break
-
-    # Return the puzzle without box inferable cells
+        # Otherwise put the values back into the cells
+        for index, value in removed:
+            puzzle._set_cell(index, value)
+
+    # Return the puzzle with the cells removed
     return puzzle
 
-def __remove_row_inference(puzzle : Sudoku) -> Sudoku:
+def __singles_inference(puzzle : Sudoku, index : int, value : int) -> bool:
     '''
-    Method to remove cells in the puzzle which can be inferred by looking at options for each empty
-    cell in the row it is situated in. It only removes a cell if the only place in the row for the value is
-    the cell being looked at
+    Method to check whether the value of an empty cell can be inferred directly (it is the only option for
+    the cell) or from its row, column or box (no other empty cell in the unit has the value as an option).
 
     Parameters:
-        - puzzle - sudoku to remove cells from
+        - puzzle - sudoku holding the cell
+        - index - index of the empty cell in seed order
+        - value - value the cell held
 
     Returns:
-        - Sudoku with row inferable cells removed
+        - whether the value can be inferred
     '''
 
-    # Get a shuffled list of all indices of cells in the sudoku
-    indices = list(range(81))
-    random.shuffle(indices)
-
-    # Loop through all cells
-    for index in indices:
-        # Get the coordinates of the index
-        row = index % 9 + 1
-        column = int(index / 9) + 1
-
-        # Ignore the cell if it is already empty
-        if puzzle.get_value(column, row) == Cell_Value.EMPTY:
-            continue
-
-        # Change the cell to be empty (temporary)
-        cell_value = puzzle.get_value(column, row)
-        puzzle.set_value(column, row, Cell_Value.EMPTY)
+    layout = puzzle._get_layout()
+    bit = 1 << value
 
-        # Loop through cells in the row finding if there is an empty cell which could hold the value
-        for search_column in range(1, 10):
-            # Skip if it is the current cell
-            if search_column == column:
-                continue
+    # Direct inference, the value is the only option for the cell
+    if puzzle._options_mask(index) == bit:
+        return True
 
-            # Skip if the cell is not empty
-            if puzzle.get_value(search_column, row) != Cell_Value.EMPTY:
-                continue
-
-            # If the cell value is an option in this cell, it cannot be removed
-            if cell_value in puzzle.cell_options(search_column, row):
-                puzzle.set_value(column, row, cell_value)
+    # Row, column and box inference, the cell is the only place in the unit for the value
+    for unit in layout.cell_units[index]:
+        for cell in layout.unit_cells[unit]:
+            if cell != index and puzzle._get_cell(cell) == 0 and puzzle._options_mask(cell) & bit:
                 break
+        else:
+            return True
 
-    # Return the puzzle without row inferable cells
-    return puzzle
+    return False
 
-def __remove_column_inference(puzzle : Sudoku) -> Sudoku:
+def __graded_inference(puzzle : Sudoku, difficulty : Difficulty) -> bool:
     '''
-    Method to remove cells in the puzzle which can be inferred by looking at options for each empty
-    cell in the column it is situated in. It only removes a cell if the only place in the column for the
-    value is the cell being looked at
+    Method to check whether a puzzle can still be solved with the techniques of the difficulty level. For
+    the extreme level the puzzle only needs to have a unique solution.
 
     Parameters:
-        - puzzle - sudoku to remove cells from
+        - puzzle - sudoku to check
+        - difficulty - hardest difficulty level the puzzle may be
 
     Returns:
-        - Sudoku with column inferable cells removed
+        - whether the puzzle can be solved at the difficulty level
     '''
 
-    # Get a shuffled list of all indices of cells in the sudoku
-    indices = list(range(81))
-    random.shuffle(indices)
-
-    # Loop through all cells
-    for index in indices:
-        # Get the coordinates of the index
-        row = index % 9 + 1
-        column = int(index / 9) + 1
-
-        # Ignore the cell if it is already empty
-        if puzzle.get_value(column, row) == Cell_Value.EMPTY:
-            continue
-
-        # Change the cell to be empty (temporary)
-        cell_value = puzzle.get_value(column, row)
-        puzzle.set_value(column, row, Cell_Value.EMPTY)
-
-        # Loop through cells in the column finding if there is an empty cell which could hold the value
-        for search_row in range(1, 10):
-            # Skip if it is the current cell
-            if search_row == row:
-                continue
-
-            # Skip if the cell is not empty
-            if puzzle.get_value(column, search_row) != Cell_Value.EMPTY:
-                continue
+    # A puzzle solved with the techniques has a unique solution, so only the extreme level needs to count
+    # the solutions
+    grade = grade_puzzle(puzzle, limit=min(difficulty, Difficulty.HARD, key=lambda level: level.value))[0]
+    if grade.value > difficulty.value:
+        return False
 
-            # If the cell value is an option in this cell, it cannot be removed
-            if cell_value in puzzle.cell_options(column, search_row):
-                puzzle.set_value(column, row, cell_value)
-                break
-
-    # Return the puzzle without column inferable cells
-    return puzzle
+    return grade != Difficulty.EXTREME or puzzle.count_solutions()[0] == 1
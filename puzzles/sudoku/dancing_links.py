@@ -0,0 +1,373 @@
+import math
+
+# Imports from other parts of the project
+from .sudoku import Sudoku
+from .cell_value import Cell_Value
+from .grid_layout import get_layout
+
+class Dancing_Links:
+    '''
+    Class to solve Sudoku grids as an exact cover problem using Knuth's Algorithm X with Dancing Links.
+
+    Each candidate (a value in a cell) covers four constraints: the cell is filled, and the value is placed
+    in the row, column and box of the cell.
+    '''
+
+    def __init__(self, puzzle=None, size:int=9):
+        '''
+        Method to create an instance of the solver.
+
+        Parameters:
+            - puzzle (optional) - sudoku (or seed of a sudoku) to be loaded in
+            - size (optional) - number of rows, columns and boxes of the grids to solve (default is 9)
+        '''
+
+        # Build the linked lists for the full exact cover matrix (with no cells given)
+        self.__build(get_layout(size))
+
+        # List of (cell index, value) pairs given in the loaded puzzle
+        self.__givens = []
+
+        # Load the puzzle if one is given
+        if puzzle is not None:
+            self.load(puzzle)
+
+    def __build(self, layout) -> None:
+        '''
+        Method to build the circular doubly linked lists of the exact cover matrix.
+
+        There is one constraint column for each cell being filled and one for each value in each unit (row,
+        column and box) being placed, and one candidate row for each value in each cell (row id = cell
+        index * size + value - 1). Node 0 is the root, nodes 1 to columns are the column headers (column c
+        has header node c + 1) and the four nodes of candidate row r are the nodes after the headers
+        starting at columns + 1 + 4r.
+
+        Parameters:
+            - layout - layout of the grids to solve
+        '''
+
+        size = layout.size
+        columns = layout.cells + layout.units * size
+        nodes = columns + 1 + layout.cells * size * 4
+
+        self.__layout = layout
+        self.__columns = columns
+
+        # Left, right, up and down links, the column header of each node and the candidate row of each node
+        self.__left = [0] * nodes
+        self.__right = [0] * nodes
+        self.__up = list(range(nodes))
+        self.__down = list(range(nodes))
+        self.__column = list(range(nodes))
+        self.__row = [-1] * nodes
+
+        # Number of nodes in each column
+        self.__size = [0] * (columns + 1)
+
+        # Link the root and the column headers into a circular list
+        for header in range(columns + 1):
+            self.__left[header] = header - 1 if header > 0 else columns
+            self.__right[header] = header + 1 if header < columns else 0
+
+        # Add the four nodes of each candidate row
+        node = columns + 1
+        for index in range(layout.cells):
+            for value in range(1, size + 1):
+                row = index * size + value - 1
+
+                # Header nodes of the cell constraint and the unit constraints covered by the candidate
+                headers = [index + 1] + [layout.cells + unit * size + value for unit in layout.cell_units[index]]
+
+                for position, header in enumerate(headers):
+                    current = node + position
+
+                    # Link the node into its row
+                    self.__left[current] = node + (position - 1) % 4
+                    self.__right[current] = node + (position + 1) % 4
+
+                    # Link the node to the bottom of its column
+                    self.__up[current] = self.__up[header]
+                    self.__down[current] = header
+                    self.__down[self.__up[header]] = current
+                    self.__up[header] = current
+
+                    self.__column[current] = header
+                    self.__row[current] = row
+                    self.__size[header] += 1
+
+                node += 4
+
+    def load(self, puzzle) -> None:
+        '''
+        Method to load the given cells of a sudoku into the solver.
+
+        Parameters:
+            - puzzle - sudoku (or seed of a sudoku) to be solved
+        '''
+
+        # Create a sudoku from the seed if a seed is given (the size of the grid is found from its length)
+        if type(puzzle) is str:
+            puzzle = Sudoku(puzzle, size=math.isqrt(len(puzzle)))
+        elif type(puzzle) is not Sudoku:
+            raise Exception("Invalid Puzzle")
+
+        # Rebuild the matrix if the puzzle is a different size to the current one
+        layout = puzzle._get_layout()
+        if layout is not self.__layout:
+            self.__build(layout)
+
+        # Store the values of all the filled cells
+        self.__givens = [(index, puzzle._get_cell(index)) for index in range(layout.cells) if puzzle._get_cell(index) != 0]
+
+    def solve(self):
+        '''
+        Method to find the first solution of the loaded sudoku.
+
+        Returns:
+            - seed of the solution, or None if the sudoku has no solution
+        '''
+
+        # Search for a single solution
+        solutions = self.__run(limit=1, store=True)
+
+        # Return the solution if one was found
+        return solutions[0] if len(solutions) > 0 else None
+
+    def solve_all(self, limit=None) -> list:
+        '''
+        Method to find all the solutions of the loaded sudoku.
+
+        Parameters:
+            - limit (optional) - maximum number of solutions to find (default finds all of them)
+
+        Returns:
+            - list of the seeds of the solutions found
+        '''
+
+        return self.__run(limit=limit, store=True)
+
+    def count_solutions(self, limit=None) -> int:
+        '''
+        Method to count the solutions of the loaded sudoku.
+
+        Parameters:
+            - limit (optional) - number of solutions after which to stop counting (default counts all)
+
+        Returns:
+            - number of solutions found
+        '''
+
+        return self.__run(limit=limit, store=False)
+
+    def __run(self, limit=None, store=True):
+        '''
+        Method to select the given cells and search for the solutions of the loaded sudoku, restoring the
+        matrix afterwards so the solver can be reused.
+
+        Parameters:
+            - limit (optional) - maximum number of solutions to find
+            - store - whether to store the seeds of the solutions found or only count them
+
+        Returns:
+            - list of the seeds of the solutions found if store is True, else the number of solutions
+        '''
+
+        # Check that the limit is valid
+        if limit is not None and (type(limit) is not int or limit < 1):
+            raise Exception("Invalid Limit")
+
+        self.__limit = limit
+        self.__store = store
+        self.__count = 0
+        self.__solutions = []
+        self.__chosen = []
+
+        # List of the nodes of the given rows which have been selected
+        selected = []
+
+        # Select the candidate row of each given cell, covering its columns
+        for index, value in self.__givens:
+            node = self.__columns + 1 + (index * self.__layout.size + value - 1) * 4
+
+            # If any of the columns is already covered, the given cells conflict so there are no solutions
+            if any(self.__right[self.__left[self.__column[node + position]]] != self.__column[node + position] for position in range(4)):
+                break
+
+            self.__select(node)
+            selected += [node]
+        else:
+            # If all the given cells could be selected, search for the solutions
+            self.__search()
+
+        # Deselect the given rows in reverse order to restore the matrix
+        for node in reversed(selected):
+            self.__deselect(node)
+
+        # Return either the seeds of the solutions or the number of solutions
+        return self.__solutions if store else self.__count
+
+    def __search(self) -> bool:
+        '''
+        Recursive method implementing Algorithm X, choosing the column with the fewest nodes at each step.
+
+        Returns:
+            - bool - whether the search should stop (the limit of solutions has been reached)
+        '''
+
+        right, down, size = self.__right, self.__down, self.__size
+
+        # Base Case - if all columns are covered a solution has been found
+        if right[0] == 0:
+            self.__count += 1
+
+            # Store the seed of the solution if requested
+            if self.__store:
+                self.__solutions += [self.__solution_seed()]
+
+            return self.__limit is not None and self.__count >= self.__limit
+
+        # Find the column with the fewest nodes
+        column = right[0]
+        best = column
+        while column != 0:
+            if size[column] < size[best]:
+                best = column
+                if size[best] <= 1: break
+            column = right[column]
+
+        # If the column has no nodes, the constraint can not be satisfied
+        if size[best] == 0:
+            return False
+
+        # Cover the column and try each of its rows in turn
+        self.__cover(best)
+
+        stop = False
+        node = down[best]
+        while node != best:
+            self.__chosen += [self.__row[node]]
+
+            # Cover the other columns of the row, search, then uncover them
+            other = right[node]
+            while other != node:
+                self.__cover(self.__column[other])
+                other = right[other]
+
+            stop = self.__search()
+
+            other = self.__left[node]
+            while other != node:
+                self.__uncover(self.__column[other])
+                other = self.__left[other]
+
+            self.__chosen.pop()
+
+            # Stop trying rows if the limit of solutions has been reached
+            if stop: break
+
+            node = down[node]
+
+        # Uncover the column to restore the matrix
+        self.__uncover(best)
+
+        return stop
+
+    def __select(self, node:int) -> None:
+        '''
+        Method to select a candidate row by covering all of its columns.
+
+        Parameters:
+            - node - any node of the candidate row
+        '''
+
+        self.__cover(self.__column[node])
+        other = self.__right[node]
+        while other != node:
+            self.__cover(self.__column[other])
+            other = self.__right[other]
+
+    def __deselect(self, node:int) -> None:
+        '''
+        Method to reverse the selection of a candidate row by uncovering all of its columns.
+
+        Parameters:
+            - node - the node of the candidate row which was used to select it
+        '''
+
+        other = self.__left[node]
+        while other != node:
+            self.__uncover(self.__column[other])
+            other = self.__left[other]
+        self.__uncover(self.__column[node])
+
+    def __cover(self, header:int) -> None:
+        '''
+        Method to cover a column, removing it from the header list and removing all rows which use it.
+
+        Parameters:
+            - header - header node of the column
+        '''
+
+        left, right, up, down, column, size = self.__left, self.__right, self.__up, self.__down, self.__column, self.__size
+
+        # Remove the column header from the header list
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+
+        # Remove every other node of each row in the column from its column
+        row = down[header]
+        while row != header:
+            node = right[row]
+            while node != row:
+                down[up[node]] = down[node]
+                up[down[node]] = up[node]
+                size[column[node]] -= 1
+                node = right[node]
+            row = down[row]
+
+    def __uncover(self, header:int) -> None:
+        '''
+        Method to uncover a column, exactly reversing the cover of the column.
+
+        Parameters:
+            - header - header node of the column
+        '''
+
+        left, right, up, down, column, size = self.__left, self.__right, self.__up, self.__down, self.__column, self.__size
+
+        # Put back every other node of each row in the column, in the reverse order to the cover
+        row = up[header]
+        while row != header:
+            node = left[row]
+            while node != row:
+                size[column[node]] += 1
+                down[up[node]] = node
+                up[down[node]] = node
+                node = left[node]
+            row = up[row]
+
+        # Put the column header back in the header list
+        right[left[header]] = header
+        left[right[header]] = header
+
+    def __solution_seed(self) -> str:
+        '''
+        Method to create the seed of the current solution from the given cells and the chosen rows.
+
+        Returns:
+            - seed of the solution
+        '''
+
+        size = self.__layout.size
+        values = bytearray(self.__layout.cells)
+
+        # Set the value of each given cell
+        for index, value in self.__givens:
+            values[index] = value
+
+        # Set the value of each cell chosen in the search
+        for row in self.__chosen:
+            values[row // size] = row % size + 1
+
+        # Return the seed of the values
+        return Cell_Value.encode_seed(values)
@@ -0,0 +1,114 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import random
+import os
+
+# Imports from other parts of the project
+from ..puzzle import Difficulty
+from .sudoku_puzzle import Sudoku_Puzzle
+from .create_difficulty import Symmetry
+
+# Number of puzzles each worker generates before returning them, so results are sent back in chunks
+CHUNK_SIZE = 8
+
+def generate_many(n:int, difficulty:Difficulty, workers:int=None, seed:int=None, size:int=9, clues:int=None,
+                  symmetry:Symmetry=Symmetry.NONE, chunk_size:int=CHUNK_SIZE, scores:bool=False):
+    '''
+    Generator to create many sudoku puzzles in parallel over a pool of worker processes. The puzzles are
+    split into chunks, each chunk is generated by one worker with the random number generator seeded from
+    the run seed and the chunk number, so a run with the same seed and chunk size creates the same puzzles
+    however many workers are used (the order chunks complete in can differ).
+
+    Parameters:
+        - n - number of puzzles to generate
+        - difficulty - the level of difficulty the generated puzzles should have (Difficulty enum)
+        - workers (optional) - number of worker processes (default is the number of cores)
+        - seed (optional) - integer seed for the random number generators (default is a random seed)
+        - size (optional) - the number of rows, columns and boxes in the grids (default is 9)
+        - clues (optional) - the number of filled cells the puzzles should have (default is as few as the
+          difficulty level allows)
+        - symmetry (optional) - the symmetry of the pattern of filled cells (Symmetry enum, default is none)
+        - chunk_size (optional) - number of puzzles generated by a worker at a time (default is 8)
+        - scores (optional) - boolean indicating whether to add the grader score of each puzzle to its
+          record, as graded by the worker (default is False)
+
+    Yields:
+        - (puzzle seed, solution seed, difficulty) of each puzzle as its chunk completes, followed by the
+          score of the puzzle if scores is True
+    '''
+
+    # Check the inputs are valid
+    if type(n) is not int or n < 0:
+        raise Exception("Invalid Number")
+
+    if type(difficulty) is not Difficulty or difficulty == Difficulty.UNDEFINED:
+        raise Exception("Invalid Difficulty")
+
+    if workers is not None and (type(workers) is not int or workers < 1):
+        raise Exception("Invalid Workers")
+
+    if seed is not None and type(seed) is not int:
+        raise Exception("Invalid Seed")
+
+    if type(chunk_size) is not int or chunk_size < 1:
+        raise Exception("Invalid Chunk Size")
+
+    if type(scores) is not bool:
+        raise Exception("Invalid Scores")
+
+    # Pick a seed for the run if one is not given
+    if seed is None:
+        seed = random.getrandbits(64)
+
+    # Start and number of puzzles of each chunk
+    chunks = [(start // chunk_size, min(chunk_size, n - start)) for start in range(0, n, chunk_size)]
+    if len(chunks) == 0:
+        return
+
+    # Submit every chunk to the pool, yielding the puzzles of each chunk as soon as it completes
+    executor = ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(chunks)))
+    try:
+        futures = [executor.submit(generate_chunk, seed, chunk, count, difficulty, size, clues, symmetry, scores)
+                   for chunk, count in chunks]
+
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        # Stop any chunks which have not started (if the generator is closed early)
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def generate_chunk(seed:int, chunk:int, count:int, difficulty:Difficulty, size:int, clues:int,
+                     symmetry:Symmetry, scores:bool) -> list:
+    '''
+    Method to generate a chunk of puzzles in a worker process.
+
+    Parameters:
+        - seed - integer seed of the run
+        - chunk - number of the chunk in the run
+        - count - number of puzzles in the chunk
+        - difficulty - the level of difficulty the generated puzzles should have (Difficulty enum)
+        - size - the number of rows, columns and boxes in the grids
+        - clues - the number of filled cells the puzzles should have (None for as few as possible)
+        - symmetry - the symmetry of the pattern of filled cells (Symmetry enum)
+        - scores - boolean indicating whether to add the grader score of each puzzle to its record
+
+    Returns:
+        - list of (puzzle seed, solution seed, difficulty) of each puzzle generated, followed by the score
+          of the puzzle if scores is True
+    '''
+
+    # Seed the random number generator from the run and chunk, so the chunk does not depend on the worker
+    # (or on the state copied from the parent process)
+    random.seed("{}:{}".format(seed, chunk))
+
+    # Generate the puzzles of the chunk
+    records = list()
+    for _ in range(count):
+        puzzle = Sudoku_Puzzle()
+        puzzle.generate(difficulty, size=size, clues=clues, symmetry=symmetry)
+        record = (puzzle.get_puzzle_seed(), puzzle.get_solution_seed(), puzzle.get_difficulty())
+
+        # Add the score the puzzle was graded with while it was generated, so it is not graded again
+        records += [record + (puzzle.get_grade()[2],) if scores else record]
+
+    # Return the puzzles of the chunk
+    return records
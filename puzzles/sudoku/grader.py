@@ -0,0 +1,79 @@
+# Imports from other parts of the project
+from ..puzzle import Difficulty
+from .sudoku import Sudoku
+from .propagation import Candidate_Grid, Technique
+
+# Difficulty level of the puzzles needing each technique
+TECHNIQUE_DIFFICULTY = {
+    Technique.NAKED_SINGLE : Difficulty.EASY,
+    Technique.HIDDEN_SINGLE : Difficulty.EASY,
+    Technique.POINTING : Difficulty.MEDIUM,
+    Technique.NAKED_PAIR : Difficulty.HARD,
+    Technique.HIDDEN_PAIR : Difficulty.HARD
+}
+
+# Score added each time a technique is used
+TECHNIQUE_SCORES = {
+    Technique.NAKED_SINGLE : 1,
+    Technique.HIDDEN_SINGLE : 2,
+    Technique.POINTING : 10,
+    Technique.NAKED_PAIR : 15,
+    Technique.HIDDEN_PAIR : 25
+}
+
+# Score added for each cell which can not be found with the techniques (and so needs guessing)
+SEARCH_SCORE = 100
+
+def grade_puzzle(puzzle : Sudoku, limit=None) -> tuple:
+    '''
+    Method to grade a puzzle by solving it with only the techniques a person would use, always applying the
+    cheapest technique that makes progress. Puzzles which can not be solved with the techniques (so need
+    guessing) are extreme.
+
+    Parameters:
+        - puzzle - sudoku puzzle to grade (with a unique solution)
+        - limit (optional) - Difficulty after which to stop grading, only using the techniques of the levels
+          up to the limit (default grades the puzzle fully)
+
+    Returns:
+        - Difficulty of the puzzle (if the limit is exceeded, the level above the limit)
+        - hardest technique used (None if no cells were found)
+        - score of the puzzle, the sum of the scores of the techniques used
+    '''
+
+    # Check that the puzzle and limit are valid
+    if type(puzzle) is not Sudoku:
+        raise Exception("Invalid Puzzle")
+
+    if limit is not None and (type(limit) is not Difficulty or limit == Difficulty.UNDEFINED):
+        raise Exception("Invalid Limit")
+
+    # Only use the techniques of the levels up to the limit
+    techniques = [technique for technique in Technique if limit is None or TECHNIQUE_DIFFICULTY[technique].value <= limit.value]
+
+    # Create the candidates of the puzzle and solve as much of it as possible with the techniques
+    layout = puzzle._get_layout()
+    grid = Candidate_Grid(layout.size)
+    counts = {}
+
+    if not grid.load([puzzle._get_cell(index) for index in range(layout.cells)]) or not grid.propagate(techniques, counts):
+        raise Exception("Invalid Puzzle")
+
+    # Find the hardest technique used and the score of the techniques
+    technique = max(counts, key=lambda technique: technique.value) if counts else None
+    score = sum(TECHNIQUE_SCORES[technique] * count for technique, count in counts.items())
+
+    # If the puzzle was solved, the difficulty is the level of the hardest technique
+    if grid.solved():
+        difficulty = TECHNIQUE_DIFFICULTY[technique] if technique is not None else Difficulty.EASY
+        return difficulty, technique, score
+
+    # If the techniques were limited, the puzzle is harder than the limit
+    if limit is not None and limit != Difficulty.EXTREME:
+        return Difficulty(limit.value + 1), technique, score
+
+    # The remaining cells need guessing, which is only a fair puzzle if there is a single solution
+    if puzzle.count_solutions()[0] != 1:
+        raise Exception("Puzzle does not have a unique solution")
+
+    return Difficulty.EXTREME, technique, score + SEARCH_SCORE * grid.values.count(0)
@@ -0,0 +1,136 @@
+import math
+
+# Smallest and largest supported grid sizes (the seed alphabet runs from "d" for empty up to "}" for 25)
+MIN_SIZE = 4
+MAX_SIZE = 25
+
+# Largest number of bits in a mask for which the mask lookup tables are fully precomputed
+MAX_TABLE_BITS = 13
+
+# Cache of the layout of each grid size
+layouts = {}
+
+class Mask_Table:
+    '''
+    Class to look up a value for a bit mask by computing it, used in place of a list when a full lookup
+    table would be too large.
+    '''
+
+    __slots__ = ("__function",)
+
+    def __init__(self, function):
+        '''
+        Method to create a mask table.
+
+        Parameters:
+            - function - function computing the value of a bit mask
+        '''
+
+        self.__function = function
+
+    def __getitem__(self, mask:int):
+        '''
+        Method to return the value of a bit mask.
+        '''
+
+        return self.__function(mask)
+
+class Grid_Layout:
+    '''
+    Class to hold the precomputed tables describing the cells and units of a Sudoku grid of a given size.
+
+    Cells are numbered in seed order, index = (column - 1) * size + (row - 1). Units are numbered with the
+    rows first, then the columns, then the boxes. Boxes are box_height rows tall and box_width columns wide.
+    '''
+
+    def __init__(self, size:int):
+        '''
+        Method to create the layout of a grid size.
+
+        Parameters:
+            - size - number of rows, columns and boxes in the grid (and the largest cell value)
+        '''
+
+        # Check that the size is valid
+        if type(size) is not int or size < MIN_SIZE or size > MAX_SIZE:
+            raise Exception("Invalid Size")
+
+        # The box height is the largest divisor of the size which is not larger than its square root
+        box_height = max(divisor for divisor in range(1, math.isqrt(size) + 1) if size % divisor == 0)
+
+        # Boxes must have more than one row (the size must not be prime)
+        if box_height == 1:
+            raise Exception("Invalid Size")
+
+        self.size = size
+        self.box_height = box_height
+        self.box_width = size // box_height
+        self.cells = size * size
+        self.units = size * 3
+
+        # Bit mask with a bit set for every cell value (bit n represents value n)
+        self.full_mask = ((1 << size) - 1) << 1
+
+        # Row, column and box unit of each cell
+        self.cell_units = tuple((index % size,
+                                 size + index // size,
+                                 size * 2 + (index % size // box_height) * box_height + index // size // self.box_width)
+                                for index in range(self.cells))
+
+        # Indices of the cells in each unit
+        self.unit_cells = tuple(tuple(index for index in range(self.cells) if unit in self.cell_units[index])
+                                for unit in range(self.units))
+
+        # Indices of the other cells sharing a row, column or box with each cell
+        self.cell_peers = tuple(tuple(sorted(set(cell for unit in self.cell_units[index] for cell in self.unit_cells[unit]) - {index}))
+                                for index in range(self.cells))
+
+        # Bit mask of the units of each cell (bit n represents unit n)
+        self.cell_unit_bits = tuple(sum(1 << unit for unit in units) for units in self.cell_units)
+
+        # Intersections of each box with the rows and columns crossing it, as (cells in both units, cells
+        # only in the box, cells only in the row or column, bit mask of the two units)
+        self.intersections = tuple((tuple(sorted(set(self.unit_cells[box]) & set(self.unit_cells[line]))),
+                                    tuple(sorted(set(self.unit_cells[box]) - set(self.unit_cells[line]))),
+                                    tuple(sorted(set(self.unit_cells[line]) - set(self.unit_cells[box]))),
+                                    (1 << box) | (1 << line))
+                                   for box in range(size * 2, self.units) for line in range(size * 2)
+                                   if set(self.unit_cells[box]) & set(self.unit_cells[line]))
+
+        # Lookup tables from a bit mask of values to the number of values and the list of integer values
+        self.mask_sizes = self.__mask_table(lambda mask: bin(mask).count("1"))
+        self.mask_values = self.__mask_table(lambda mask: [value for value in range(1, size + 1) if mask & (1 << value)])
+
+    def __mask_table(self, function):
+        '''
+        Method to create a lookup table from every bit mask of values, precomputed if it is small enough.
+
+        Parameters:
+            - function - function computing the value of a bit mask
+
+        Returns:
+            - list or Mask_Table of the value of each mask
+        '''
+
+        if self.size + 1 <= MAX_TABLE_BITS:
+            return [function(mask) for mask in range(1 << (self.size + 1))]
+
+        return Mask_Table(function)
+
+def get_layout(size:int) -> Grid_Layout:
+    '''
+    Method to get the layout of a grid size, creating it the first time the size is used.
+
+    Parameters:
+        - size - number of rows, columns and boxes in the grid
+
+    Returns:
+        - layout of the grid size
+    '''
+
+    # Create the layout if the size has not been used before (checking the size is an integer first so
+    # that values such as True or 9.0 are not matched to a cached size)
+    if type(size) is not int or size not in layouts:
+        layouts[size] = Grid_Layout(size)
+
+    return layouts[size]
@@ -0,0 +1,434 @@
+import struct
+import mmap
+import zlib
+
+# Imports from other parts of the project
+from .cell_value import Cell_Value
+from .grid_layout import get_layout
+
+# Header of a packed seed file (identifier, version, grid size, record size, records in each checksum block
+# with zero for no checksums, and number of records)
+PACKED_HEADER = struct.Struct("<8sHHHHQ")
+PACKED_IDENTIFIER = b"SUDOKUPS"
+PACKED_VERSION = 1
+
+# Checksum stored after each block of records
+PACKED_CHECKSUM = struct.Struct("<I")
+
+# Default number of records in each checksum block
+BLOCK_RECORDS = 1024
+
+# Digits of each base up to 36, used to convert seeds to and from integers
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+# Cache of the packing tables of each grid size
+packings = {}
+
+def get_packing(size:int=9) -> tuple:
+    '''
+    Method to get the tables used to pack and unpack the seeds of a grid size, creating them the first time
+    the size is used.
+
+    Parameters:
+        - size (optional) - the number of rows, columns and boxes in the grid (default is 9)
+
+    Returns:
+        - number of bytes in each packed seed
+        - number of cells in the grid
+        - number of different seeds of the grid (packed seeds are smaller than this)
+        - translation table from the characters of a seed to digits in base size + 1
+        - translation table from digits in base size + 1 to the characters of a seed
+    '''
+
+    # Create the tables of a new size (getting the layout checks the size is valid)
+    if type(size) is not int or size not in packings:
+        layout = get_layout(size)
+        characters = Cell_Value.encode_seed(bytes(range(size + 1)))
+
+        # A seed is packed as a single integer with a digit in base size + 1 for each cell
+        limit = (size + 1) ** layout.cells
+        packings[size] = (((limit - 1).bit_length() + 7) // 8, layout.cells, limit,
+                          str.maketrans(characters, DIGITS[:size + 1]), str.maketrans(DIGITS[:size + 1], characters))
+
+    return packings[size]
+
+def record_size(size:int=9) -> int:
+    '''
+    Method to find the number of bytes of a packed seed of a grid size. A seed is packed as a single
+    integer with a digit in base size + 1 for each cell, so a 9 x 9 seed takes 34 bytes.
+
+    Parameters:
+        - size (optional) - the number of rows, columns and boxes in the grid (default is 9)
+
+    Returns:
+        - number of bytes in each packed seed
+    '''
+
+    return get_packing(size)[0]
+
+def pack_seed(seed:str, size:int=9) -> bytes:
+    '''
+    Method to pack a seed of a complete or partial grid into bytes.
+
+    Parameters:
+        - seed - seed of the grid
+        - size (optional) - the number of rows, columns and boxes in the grid (default is 9)
+
+    Returns:
+        - the packed seed
+    '''
+
+    size_bytes, cells, _, to_digits, _ = get_packing(size)
+
+    # Check the seed is the right length (decoding checks the values are in the grid size)
+    if type(seed) is not str or len(seed) != cells:
+        raise Exception("Invalid Seed")
+    Cell_Value.decode_seed(seed, size)
+
+    # Read the seed as the digits of an integer, the first cell being the most significant digit
+    return int(seed.translate(to_digits), size + 1).to_bytes(size_bytes, "big")
+
+def unpack_seed(data:bytes, size:int=9) -> str:
+    '''
+    Method to unpack a packed seed.
+
+    Parameters:
+        - data - the packed seed
+        - size (optional) - the number of rows, columns and boxes in the grid (default is 9)
+
+    Returns:
+        - seed of the grid
+    '''
+
+    size_bytes, cells, limit, _, from_digits = get_packing(size)
+    number = int.from_bytes(data, "big")
+
+    # Check the data is a packed seed of the grid size
+    if len(data) != size_bytes or number >= limit:
+        raise Exception("Invalid Packed Seed")
+
+    # Write the integer in base size + 1 (directly for base ten), one digit for each cell
+    if size + 1 == 10:
+        digits = str(number).zfill(cells)
+    else:
+        digits = list()
+        for _ in range(cells):
+            number, digit = divmod(number, size + 1)
+            digits += [DIGITS[digit]]
+        digits = "".join(reversed(digits))
+
+    return digits.translate(from_digits)
+
+class Packed_Seed_Writer:
+    '''
+    Class to write seeds to a packed seed file as a stream. The file has a header, then the packed seeds
+    as fixed size records in blocks, each block followed by a checksum of its records (if enabled). The
+    number of records in the header is written when the writer is closed.
+    '''
+
+    def __init__(self, file_path:str, size:int=9, block_records:int=BLOCK_RECORDS, checksums:bool=True):
+        '''
+        Method to create a packed seed file, replacing any file at the path.
+
+        Parameters:
+            - file_path - path of the packed seed file
+            - size (optional) - the number of rows, columns and boxes in the grids (default is 9)
+            - block_records (optional) - number of records in each checksum block (default is 1024)
+            - checksums (optional) - boolean indicating whether to write a checksum after each block
+              (default is True)
+        '''
+
+        # Check the block size is valid (the grid size is checked by finding the record size)
+        if type(block_records) is not int or block_records < 1 or block_records > 0xFFFF:
+            raise Exception("Invalid Block Records")
+
+        if type(checksums) is not bool:
+            raise Exception("Invalid Checksums")
+
+        self.__size = size
+        self.__record_size = record_size(size)
+        self.__block_records = block_records if checksums else 0
+        self.__count = 0
+
+        # Records of the current block and the running checksum of the block
+        self.__block = 0
+        self.__checksum = 0
+
+        # Write the header with no records, it is rewritten when the file is closed
+        self.__file = open(file_path, "wb")
+        self.__write_header()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def write(self, seed:str) -> None:
+        '''
+        Method to write a seed to the end of the file.
+
+        Parameters:
+            - seed - seed of a complete or partial grid of the file's size
+        '''
+
+        record = pack_seed(seed, self.__size)
+        self.__file.write(record)
+        self.__count += 1
+
+        # Write the checksum of the block once it is full
+        if self.__block_records > 0:
+            self.__checksum = zlib.crc32(record, self.__checksum)
+            self.__block += 1
+            if self.__block == self.__block_records:
+                self.__end_block()
+
+    def write_many(self, seeds) -> int:
+        '''
+        Method to write many seeds to the end of the file.
+
+        Parameters:
+            - seeds - iterable of seeds of complete or partial grids of the file's size
+
+        Returns:
+            - number of seeds written
+        '''
+
+        count = self.__count
+        for seed in seeds:
+            self.write(seed)
+
+        return self.__count - count
+
+    def close(self) -> None:
+        '''
+        Method to finish the file, writing the checksum of the last block and the number of records.
+        '''
+
+        if self.__file is None:
+            return
+
+        if self.__block > 0:
+            self.__end_block()
+
+        self.__file.seek(0)
+        self.__write_header()
+        self.__file.close()
+        self.__file = None
+
+    def __end_block(self) -> None:
+        '''
+        Method to write the checksum of the current block and start a new block.
+        '''
+
+        self.__file.write(PACKED_CHECKSUM.pack(self.__checksum))
+        self.__block = 0
+        self.__checksum = 0
+
+    def __write_header(self) -> None:
+        '''
+        Method to write the header of the file at the current position.
+        '''
+
+        self.__file.write(PACKED_HEADER.pack(PACKED_IDENTIFIER, PACKED_VERSION, self.__size, self.__record_size,
+                                             self.__block_records, self.__count))
+
+class Packed_Seed_Reader:
+    '''
+    Class to read seeds from a packed seed file, either by index or as a stream. The file is memory
+    mapped and every record is a fixed size, so reading a seed by index takes the same time however many
+    seeds are in the file.
+    '''
+
+    def __init__(self, file_path:str, verify:bool=False):
+        '''
+        Method to open a packed seed file.
+
+        Parameters:
+            - file_path - path of the packed seed file
+            - verify (optional) - boolean indicating whether to check the checksum of each block the first
+              time a seed in it is read (default is False)
+        '''
+
+        if type(verify) is not bool:
+            raise Exception("Invalid Verify")
+
+        self.__file = open(file_path, "rb")
+        try:
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            identifier, version, self.__size, self.__record_size, self.__block_records, self.__count = \
+                PACKED_HEADER.unpack_from(self.__map)
+        except (ValueError, struct.error):
+            self.__file.close()
+            raise Exception("Invalid Seed File")
+
+        # Check the header matches the file
+        try:
+            valid = identifier == PACKED_IDENTIFIER and version == PACKED_VERSION and self.__record_size == record_size(self.__size)
+        except Exception:
+            valid = False
+
+        if not valid or len(self.__map) != PACKED_HEADER.size + self.__count * self.__record_size + self.__checksum_size(self.__count):
+            self.close()
+            raise Exception("Invalid Seed File")
+
+        self.__verify = verify
+        self.__verified = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __getitem__(self, index:int) -> str:
+        '''
+        Method to read the seed at an index of the file.
+
+        Parameters:
+            - index - index of the seed
+
+        Returns:
+            - seed of the grid
+        '''
+
+        if type(index) is not int or index < 0 or index >= self.__count:
+            raise Exception("Invalid Index")
+
+        if self.__verify and self.__block_records > 0 and index // self.__block_records not in self.__verified:
+            if not self.__check_block(index // self.__block_records):
+                raise Exception("Invalid Checksum")
+            self.__verified.add(index // self.__block_records)
+
+        offset = self.__offset(index)
+        return unpack_seed(self.__map[offset:offset + self.__record_size], self.__size)
+
+    def __iter__(self):
+        '''
+        Generator to read the seeds of the file in order.
+        '''
+
+        for index in range(self.__count):
+            yield self[index]
+
+    def get_size(self) -> int:
+        '''
+        Method to get the grid size of the seeds in the file.
+
+        Returns:
+            - the number of rows, columns and boxes in the grids
+        '''
+
+        return self.__size
+
+    def verify(self) -> bool:
+        '''
+        Method to check the checksums of every block in the file.
+
+        Returns:
+            - boolean indicating whether every block matches its checksum (True if there are no checksums)
+        '''
+
+        if self.__block_records == 0:
+            return True
+
+        return all(self.__check_block(block) for block in range(-(-self.__count // self.__block_records)))
+
+    def close(self) -> None:
+        '''
+        Method to close the file.
+        '''
+
+        if self.__file is not None:
+            self.__map.close()
+            self.__file.close()
+            self.__file = None
+
+    def __offset(self, index:int) -> int:
+        '''
+        Method to find the position of a record in the file, after the header and the checksums of the
+        blocks before it.
+
+        Parameters:
+            - index - index of the record
+
+        Returns:
+            - the position of the record in bytes
+        '''
+
+        return PACKED_HEADER.size + index * self.__record_size + self.__checksum_size(index - index % self.__block_records if self.__block_records > 0 else 0)
+
+    def __checksum_size(self, count:int) -> int:
+        '''
+        Method to find the number of bytes of the checksums of the blocks holding a number of records.
+
+        Parameters:
+            - count - number of records
+
+        Returns:
+            - the number of bytes of the checksums
+        '''
+
+        if self.__block_records == 0:
+            return 0
+
+        return -(-count // self.__block_records) * PACKED_CHECKSUM.size
+
+    def __check_block(self, block:int) -> bool:
+        '''
+        Method to check the records of a block match its checksum.
+
+        Parameters:
+            - block - number of the block
+
+        Returns:
+            - boolean indicating whether the block matches its checksum
+        '''
+
+        start = self.__offset(block * self.__block_records)
+        end = start + min(self.__block_records, self.__count - block * self.__block_records) * self.__record_size
+
+        return zlib.crc32(self.__map[start:end]) == PACKED_CHECKSUM.unpack_from(self.__map, end)[0]
+
+def text_to_packed(text_path:str, packed_path:str, size:int=9, block_records:int=BLOCK_RECORDS, checksums:bool=True) -> int:
+    '''
+    Method to convert a text seed file (one seed on each line) into a packed seed file.
+
+    Parameters:
+        - text_path - path of the text seed file
+        - packed_path - path of the packed seed file to create
+        - size (optional) - the number of rows, columns and boxes in the grids (default is 9)
+        - block_records (optional) - number of records in each checksum block (default is 1024)
+        - checksums (optional) - boolean indicating whether to write a checksum after each block
+          (default is True)
+
+    Returns:
+        - number of seeds converted
+    '''
+
+    with open(text_path, "r") as text, Packed_Seed_Writer(packed_path, size, block_records, checksums) as writer:
+        return writer.write_many(line.strip() for line in text if line.strip() != "")
+
+def packed_to_text(packed_path:str, text_path:str) -> int:
+    '''
+    Method to convert a packed seed file into a text seed file (one seed on each line).
+
+    Parameters:
+        - packed_path - path of the packed seed file
+        - text_path - path of the text seed file to create
+
+    Returns:
+        - number of seeds converted
+    '''
+
+    with Packed_Seed_Reader(packed_path) as reader, open(text_path, "w", newline="\n") as text:
+        for seed in reader:
+            text.write(seed + "\n")
+
+        return len(reader)
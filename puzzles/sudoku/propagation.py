@@ -0,0 +1,463 @@
+from enum import Enum
+
+# Imports from other parts of the project
+from .grid_layout import get_layout
+
+class Technique(Enum):
+    '''
+    Enum class for the logical techniques used to remove candidates, in the order they are applied (from
+    the cheapest to the most expensive for a person to spot).
+    '''
+
+    NAKED_SINGLE = 1
+    HIDDEN_SINGLE = 2
+    POINTING = 3
+    NAKED_PAIR = 4
+    HIDDEN_PAIR = 5
+
+    def __str__(self):
+        '''
+        Method to return the string representation of the technique.
+        '''
+
+        return self.name.replace("_", " ").title()
+
+class Contradiction(Exception):
+    '''
+    Exception raised when removing candidates leaves a cell or a value in a unit with no options.
+    '''
+
+class Candidate_Grid:
+    '''
+    Class to hold the candidate values of every cell of a Sudoku grid as bit masks (bit n represents value
+    n) and remove candidates with logical techniques.
+
+    Filled cells hold a mask of their single value. Every assignment removes the value from the peers of
+    the cell, and propagate applies the techniques until none of them removes any more candidates. Each
+    technique only rescans the units with candidates changed since it last scanned them.
+    '''
+
+    __slots__ = ("layout", "values", "masks", "__pending", "__changed", "__stale")
+
+    def __init__(self, size:int=9):
+        '''
+        Method to create a candidate grid with every value possible in every cell.
+
+        Parameters:
+            - size (optional) - number of rows, columns and boxes in the grid (default is 9)
+        '''
+
+        self.layout = get_layout(size)
+
+        # Value of each cell (0 for unfilled cells) and the bit mask of the candidates of each cell
+        self.values = bytearray(self.layout.cells)
+        self.masks = [self.layout.full_mask] * self.layout.cells
+
+        # Cells which have been left with a single candidate but are not filled yet
+        self.__pending = []
+
+        # Bit mask of the units with candidates changed since the last technique was applied, and the bit
+        # mask of the units each technique has still to scan (bit n represents unit n)
+        self.__changed = 0
+        self.__stale = [(1 << self.layout.units) - 1] * len(Technique)
+
+    def load(self, values) -> bool:
+        '''
+        Method to fill in the given cells of a grid and remove their values from the candidates of their
+        peers. No other techniques are applied.
+
+        Parameters:
+            - values - integer value of each cell in seed order (0 for empty cells)
+
+        Returns:
+            - False if the given cells contradict each other, else True
+        '''
+
+        # Assign the value of each filled cell
+        try:
+            for index, value in enumerate(values):
+                if value != 0:
+                    self.assign(index, value)
+        except Contradiction:
+            return False
+
+        return True
+
+    def copy(self):
+        '''
+        Method to create a copy of the candidate grid.
+
+        Returns:
+            - new candidate grid holding the same values and candidates
+        '''
+
+        grid = Candidate_Grid.__new__(Candidate_Grid)
+        grid.layout = self.layout
+        grid.values = self.values[:]
+        grid.masks = self.masks[:]
+        grid.__pending = self.__pending[:]
+        grid.__changed = self.__changed
+        grid.__stale = self.__stale[:]
+
+        return grid
+
+    def solved(self) -> bool:
+        '''
+        Method to check whether every cell has been filled.
+        '''
+
+        return 0 not in self.values
+
+    def assign(self, index:int, value:int) -> None:
+        '''
+        Method to fill a cell with a value and remove the value from the candidates of its peers.
+
+        Parameters:
+            - index - index of the cell in seed order
+            - value - integer value to fill the cell with
+
+        Raises:
+            - Contradiction - if the value is not a candidate of the cell or a peer is left with no candidates
+        '''
+
+        bit = 1 << value
+        masks, pending = self.masks, self.__pending
+        cell_unit_bits = self.layout.cell_unit_bits
+
+        # The value must still be a candidate of the cell
+        if not masks[index] & bit:
+            raise Contradiction()
+
+        self.values[index] = value
+        masks[index] = bit
+        changed = cell_unit_bits[index]
+
+        # Remove the value from the candidates of every peer
+        for peer in self.layout.cell_peers[index]:
+            mask = masks[peer]
+            if mask & bit:
+                mask ^= bit
+
+                # A peer with no candidates left can not be filled
+                if mask == 0:
+                    raise Contradiction()
+
+                masks[peer] = mask
+                changed |= cell_unit_bits[peer]
+
+                # A peer with a single candidate left is filled by the naked singles step
+                if mask & (mask - 1) == 0:
+                    pending.append(peer)
+
+        self.__changed |= changed
+
+    def eliminate(self, index:int, bits:int) -> bool:
+        '''
+        Method to remove candidates from an unfilled cell.
+
+        Parameters:
+            - index - index of the cell in seed order
+            - bits - bit mask of the values to remove
+
+        Returns:
+            - whether any candidates were removed
+
+        Raises:
+            - Contradiction - if the cell is left with no candidates
+        '''
+
+        mask = self.masks[index]
+
+        # Ignore the cell if none of the values are candidates
+        if not mask & bits:
+            return False
+
+        mask &= ~bits
+        if mask == 0:
+            raise Contradiction()
+
+        self.masks[index] = mask
+        self.__changed |= self.layout.cell_unit_bits[index]
+
+        # A cell with a single candidate left is filled by the naked singles step
+        if mask & (mask - 1) == 0:
+            self.__pending.append(index)
+
+        return True
+
+    def propagate(self, techniques=None, counts=None) -> bool:
+        '''
+        Method to apply the techniques to a fixed point. Singles are applied first, and the more expensive
+        techniques are only tried once no more singles can be found.
+
+        Parameters:
+            - techniques (optional) - collection of the techniques allowed (default allows all of them)
+            - counts (optional) - dictionary of technique to the number of times it was used, updated in place
+
+        Returns:
+            - False if a contradiction was found (the grid has no solutions), else True
+        '''
+
+        # The naked singles step runs whenever a cell is left with one candidate, others in ladder order
+        steps = [(Technique.HIDDEN_SINGLE, self.__hidden_singles),
+                 (Technique.POINTING, self.__pointing),
+                 (Technique.NAKED_PAIR, self.__naked_pairs),
+                 (Technique.HIDDEN_PAIR, self.__hidden_pairs)]
+
+        naked_singles = True
+        if techniques is not None:
+            naked_singles = Technique.NAKED_SINGLE in techniques
+            steps = [(technique, step) for technique, step in steps if technique in techniques]
+
+        # Position of each technique in the list of stale units
+        steps = [(technique.value - 1, technique, step) for technique, step in steps]
+        stale = self.__stale
+
+        try:
+            while True:
+                # Fill the cells with a single candidate left
+                if naked_singles:
+                    self.__naked_singles(counts)
+
+                # Apply the first technique that removes any candidates, then start again from the singles
+                for position, technique, step in steps:
+                    # Mark the units changed since the last technique as stale for every technique
+                    changed = self.__changed
+                    if changed:
+                        for other in range(len(stale)):
+                            stale[other] |= changed
+                        self.__changed = 0
+
+                    # Scan the units which are stale for the technique
+                    units, stale[position] = stale[position], 0
+                    if units and step(units):
+                        if counts is not None:
+                            counts[technique] = counts.get(technique, 0) + 1
+                        break
+                else:
+                    return True
+        except Contradiction:
+            return False
+
+    def __naked_singles(self, counts) -> None:
+        '''
+        Method to fill every cell which has a single candidate left.
+
+        Parameters:
+            - counts - dictionary of technique to the number of times it was used (or None)
+        '''
+
+        values, masks, pending = self.values, self.masks, self.__pending
+
+        while pending:
+            index = pending.pop()
+
+            # Skip cells which have already been filled
+            if values[index] != 0:
+                continue
+
+            self.assign(index, masks[index].bit_length() - 1)
+
+            if counts is not None:
+                counts[Technique.NAKED_SINGLE] = counts.get(Technique.NAKED_SINGLE, 0) + 1
+
+    def __hidden_singles(self, units:int) -> bool:
+        '''
+        Method to fill every cell which is the only place left in one of its units for a value.
+
+        Parameters:
+            - units - bit mask of the units to scan
+
+        Returns:
+            - whether any cells were filled
+        '''
+
+        values, masks = self.values, self.masks
+        full_mask = self.layout.full_mask
+        unit_cells = self.layout.unit_cells
+        changed = False
+
+        while units:
+            # Take the lowest unit left to scan
+            lowest = units & -units
+            units ^= lowest
+            cells = unit_cells[lowest.bit_length() - 1]
+
+            # Find the values which are candidates of at least one and of at least two cells in the unit, and
+            # the values of the cells with a single candidate (filled cells)
+            once = twice = fixed = 0
+            for cell in cells:
+                mask = masks[cell]
+                if mask & (mask - 1) == 0:
+                    fixed |= mask
+                twice |= once & mask
+                once |= mask
+
+            # Every value needs a place in every unit
+            if once != full_mask:
+                raise Contradiction()
+
+            # Values with a single place in the unit which have not been placed yet
+            singles = once & ~twice & ~fixed
+            if not singles:
+                continue
+
+            # Fill each unfilled cell holding a value which has no other place in the unit
+            for cell in cells:
+                bits = masks[cell] & singles
+                if bits and values[cell] == 0:
+                    # A cell can not be the only place for two values
+                    if bits & (bits - 1):
+                        raise Contradiction()
+
+                    self.assign(cell, bits.bit_length() - 1)
+                    changed = True
+
+        return changed
+
+    def __naked_pairs(self, units:int) -> bool:
+        '''
+        Method to remove the candidates of two cells in a unit which share the same two candidates from the
+        other cells of the unit.
+
+        Parameters:
+            - units - bit mask of the units to scan
+
+        Returns:
+            - whether any candidates were removed
+        '''
+
+        masks = self.masks
+        unit_cells = self.layout.unit_cells
+        changed = False
+
+        while units:
+            # Take the lowest unit left to scan
+            lowest = units & -units
+            units ^= lowest
+            cells = unit_cells[lowest.bit_length() - 1]
+
+            # Dictionary of the two candidate masks seen in the unit to the cell they were seen in
+            pairs = {}
+
+            for cell in cells:
+                # Only consider cells with exactly two candidates (filled cells have a single candidate)
+                mask = masks[cell]
+                rest = mask & (mask - 1)
+                if rest == 0 or rest & (rest - 1):
+                    continue
+
+                # If another cell has the same pair, remove the pair from every other cell in the unit (the
+                # filled cells in the unit can not hold either value)
+                if mask in pairs:
+                    for other in cells:
+                        if other != cell and other != pairs[mask]:
+                            changed |= self.eliminate(other, mask)
+                else:
+                    pairs[mask] = cell
+
+        return changed
+
+    def __hidden_pairs(self, units:int) -> bool:
+        '''
+        Method to find two values in a unit which are only candidates of the same two cells, and remove the
+        other candidates of those cells.
+
+        Parameters:
+            - units - bit mask of the units to scan
+
+        Returns:
+            - whether any candidates were removed
+        '''
+
+        masks = self.masks
+        unit_cells = self.layout.unit_cells
+        changed = False
+
+        while units:
+            # Take the lowest unit left to scan
+            lowest = units & -units
+            units ^= lowest
+            cells = unit_cells[lowest.bit_length() - 1]
+
+            # Find the values which are candidates of exactly two cells in the unit (a placed value is only a
+            # candidate of the cell it is placed in)
+            once = twice = thrice = 0
+            for cell in cells:
+                mask = masks[cell]
+                thrice |= twice & mask
+                twice |= once & mask
+                once |= mask
+
+            doubles = twice & ~thrice
+            if doubles & (doubles - 1) == 0:
+                continue
+
+            # Dictionary of the two cells a value can go in to the values with those places
+            places = {}
+            while doubles:
+                bit = doubles & -doubles
+                doubles ^= bit
+
+                found = tuple(cell for cell in cells if masks[cell] & bit)
+                places[found] = places.get(found, 0) | bit
+
+            # Remove every other candidate from the cells of each pair of values
+            for found, bits in places.items():
+                rest = bits & (bits - 1)
+                if rest == 0:
+                    continue
+
+                # Three values can not share two cells
+                if rest & (rest - 1):
+                    raise Contradiction()
+
+                for cell in found:
+                    changed |= self.eliminate(cell, ~bits)
+
+        return changed
+
+    def __pointing(self, units:int) -> bool:
+        '''
+        Method to find values whose places in a box all lie in one row or column (pointing), or whose places
+        in a row or column all lie in one box (claiming), and remove them from the rest of the other unit.
+
+        Parameters:
+            - units - bit mask of the units to scan (an intersection is scanned if its box or line is)
+
+        Returns:
+            - whether any candidates were removed
+        '''
+
+        masks = self.masks
+        changed = False
+
+        # A value placed in the intersection is not a candidate of any other cell in the box or the line, so
+        # the filled cells do not need to be treated separately
+        for shared, box_rest, line_rest, intersection_units in self.layout.intersections:
+            # Skip the intersection if neither unit has changed
+            if not units & intersection_units:
+                continue
+
+            # Candidates of the cells in the intersection, the rest of the box and the rest of the line
+            inside = box_outside = line_outside = 0
+            for cell in shared:
+                inside |= masks[cell]
+            for cell in box_rest:
+                box_outside |= masks[cell]
+            for cell in line_rest:
+                line_outside |= masks[cell]
+
+            # Values which can only go in the intersection within the box are removed from the rest of the line
+            pointing = inside & ~box_outside & line_outside
+            if pointing:
+                for cell in line_rest:
+                    changed |= self.eliminate(cell, pointing)
+
+            # Values which can only go in the intersection within the line are removed from the rest of the box
+            claiming = inside & ~line_outside & box_outside
+            if claiming:
+                for cell in box_rest:
+                    changed |= self.eliminate(cell, claiming)
+
+        return changed
@@ -0,0 +1,270 @@
+import sqlite3
+import os
+
+# Imports from other parts of the project
+from ..puzzle import Difficulty
+from .sudoku import Sudoku
+from .cell_value import Cell_Value
+from .grader import grade_puzzle
+from .generator import generate_many
+
+# Puzzle bank file, next to this module so it does not depend on the working directory
+bank_name = os.path.join(os.path.dirname(os.path.abspath(__file__)), "puzzles.db")
+
+# Tables and indexes of the puzzle bank, the unserved puzzles are indexed by the columns they are chosen by
+BANK_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS puzzles ("
+    "id INTEGER PRIMARY KEY, "
+    "puzzle TEXT NOT NULL UNIQUE, "
+    "solution TEXT NOT NULL, "
+    "size INTEGER NOT NULL, "
+    "difficulty INTEGER NOT NULL, "
+    "clues INTEGER NOT NULL, "
+    "score INTEGER NOT NULL, "
+    "served INTEGER NOT NULL DEFAULT 0)",
+    "CREATE INDEX IF NOT EXISTS unserved_puzzles ON puzzles (size, difficulty, clues, score) WHERE served = 0"
+]
+
+class Puzzle_Bank:
+    '''
+    Class for a bank of generated puzzles stored in an SQLite database, so puzzles of a difficulty and
+    number of clues can be served without generating them. Each puzzle is only served once.
+
+    The database uses write ahead logging, so many processes can read from the bank while puzzles are
+    being added or served.
+    '''
+
+    def __init__(self, file_path:str=None):
+        '''
+        Method to open a puzzle bank, creating it if it does not exist.
+
+        Parameters:
+            - file_path (optional) - path of the database file (default is the puzzle bank next to the
+              seed file)
+        '''
+
+        if file_path is not None and type(file_path) is not str:
+            raise Exception("Invalid File Path")
+
+        # Open the database without implicit transactions, so each transaction is started explicitly
+        self.__connection = sqlite3.connect(bank_name if file_path is None else file_path, isolation_level=None, timeout=30)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+
+        for statement in BANK_SCHEMA:
+            self.__connection.execute(statement)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self) -> None:
+        '''
+        Method to close the puzzle bank.
+        '''
+
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+    def add_puzzles(self, records, batch_size:int=1000) -> int:
+        '''
+        Method to add puzzles to the bank, inserting them in batches with one transaction for each batch.
+        Puzzles already in the bank are skipped.
+
+        Parameters:
+            - records - iterable of (puzzle seed, solution seed, difficulty) of each puzzle, as made by
+              generate_many, optionally followed by the score of the puzzle (graded if not given) and the
+              grid size (default is 9)
+            - batch_size (optional) - number of puzzles inserted in each transaction (default is 1000)
+
+        Returns:
+            - number of new puzzles added
+        '''
+
+        if type(batch_size) is not int or batch_size < 1:
+            raise Exception("Invalid Batch Size")
+
+        added = 0
+        batch = list()
+
+        # Loop through the puzzles a batch at a time
+        for record in records:
+            batch += [Puzzle_Bank.__row(record)]
+            if len(batch) == batch_size:
+                added += self.__insert(batch)
+                batch = list()
+
+        # Insert the remaining puzzles
+        if len(batch) > 0:
+            added += self.__insert(batch)
+
+        return added
+
+    def fill(self, n:int, difficulty:Difficulty, workers:int=None, batch_size:int=100, **options) -> int:
+        '''
+        Method to generate puzzles in parallel and add them to the bank as they are made.
+
+        Parameters:
+            - n - number of puzzles to generate
+            - difficulty - the level of difficulty the generated puzzles should have (Difficulty enum)
+            - workers (optional) - number of worker processes (default is the number of cores)
+            - batch_size (optional) - number of puzzles inserted in each transaction (default is 100)
+            - options (optional) - other options of generate_many (seed, size, clues and symmetry)
+
+        Returns:
+            - number of new puzzles added
+        '''
+
+        # Take the scores of the puzzles from the workers, so the puzzles are not graded again here
+        size = options.get("size", 9)
+        records = generate_many(n, difficulty, workers=workers, scores=True, **options)
+        return self.add_puzzles((record + (size,) for record in records), batch_size)
+
+    def take(self, difficulty:Difficulty, min_clues:int=None, max_clues:int=None, min_score:int=None,
+             max_score:int=None, size:int=9) -> tuple:
+        '''
+        Method to serve an unserved puzzle of a difficulty level, marking it as served.
+
+        Parameters:
+            - difficulty - the level of difficulty of the puzzle (Difficulty enum)
+            - min_clues (optional) - smallest number of clues of the puzzle (default has no minimum)
+            - max_clues (optional) - largest number of clues of the puzzle (default has no maximum)
+            - min_score (optional) - smallest grader score of the puzzle (default has no minimum)
+            - max_score (optional) - largest grader score of the puzzle (default has no maximum)
+            - size (optional) - the number of rows, columns and boxes in the grid (default is 9)
+
+        Returns:
+            - (puzzle seed, solution seed, difficulty, clues, score) of the puzzle, or None if there are no
+              unserved puzzles matching
+        '''
+
+        if type(difficulty) is not Difficulty or difficulty == Difficulty.UNDEFINED:
+            raise Exception("Invalid Difficulty")
+
+        for value in [min_clues, max_clues, min_score, max_score]:
+            if value is not None and (type(value) is not int or value < 0):
+                raise Exception("Invalid Range")
+
+        # Find and mark a matching puzzle in one write transaction, so no puzzle is served twice
+        self.__connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.__connection.execute(
+                "SELECT id, puzzle, solution, difficulty, clues, score FROM puzzles "
+                "WHERE served = 0 AND size = ? AND difficulty = ? AND clues BETWEEN ? AND ? AND score BETWEEN ? AND ? "
+                "LIMIT 1",
+                (size, difficulty.value,
+                 0 if min_clues is None else min_clues, size * size if max_clues is None else max_clues,
+                 0 if min_score is None else min_score, (1 << 62) if max_score is None else max_score)).fetchone()
+
+            if row is not None:
+                self.__connection.execute("UPDATE puzzles SET served = 1 WHERE id = ?", (row[0],))
+
+            self.__connection.execute("COMMIT")
+        except Exception:
+            self.__connection.execute("ROLLBACK")
+            raise
+
+        if row is None:
+            return None
+
+        return row[1], row[2], Difficulty(row[3]), row[4], row[5]
+
+    def count(self, difficulty:Difficulty=None, served:bool=None) -> int:
+        '''
+        Method to count the puzzles in the bank.
+
+        Parameters:
+            - difficulty (optional) - only count puzzles of the difficulty level (default counts them all)
+            - served (optional) - only count puzzles which have (or have not) been served (default counts
+              them all)
+
+        Returns:
+            - the number of puzzles
+        '''
+
+        if difficulty is not None and type(difficulty) is not Difficulty:
+            raise Exception("Invalid Difficulty")
+
+        if served is not None and type(served) is not bool:
+            raise Exception("Invalid Served")
+
+        query = "SELECT COUNT(*) FROM puzzles WHERE 1"
+        parameters = list()
+
+        if difficulty is not None:
+            query += " AND difficulty = ?"
+            parameters += [difficulty.value]
+
+        if served is not None:
+            query += " AND served = ?"
+            parameters += [int(served)]
+
+        return self.__connection.execute(query, parameters).fetchone()[0]
+
+    def __insert(self, rows:list) -> int:
+        '''
+        Method to insert a batch of puzzles in one transaction.
+
+        Parameters:
+            - rows - list of the column values of each puzzle
+
+        Returns:
+            - number of new puzzles inserted
+        '''
+
+        self.__connection.execute("BEGIN IMMEDIATE")
+        try:
+            before = self.__connection.total_changes
+            self.__connection.executemany(
+                "INSERT OR IGNORE INTO puzzles (puzzle, solution, size, difficulty, clues, score) VALUES (?, ?, ?, ?, ?, ?)", rows)
+            inserted = self.__connection.total_changes - before
+            self.__connection.execute("COMMIT")
+        except Exception:
+            self.__connection.execute("ROLLBACK")
+            raise
+
+        return inserted
+
+    @staticmethod
+    def __row(record) -> tuple:
+        '''
+        Method to check a puzzle record and find the column values of the puzzle.
+
+        Parameters:
+            - record - (puzzle seed, solution seed, difficulty), optionally followed by the score (None to
+              grade the puzzle) and the grid size
+
+        Returns:
+            - the puzzle seed, solution seed, size, difficulty, clues and score of the puzzle
+        '''
+
+        if type(record) not in [tuple, list] or len(record) not in [3, 4, 5]:
+            raise Exception("Invalid Record")
+
+        puzzle, solution, difficulty = record[:3]
+        score = record[3] if len(record) > 3 else None
+        size = record[4] if len(record) > 4 else 9
+
+        # Check the seeds, difficulty and score are valid
+        if type(puzzle) is not str or type(solution) is not str or type(size) is not int:
+            raise Exception("Invalid Record")
+
+        if not Sudoku(solution, size=size).valid() or any(cell != Cell_Value.EMPTY.seed() and cell != value for cell, value in zip(puzzle, solution)) \
+            or len(puzzle) != len(solution):
+            raise Exception("Invalid Record")
+
+        if type(difficulty) is not Difficulty or difficulty == Difficulty.UNDEFINED:
+            raise Exception("Invalid Record")
+
+        if score is not None and (type(score) is not int or score < 0):
+            raise Exception("Invalid Record")
+
+        # Grade the puzzle if the score is not given
+        if score is None:
+            score = grade_puzzle(Sudoku(puzzle, size=size))[2]
+
+        clues = len(puzzle) - puzzle.count(Cell_Value.EMPTY.seed())
+        return puzzle, solution, size, difficulty.value, clues, score
@@ -0,0 +1,272 @@
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+import functools
+import itertools
+import threading
+import random
+
+# Imports from other parts of the project
+from ..puzzle import Difficulty
+from .generator import generate_chunk
+from .create_difficulty import Symmetry
+
+# Default number of ready puzzles kept for each difficulty level
+POOL_TARGET = 16
+
+# Number of puzzles each worker generates at a time when refilling, kept small so the pool fills steadily
+POOL_CHUNK_SIZE = 2
+
+class Puzzle_Pool:
+    '''
+    Class for a pool of generated puzzles kept in memory, so puzzles can be served without waiting for
+    them to be generated. A background thread refills the pool of a difficulty level whenever it drops
+    below its low water mark, generating the puzzles in a pool of worker processes which lives as long as
+    the pool, so serving is not slowed down and every level is refilled at the same time.
+
+    The pool of a difficulty level holds puzzles generated for that level, which (as with
+    Sudoku_Puzzle.generate) are graded at most as hard as the level.
+    '''
+
+    def __init__(self, target:int=POOL_TARGET, low_water:int=None, difficulties:list=None, workers:int=None,
+                 size:int=9, clues:int=None, symmetry:Symmetry=Symmetry.NONE, start:bool=True):
+        '''
+        Method to create a puzzle pool.
+
+        Parameters:
+            - target (optional) - number of ready puzzles to keep for each difficulty level (default is 16)
+            - low_water (optional) - number of ready puzzles below which a difficulty level is refilled
+              (default is half the target)
+            - difficulties (optional) - list of the difficulty levels to keep puzzles for (default is easy,
+              medium, hard and extreme)
+            - workers (optional) - number of worker processes generating puzzles (default is the number of
+              cores)
+            - size (optional) - the number of rows, columns and boxes in the grids (default is 9)
+            - clues (optional) - the number of filled cells the puzzles should have (default is as few as
+              the difficulty level allows)
+            - symmetry (optional) - the symmetry of the pattern of filled cells (Symmetry enum, default is
+              none)
+            - start (optional) - boolean indicating whether to start filling the pool straight away
+              (default is True)
+        '''
+
+        # Check the inputs are valid (the puzzle options are checked when generating)
+        if type(target) is not int or target < 1:
+            raise Exception("Invalid Target")
+
+        if low_water is None:
+            low_water = target // 2
+
+        if type(low_water) is not int or low_water < 0 or low_water >= target:
+            raise Exception("Invalid Low Water")
+
+        if difficulties is None:
+            difficulties = [Difficulty.EASY, Difficulty.MEDIUM, Difficulty.HARD, Difficulty.EXTREME]
+
+        if type(difficulties) is not list or len(difficulties) == 0 or \
+            any(type(difficulty) is not Difficulty or difficulty == Difficulty.UNDEFINED for difficulty in difficulties):
+            raise Exception("Invalid Difficulties")
+
+        if workers is not None and (type(workers) is not int or workers < 1):
+            raise Exception("Invalid Workers")
+
+        self.__target = target
+        self.__low_water = low_water
+        self.__workers = workers
+        self.__size = size
+        self.__clues = clues
+        self.__symmetry = symmetry
+
+        # Ready puzzles of each difficulty level, the number of puzzles of each level being generated, and
+        # the levels waiting to be refilled
+        self.__puzzles = {difficulty : deque() for difficulty in difficulties}
+        self.__generating = {difficulty : 0 for difficulty in difficulties}
+        self.__refills = deque(difficulties)
+
+        # Condition guarding the pools, notified when puzzles are taken or added
+        self.__condition = threading.Condition()
+        self.__closed = False
+        self.__error = None
+        self.__thread = None
+        self.__executor = None
+
+        if start:
+            self.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def start(self) -> None:
+        '''
+        Method to start the worker processes and the background thread which refills the pool.
+        '''
+
+        with self.__condition:
+            if self.__closed:
+                raise Exception("Pool Closed")
+
+            if self.__thread is None:
+                self.__executor = ProcessPoolExecutor(max_workers=self.__workers)
+                self.__thread = threading.Thread(target=self.__refill, name="Puzzle_Pool", daemon=True)
+                self.__thread.start()
+
+    def close(self) -> None:
+        '''
+        Method to stop refilling the pool, cancelling the chunks of puzzles which have not started and
+        waiting for the worker processes to finish the chunks they are generating.
+        '''
+
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True, cancel_futures=True)
+            self.__executor = None
+
+    def take(self, difficulty:Difficulty, timeout:float=0) -> tuple:
+        '''
+        Method to take a ready puzzle of a difficulty level from the pool.
+
+        Parameters:
+            - difficulty - the level of difficulty of the puzzle (Difficulty enum)
+            - timeout (optional) - number of seconds to wait for a puzzle if none are ready, None to wait
+              until one is (default is not to wait)
+
+        Returns:
+            - (puzzle seed, solution seed, difficulty) of the puzzle, or None if no puzzle was ready
+        '''
+
+        if difficulty not in self.__puzzles:
+            raise Exception("Invalid Difficulty")
+
+        if timeout is not None and (type(timeout) not in [int, float] or timeout < 0):
+            raise Exception("Invalid Timeout")
+
+        with self.__condition:
+            # Wait for a puzzle if there are none ready (unless refilling has failed or stopped)
+            if len(self.__puzzles[difficulty]) == 0 and timeout != 0:
+                self.__condition.wait_for(lambda: len(self.__puzzles[difficulty]) > 0 or self.__error is not None
+                                          or self.__closed, timeout)
+
+            if len(self.__puzzles[difficulty]) == 0:
+                if self.__error is not None:
+                    raise self.__error
+                return None
+
+            record = self.__puzzles[difficulty].popleft()
+
+            # Ask for the pool to be refilled once it drops below the low water mark
+            if len(self.__puzzles[difficulty]) < self.__low_water and difficulty not in self.__refills:
+                self.__refills.append(difficulty)
+                self.__condition.notify_all()
+
+            return record
+
+    def count(self, difficulty:Difficulty) -> int:
+        '''
+        Method to count the ready puzzles of a difficulty level.
+
+        Parameters:
+            - difficulty - the level of difficulty (Difficulty enum)
+
+        Returns:
+            - the number of ready puzzles
+        '''
+
+        if difficulty not in self.__puzzles:
+            raise Exception("Invalid Difficulty")
+
+        with self.__condition:
+            return len(self.__puzzles[difficulty])
+
+    def wait_full(self, timeout:float=None) -> bool:
+        '''
+        Method to wait until the pool of every difficulty level has been filled to its target.
+
+        Parameters:
+            - timeout (optional) - number of seconds to wait, None to wait until the pool is full (default
+              is None)
+
+        Returns:
+            - boolean indicating whether the pool is full
+        '''
+
+        with self.__condition:
+            full = self.__condition.wait_for(lambda: self.__error is not None or self.__closed or
+                                             all(len(puzzles) >= self.__target for puzzles in self.__puzzles.values()), timeout)
+
+            if self.__error is not None:
+                raise self.__error
+
+            return full and all(len(puzzles) >= self.__target for puzzles in self.__puzzles.values())
+
+    def __refill(self) -> None:
+        '''
+        Method run by the background thread, submitting chunks of puzzles to the executor for every
+        difficulty level which has dropped below its low water mark, so the levels are refilled at the same
+        time. The chunks are added to the pool as they complete.
+        '''
+
+        try:
+            while True:
+                # Wait for difficulty levels to refill, and find the chunks each one is missing (counting the
+                # puzzles already being generated)
+                with self.__condition:
+                    self.__condition.wait_for(lambda: self.__closed or len(self.__refills) > 0)
+                    if self.__closed:
+                        return
+
+                    chunks = list()
+                    while len(self.__refills) > 0:
+                        difficulty = self.__refills.popleft()
+                        missing = self.__target - len(self.__puzzles[difficulty]) - self.__generating[difficulty]
+                        self.__generating[difficulty] += max(missing, 0)
+
+                        chunks += [[(difficulty, min(POOL_CHUNK_SIZE, missing - start)) for start in range(0, missing, POOL_CHUNK_SIZE)]]
+
+                # Submit the chunks taking one from each level in turn, so a slow level does not hold up the others
+                for difficulty, count in (chunk for turn in itertools.zip_longest(*chunks) for chunk in turn if chunk is not None):
+                    future = self.__executor.submit(generate_chunk, random.getrandbits(64), 0, count, difficulty,
+                                                    self.__size, self.__clues, self.__symmetry, False)
+                    future.add_done_callback(functools.partial(self.__add_chunk, difficulty, count))
+        except Exception as error:
+            # Keep the error so it is raised to callers waiting for puzzles
+            with self.__condition:
+                self.__error = error
+                self.__condition.notify_all()
+
+    def __add_chunk(self, difficulty:Difficulty, count:int, future) -> None:
+        '''
+        Method called when a chunk of puzzles has been generated, adding the puzzles to the pool.
+
+        Parameters:
+            - difficulty - the level of difficulty the chunk was generated for (Difficulty enum)
+            - count - number of puzzles in the chunk
+            - future - future holding the puzzles of the chunk
+        '''
+
+        with self.__condition:
+            self.__generating[difficulty] -= count
+
+            # Ignore chunks which were cancelled when the pool was closed
+            if self.__closed or future.cancelled():
+                return
+
+            if future.exception() is not None:
+                self.__error = future.exception()
+            else:
+                self.__puzzles[difficulty].extend(future.result())
+
+                # Refill the level again if puzzles were taken while the chunk was generated
+                if len(self.__puzzles[difficulty]) + self.__generating[difficulty] < self.__low_water and \
+                    difficulty not in self.__refills:
+                    self.__refills.append(difficulty)
+
+            self.__condition.notify_all()
@@ -1,129 +1,525 @@
 from .sudoku import Sudoku
 from .cell_value import Cell_Value
+from .batch import seeds_to_array, validate_grids
+from .canonical import canonicalize, Grid_Transform
+import hashlib
 import random
-import re
+import collections
+import struct
+import mmap
 import os
 
-# Seed file
-file_name = os.path.join("puzzles", "sudoku", "seeds.txt")
+# Seed file, next to this module so it does not depend on the working directory
+file_name = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seeds.txt")
 
-def get_seed(index:int=None) -> str:
+# Number of characters in a seed and in a record of the seed file (the seed and its line ending)
+SEED_LENGTH = 81
+RECORD_SIZE = SEED_LENGTH + 1
+
+# Header of the duplicate index file (identifier, number of slots, number of seeds indexed and the hash of
+# the last seed indexed) and a slot of the index (hash of a seed and its record number plus one, zero for
+# an empty slot)
+INDEX_HEADER = struct.Struct("<8sQQQ")
+INDEX_SLOT = struct.Struct("<QQ")
+INDEX_IDENTIFIER = b"SEEDIDX1"
+
+# Smallest number of slots in the duplicate index (always a power of two)
+INDEX_MIN_SLOTS = 1024
+
+def seed_count() -> int:
+    '''
+    Method to count the seeds stored in the seeds file. Every seed is a fixed size record, so this only
+    needs the size of the file.
+
+    Returns:
+        - the number of seeds in the seed file
     '''
-    Method to load a seed from the list of valid seeds stored in the seeds file.
+
+    # The last record may not have a line ending
+    size = os.path.getsize(file_name)
+    if size % RECORD_SIZE not in [0, SEED_LENGTH]:
+        raise Exception("Invalid Seed File")
+
+    return (size + 1) // RECORD_SIZE
+
+def get_seed(index:int=None, transform:bool=False) -> str:
+    '''
+    Method to load a seed from the list of valid seeds stored in the seeds file. The file is memory mapped
+    and the seed is read from the offset of its record, so the time taken does not depend on the number
+    of seeds stored.
 
     Parameters:
         - index (optional) - index of the seed, if none given, it chooses a random index
+        - transform (optional) - boolean indicating whether to apply a random transform from the grid's
+          symmetry group to the seed, giving a new valid grid each time without searching (default
+          returns the seed as stored)
 
     Returns:
         - the seed loaded from the seed file
     '''
 
-    # Open the seed file
-    file = open(file_name, "r")
+    # Check the transform option is valid
+    if type(transform) is not bool:
+        raise Exception("Invalid Transform")
 
-    # Get a list of all the seeds
-    lines = file.readlines()
+    # Find the number of seeds in the seed file
+    count = seed_count()
 
     # Check the input for index is valid
     if index is not None:
-        if type(index) is not int or index < 0 or index >= len(lines):
-            file.close()
+        if type(index) is not int or index < 0 or index >= count:
             raise Exception("Invalid Index")
 
     # If the seed index is not specified, find a random index
     if index is None:
-        index = random.randint(0, len(lines) - 1)
+        if count == 0:
+            raise Exception("Empty Seed File")
+        index = random.randint(0, count - 1)
 
-    # Read the line containing the requested seed
-    seed = lines[index]
+    # Read the record of the requested seed from the memory mapped file
+    with open(file_name, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            seed = mapped[index * RECORD_SIZE : index * RECORD_SIZE + SEED_LENGTH]
 
-    # Remove the line ending character (if present)
-    seed = seed.replace("\n", "")
+    # Return the seed, transformed if requested
+    if transform:
+        return Grid_Transform.random().apply(seed.decode("ascii"))
 
-    # Close the seed file
-    file.close()
+    return seed.decode("ascii")
 
-    # Return the seed
-    return seed
-
-def save_seed(seed:str) -> None:
+def save_seed(seed:str, canonical:bool=False) -> None:
     '''
     Method to save a seed into the list of valid seeds stored in the seeds file.
-    This checks if the seed is valid and is already in the file before saving it.
+    The seed is checked to be valid (by the batch save) and not already in the file before saving it.
 
     Parameters:
         - seed - valid seed of a sudoku
+        - canonical (optional) - boolean indicating whether to save the canonical form of the seed, so
+          seeds which are transforms of each other are saved once (default saves the seed as given)
     '''
 
-    # Check that the seed is valid
-    if not type(seed) == str or not Sudoku(seed).valid():
+    # Check that the seed is a string (the batch save checks it is a valid filled grid)
+    if not type(seed) == str:
         raise Exception("Invalid Seed")
 
-    # Open the seed file for reading
-    file = open(file_name, "r")
+    # Save the seed, unless it is already in the file
+    if save_seeds([seed], canonical=canonical) == 0:
+        raise Exception("Duplicate Seed")
 
-    # Check that the seed is not already in the file
-    for line in file.readlines():
-        if seed in line:
-            file.close()
-            raise Exception("Duplicate Seed")
+def save_seeds(seeds, batch_size:int=65536, canonical:bool=False) -> int:
+    '''
+    Method to save many seeds into the list of valid seeds stored in the seeds file. The seeds are
+    checked together in vectorised passes, any seeds already in the file (or earlier in the list) are
+    skipped using the duplicate index, and the new seeds are appended in one write for each batch.
 
-    # Close the seed file
-    file.close()
+    Parameters:
+        - seeds - iterable of valid seeds of sudokus
+        - batch_size (optional) - number of seeds checked and written at a time (default is 65536)
+        - canonical (optional) - boolean indicating whether to save the canonical forms of the seeds, so
+          seeds which are transforms of each other are saved once (default saves the seeds as given)
 
-    # Open the seed file for appending
-    file = open(file_name, "a")
+    Returns:
+        - number of new seeds saved to the seed file
+    '''
 
-    # Write the seed to the end of the file
-    file.write(seed + "\n")
+    # Check the batch size is valid
+    if type(batch_size) is not int or batch_size < 1:
+        raise Exception("Invalid Batch Size")
 
-    # Close the seed file
-    file.close()
+    if type(canonical) is not bool:
+        raise Exception("Invalid Canonical")
 
-def generate_seeds() -> None:
+    saved = 0
+    batch = list()
+
+    # Loop through the seeds a batch at a time
+    for seed in seeds:
+        batch += [seed]
+        if len(batch) == batch_size:
+            saved += __save_batch(batch, canonical)
+            batch = list()
+
+    # Save the remaining seeds
+    if len(batch) > 0:
+        saved += __save_batch(batch, canonical)
+
+    # Return the number of seeds saved
+    return saved
+
+def generate_seeds(limit:int=None, batch_size:int=1000) -> int:
     '''
-    Method to generate a valid sudoku seeds and add them to the seed list file
+    Method to generate valid sudoku seeds and add them to the seed list file. Seeds are saved in batches
+    as soon as they are found, so memory use does not grow with the number of seeds generated.
+
+    Parameters:
+        - limit (optional) - maximum number of seeds to generate (default generates them all)
+        - batch_size (optional) - number of seeds to write to the seed file at a time (default is 1000)
+
+    Returns:
+        - number of new seeds saved to the seed file
     '''
 
-    sudoku = Sudoku()
+    # Check the limit and batch size are valid
+    if limit is not None and (type(limit) is not int or limit < 1):
+        raise Exception("Invalid Limit")
+    if type(batch_size) is not int or batch_size < 1:
+        raise Exception("Invalid Batch Size")
 
-    seeds = sudoku.fill(clear=True, find_all=True)
+    # Number of seeds generated and saved
+    generated = 0
+    saved = 0
 
-    for seed in seeds:
-        save_seed(seed)
+    # Batch of seeds waiting to be saved
+    batch = list()
+
+    # Loop through the seeds of the filled grids as the search finds them
+    for seed in Sudoku().iter_solutions():
+        batch += [seed]
+        generated += 1
+
+        # Save the batch once it is full
+        if len(batch) == batch_size:
+            saved += save_seeds(batch)
+            batch = list()
+
+        # Stop once the limit of seeds has been generated
+        if limit is not None and generated >= limit:
+            break
+
+    # Save the remaining seeds
+    saved += save_seeds(batch)
 
-def mutate_seed(seed:str):
+    # Return the number of seeds saved
+    return saved
+
+def __save_batch(seeds:list, canonical:bool) -> int:
     '''
-    Method to generate a valid sudoku seeds and add them to the seed list file
+    Method to save a batch of seeds to the seed file in one write, skipping any seeds already in the file.
+    Nothing is saved if any of the seeds are not valid.
+
+    Parameters:
+        - seeds - list of valid seeds
+        - canonical - boolean indicating whether to save the canonical forms of the seeds
+
+    Returns:
+        - number of new seeds written to the seed file
+    '''
+
+    # Check all the seeds are valid filled grids (raises an exception for seeds of the wrong length)
+    if not validate_grids(seeds_to_array(seeds))[0].all():
+        raise Exception("Invalid Seed")
+
+    # Replace the seeds with their canonical forms if requested
+    if canonical:
+        seeds = [canonicalize(seed)[0] for seed in seeds]
+
+    with Seed_Index() as index:
+        # Keep the first of each seed in the order they were found, if it is not in the seed file
+        new = [seed for seed in dict.fromkeys(seeds) if not index.contains(seed)]
+
+        if len(new) == 0:
+            return 0
+
+        # Start a new line if the last line of the file is not terminated
+        prefix = ""
+        if os.path.exists(file_name) and os.path.getsize(file_name) % RECORD_SIZE != 0:
+            prefix = "\n"
+
+        # Append all the new seeds to the seed file in one write (always with single character line
+        # endings to keep the records a fixed size)
+        count = index.count()
+        with open(file_name, "a", newline="\n") as file:
+            file.write(prefix + "".join([seed + "\n" for seed in new]))
+
+        # Add the new seeds to the duplicate index
+        for record, seed in enumerate(new, count):
+            index.add(seed, record)
+
+    # Return the number of seeds written
+    return len(new)
+
+class Seed_Index:
+    '''
+    Class for the duplicate index of the seed file. The index is an open addressing hash table of the
+    seeds' hashes and record numbers in a memory mapped file next to the seed file, so checking a seed is
+    constant time. A hash match is confirmed against the record in the seed file, so the check is exact.
+
+    The index keeps the number of seeds it holds and the hash of the last one. Seeds appended to the seed
+    file without the index are added when it is opened, and the index is rebuilt if the seed file has
+    been replaced.
+    '''
+
+    def __init__(self):
+        '''
+        Method to open the duplicate index of the seed file, creating or updating it to match the file.
+        '''
+
+        self.__path = os.path.splitext(file_name)[0] + ".idx"
+        self.__index = None
+        self.__seeds = open(file_name, "rb") if os.path.exists(file_name) else None
+
+        # Number of seeds in the seed file
+        seeds = seed_count() if self.__seeds is not None else 0
+
+        # Open the index if it matches the seed file (the same or fewer seeds, ending at the same seed)
+        if os.path.exists(self.__path) and os.path.getsize(self.__path) >= INDEX_HEADER.size:
+            self.__open(self.__path)
+            identifier, slots, count, last = INDEX_HEADER.unpack_from(self.__index)
+
+            if identifier != INDEX_IDENTIFIER or len(self.__index) != INDEX_HEADER.size + slots * INDEX_SLOT.size \
+                or count > seeds or (count > 0 and last != Seed_Index.hash(self.__record(count - 1))):
+                self.__index.close()
+                self.__index = None
+
+        # Otherwise create a new empty index
+        if self.__index is None:
+            self.__create(self.__path, INDEX_MIN_SLOTS)
+
+        # Add any seeds missing from the index
+        for record in range(self.count(), seeds):
+            self.add(self.__record(record), record)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self) -> None:
+        '''
+        Method to close the duplicate index and the seed file.
+        '''
+
+        if self.__index is not None:
+            self.__index.close()
+            self.__index = None
+
+        if self.__seeds is not None:
+            self.__seeds.close()
+            self.__seeds = None
+
+    @staticmethod
+    def hash(seed:str) -> int:
+        '''
+        Method to find the 64 bit hash of a seed used by the index.
+
+        Parameters:
+            - seed - seed to hash
+
+        Returns:
+            - integer hash of the seed
+        '''
+
+        return int.from_bytes(hashlib.blake2b(seed.encode("ascii"), digest_size=8).digest(), "little")
+
+    def count(self) -> int:
+        '''
+        Method to get the number of seeds in the index.
+
+        Returns:
+            - the number of seeds indexed
+        '''
+
+        return INDEX_HEADER.unpack_from(self.__index)[2]
+
+    def contains(self, seed:str) -> bool:
+        '''
+        Method to check whether a seed is in the seed file.
+
+        Parameters:
+            - seed - seed to look for
+
+        Returns:
+            - boolean indicating whether the seed is in the seed file
+        '''
+
+        seed_hash = Seed_Index.hash(seed)
+        slots = INDEX_HEADER.unpack_from(self.__index)[1]
+
+        # Probe the slots from the hash until an empty slot is found
+        slot = seed_hash & (slots - 1)
+        while True:
+            slot_hash, record = INDEX_SLOT.unpack_from(self.__index, INDEX_HEADER.size + slot * INDEX_SLOT.size)
+            if record == 0:
+                return False
+
+            # Confirm a matching hash with the seed stored in the seed file
+            if slot_hash == seed_hash and self.__record(record - 1) == seed:
+                return True
+
+            slot = (slot + 1) & (slots - 1)
+
+    def add(self, seed:str, record:int) -> None:
+        '''
+        Method to add a seed which has been written to the seed file to the index.
+
+        Parameters:
+            - seed - seed written to the seed file
+            - record - record number of the seed in the seed file
+        '''
+
+        _, slots, count, _ = INDEX_HEADER.unpack_from(self.__index)
+
+        # Double the number of slots once the index is half full
+        if (count + 1) * 2 > slots:
+            self.__grow(slots * 2)
+            slots *= 2
+
+        seed_hash = Seed_Index.hash(seed)
+        self.__insert(self.__index, slots, seed_hash, record)
+        INDEX_HEADER.pack_into(self.__index, 0, INDEX_IDENTIFIER, slots, count + 1, seed_hash)
+
+    def __record(self, record:int) -> str:
+        '''
+        Method to read a seed from its record in the seed file.
+
+        Parameters:
+            - record - record number of the seed
+
+        Returns:
+            - the seed stored in the record
+        '''
+
+        self.__seeds.seek(record * RECORD_SIZE)
+        return self.__seeds.read(SEED_LENGTH).decode("ascii")
+
+    @staticmethod
+    def __insert(index:mmap.mmap, slots:int, seed_hash:int, record:int) -> None:
+        '''
+        Method to put a seed's hash and record number into the first empty slot from its hash.
+
+        Parameters:
+            - index - memory mapped index
+            - slots - number of slots in the index
+            - seed_hash - hash of the seed
+            - record - record number of the seed in the seed file
+        '''
+
+        slot = seed_hash & (slots - 1)
+        while INDEX_SLOT.unpack_from(index, INDEX_HEADER.size + slot * INDEX_SLOT.size)[1] != 0:
+            slot = (slot + 1) & (slots - 1)
+
+        INDEX_SLOT.pack_into(index, INDEX_HEADER.size + slot * INDEX_SLOT.size, seed_hash, record + 1)
+
+    def __open(self, path:str) -> None:
+        '''
+        Method to memory map an index file.
+
+        Parameters:
+            - path - path of the index file
+        '''
+
+        with open(path, "r+b") as file:
+            self.__index = mmap.mmap(file.fileno(), 0)
+
+    def __create(self, path:str, slots:int) -> None:
+        '''
+        Method to create and memory map an empty index file.
+
+        Parameters:
+            - path - path of the index file
+            - slots - number of slots in the index
+        '''
+
+        with open(path, "wb") as file:
+            file.truncate(INDEX_HEADER.size + slots * INDEX_SLOT.size)
+
+        self.__open(path)
+        INDEX_HEADER.pack_into(self.__index, 0, INDEX_IDENTIFIER, slots, 0, 0)
+
+    def __grow(self, slots:int) -> None:
+        '''
+        Method to move the index into a new file with more slots.
+
+        Parameters:
+            - slots - number of slots in the new index
+        '''
+
+        old = self.__index
+        _, old_slots, count, last = INDEX_HEADER.unpack_from(old)
+
+        # Insert every seed of the old index into the new index
+        self.__create(self.__path + ".tmp", slots)
+        for slot in range(old_slots):
+            seed_hash, record = INDEX_SLOT.unpack_from(old, INDEX_HEADER.size + slot * INDEX_SLOT.size)
+            if record != 0:
+                self.__insert(self.__index, slots, seed_hash, record - 1)
+
+        INDEX_HEADER.pack_into(self.__index, 0, INDEX_IDENTIFIER, slots, count, last)
+
+        # Replace the old index file (with both files closed) and open the new one in its place
+        old.close()
+        self.__index.close()
+        os.replace(self.__path + ".tmp", self.__path)
+        self.__open(self.__path)
+
+def mutate_seed(seed:str, limit:int=None, batch_size:int=1000) -> int:
+    '''
+    Method to generate valid sudoku seeds by relabelling the values of a seed and add them to the seed
+    list file. The relabellings are explored breadth first by swapping pairs of values, keeping the seeds
+    found in memory so none are visited twice, and saved in batches.
 
     Parameters:
         - seed - seed to mutate
+        - limit (optional) - maximum number of mutated seeds to find, which also limits the memory used
+          (default finds every relabelling of the seed)
+        - batch_size (optional) - number of seeds to write to the seed file at a time (default is 1000)
+
+    Returns:
+        - number of new seeds saved to the seed file
     '''
 
+    # Check the seed, limit and batch size are valid
+    if type(seed) is not str or not Sudoku(seed).valid():
+        raise Exception("Invalid Seed")
+    if limit is not None and (type(limit) is not int or limit < 1):
+        raise Exception("Invalid Limit")
+    if type(batch_size) is not int or batch_size < 1:
+        raise Exception("Invalid Batch Size")
+
     # List of seed forms of all cell values
     values = [Cell_Value(i).seed() for i in range(1, 10)]
 
-    # List of new mutated seeds found
-    seeds = list()
+    # Translation tables swapping each distinct pair of values
+    tables = [str.maketrans(val_one + val_two, val_two + val_one) for i, val_one in enumerate(values) for val_two in values[i + 1:]]
 
-    # Loop throguh all distinct pairs of values to try swapping
-    for val_one in values:
-        for val_two in values:
-            if val_one == val_two: continue
+    # Seeds found so far, and the queue of seeds to mutate in the order they were found
+    visited = {seed}
+    queue = collections.deque([seed])
 
-            # Swap the two values
-            mutated = swap(seed, val_one, val_two)
+    # Number of seeds found and saved, and the batch of seeds waiting to be saved
+    found = 0
+    saved = 0
+    batch = list()
 
-            # Check if the seed is already found
-            try:
-                save_seed(mutated)
-                seeds += [mutated]
-            except:
-                pass
+    # Mutate the seeds in the queue until there are none left or the limit is reached
+    while len(queue) > 0 and (limit is None or found < limit):
+        current = queue.popleft()
 
-    # Loop through the new seeds found and find mutated versions
-    for seed in seeds:
-        mutate_seed(seed)
+        # Swap each pair of values
+        for table in tables:
+            mutated = current.translate(table)
+            if mutated in visited:
+                continue
+
+            visited.add(mutated)
+            queue.append(mutated)
+            batch += [mutated]
+            found += 1
+
+            # Save the batch once it is full
+            if len(batch) == batch_size:
+                saved += save_seeds(batch)
+                batch = list()
+
+            if limit is not None and found >= limit:
+                break
+
+    # Save the remaining seeds
+    saved += save_seeds(batch)
+
+    # Return the number of seeds saved
+    return saved
 
 def swap(seed:str, val_one:str, val_two:str) -> str:
     '''
@@ -138,15 +534,5 @@ def swap(seed:str, val_one:str, val_two:str) -> str:
         - mutated seed with the value swapped
     '''
 
-    # Replace all instances of value one with value two
-    mutated = seed.replace(val_one, val_two)
-
-    # Convert the new seed to a list
-    mutated = list(mutated)
-
-    # Loop through all indices of value two and swap them with value one
-    for index in [index.start() for index in re.finditer(pattern=val_two, string=seed)]:
-        mutated[index] = val_one
-
-    # Return the mutated seed in string form
-    return "".join(mutated)
+    # Replace all instances of each value with the other in one pass
+    return seed.translate(str.maketrans(val_one + val_two, val_two + val_one))
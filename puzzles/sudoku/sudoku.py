@@ -1,32 +1,108 @@
-import math
 import random
 
 # Importing cell value
 from .cell_value import Cell_Value
+from .grid_layout import get_layout
+from .propagation import Candidate_Grid, Contradiction
+
+# Layout of the standard 9 x 9 grid
+LAYOUT = get_layout(9)
+
+# Lookup table from a bit mask of values to the list of cell values that the mask contains
+MASK_VALUES = [[Cell_Value(value) for value in range(1, 10) if mask & (1 << value)] for mask in range(1 << 10)]
+
+# Number of values the fill search tries for each cell of the grid before restarting in a new random order
+FILL_BUDGET = 4
+
+# Lookup table from the integer value of a cell to the Cell_Value enum
+CELL_VALUES = tuple(Cell_Value(value) for value in range(10))
+
+# Cells are stored in a flat array in seed order, index = (column - 1) * 9 + (row - 1)
+# Units are numbered with rows 0-8, columns 9-17 and boxes 18-26
+CELL_UNITS = LAYOUT.cell_units
+
+# Indices of the cells in each unit
+UNIT_CELLS = LAYOUT.unit_cells
 
 
 class Sudoku:
     '''
     Class to hold the information on a Sudoku grid.
 
-    Rows and Columns are a range from 1 to 9.
+    Rows and Columns are a range from 1 to the size of the grid (9 for a standard sudoku). Grids larger
+    than 9 x 9 hold values that can not be represented by the Cell_Value enum, so their cells are accessed
+    with the integer methods (get_number, set_number and number_options).
     '''
 
-    def __init__(self, seed=None):
+    __slots__ = ("__layout", "__grid", "__masks", "__counts", "__conflicts", "__empty")
+
+    def __init__(self, seed=None, size:int=9):
         '''
         Method to create an instance of the sudoku puzzle.
 
         Parameters:
             - seed (optional) - seed of a sudoku puzzle to be loaded in
+            - size (optional) - number of rows, columns and boxes in the grid (default is 9)
         '''
 
+        # Get the tables describing the cells and units of the grid size (this checks the size is valid)
+        self.__layout = get_layout(size)
+
         # Create an empty sudoku grid
-        self.__grid = [[Cell_Value.EMPTY]*9 for i in range(9)]
+        self.clear()
 
         # Fill the sudoku based on a seed if one is given
         if seed is not None:
             self.from_seed(seed)
 
+    def __eq__(self, other) -> bool:
+        '''
+        Method to check whether two sudoku grids hold the same values.
+        '''
+
+        if type(other) is not Sudoku:
+            return NotImplemented
+
+        return self.__layout is other.__layout and self.__grid == other.__grid
+
+    def __hash__(self) -> int:
+        '''
+        Method to return the hash of the values in the sudoku grid.
+        '''
+
+        return hash(bytes(self.__grid))
+
+    def get_size(self) -> int:
+        '''
+        Method to get the size of the sudoku grid.
+
+        Returns:
+            - number of rows, columns and boxes in the grid (and the largest cell value)
+        '''
+
+        return self.__layout.size
+
+    def get_box_size(self) -> tuple:
+        '''
+        Method to get the dimensions of the boxes of the sudoku grid.
+
+        Returns:
+            - number of rows in each box
+            - number of columns in each box
+        '''
+
+        return self.__layout.box_height, self.__layout.box_width
+
+    def _get_layout(self):
+        '''
+        Method to get the tables describing the cells and units of the grid. For use within the package only.
+
+        Returns:
+            - Grid_Layout of the size of the grid
+        '''
+
+        return self.__layout
+
     def from_seed(self, seed:str) -> None:
         '''
         Method to load a sudoku puzzle grid from a given seed.
@@ -36,21 +112,16 @@ class Sudoku:
         '''
 
         # Check the seed is the correct length
-        if len(seed) != 81:
-            raise Exception("Invalid Seed")
-
-        # Check all the characters in the seed are valid
-        if not set(seed).issubset(set([Cell_Value(value).seed() for value in range(10)])):
+        if len(seed) != self.__layout.cells:
             raise Exception("Invalid Seed")
 
-        # Loop through all cells in the sudoku grid
-        for index in range(81):
-            # Find the specific coordinates of the index
-            row = index % 9 + 1
-            column = int(index / 9) + 1
+        # Convert the seed to the integer values of the cells (this checks all the characters are valid)
+        values = Cell_Value.decode_seed(seed, self.__layout.size)
 
-            # Set the cell value of the coordinates according to the seed
-            self.set_value(column, row, Cell_Value(ord(seed[index]) - 100))
+        # Load the values into the grid and rebuild the unit masks and counts from them
+        self.clear()
+        self.__grid[:] = values
+        self.__rebuild_units()
 
     def get_seed(self) -> str:
         '''
@@ -60,144 +131,320 @@ class Sudoku:
             - seed - seed of the sudoku puzzle as a string
         '''
 
-        # String for the seed
-        seed = ""
-
-        # Loop through all cells in the grid
-        for index in range(81):
-            # Find the specific coordinates of the index
-            row = index % 9 + 1
-            column = int(index / 9) + 1
-
-            # Get the seed of the cell value to add to the sudoku seed
-            seed += str(self.get_value(column, row).seed())
-
         # Return the seed of the sudoku
-        return seed
+        return Cell_Value.encode_seed(self.__grid)
 
     def clear(self) -> None:
         '''
         Method to clear the sudoku by replacing all cells with an empty value.
         '''
 
+        layout = self.__layout
+
         # Create an empty sudoku grid
-        self.__grid = [ [Cell_Value.EMPTY]*9 for i in range(9)]
+        self.__grid = bytearray(layout.cells)
+
+        # Bit masks of the values present in each unit (bit n set when value n is present)
+        self.__masks = [0] * layout.units
+
+        # Number of times each value appears in each unit (index = unit * (size + 1) + value), used to keep
+        # the masks correct when a value that appears more than once in a unit is removed
+        self.__counts = bytearray(layout.units * (layout.size + 1))
+
+        # Number of repeated values over all units (a value appearing n times in a unit adds n - 1)
+        self.__conflicts = 0
+
+        # Number of empty cells in the grid
+        self.__empty = layout.cells
+
+    def __index(self, column:int, row:int) -> int:
+        '''
+        Method to check the coordinates of a cell and convert them to the index of the cell.
+
+        Parameters:
+            - column - column index of the cell (integer between 1 and the size)
+            - row - row index of the cell (integer between 1 and the size)
+
+        Returns:
+            - index of the cell in seed order
+        '''
+
+        size = self.__layout.size
+
+        # Check that the column and row coordinates are valid
+        if type(column) is not int or type(row) is not int or column not in range(1, size + 1) or row not in range(1, size + 1):
+            raise Exception("Invalid Index")
+
+        return (column - 1) * size + row - 1
 
     def get_value(self, column:int, row:int) -> Cell_Value:
         '''
         Method to get a value of a specific cell of the sudoku.
 
         Parameters:
-            - column - column index of the cell (integer between 1 and 9)
-            - row - row index of the cell (integer between 1 and 9)
+            - column - column index of the cell (integer between 1 and the size)
+            - row - row index of the cell (integer between 1 and the size)
 
         Returns:
             - cell value - the value of the cell as the Cell_Value enum
         '''
 
-        # Check that the parameters are valid
-        if type(column) is not int or type(row) is not int or column not in range(1, 10) or row not in range(1, 10):
-            raise Exception("Invalid Index")
+        # Get the value stored in the grid
+        value = self.__grid[self.__index(column, row)]
+
+        # Check that the value can be represented by the Cell_Value enum
+        if value >= len(CELL_VALUES):
+            raise Exception("Invalid Value. Use get_number for values larger than 9")
 
         # Return the value stored in the grid
-        return self.__grid[row-1][column-1]
+        return CELL_VALUES[value]
 
     def set_value(self, column:int, row:int, value:Cell_Value) -> None:
         '''
         Method to set a value of a specific cell of the sudoku.
 
         Parameters:
-            - column - column index of the cell (integer between 1 and 9)
-            - row - row index of the cell (integer between 1 and 9)
+            - column - column index of the cell (integer between 1 and the size)
+            - row - row index of the cell (integer between 1 and the size)
             - value - value of the cell as a Cell_Value enum
         '''
 
         # Check that the value parameter is valid
-        if type(value) is not Cell_Value:
+        if type(value) is not Cell_Value or value.value > self.__layout.size:
             raise Exception("Invalid Value")
 
-        # Check that the column and row coordinates are valid
-        if type(column) is not int or type(row) is not int or column not in range(1, 10) or row not in range(1, 10):
-            raise Exception("Invalid Index")
+        # Update the grid with the new value
+        self._set_cell(self.__index(column, row), value.value)
+
+    def get_number(self, column:int, row:int) -> int:
+        '''
+        Method to get the integer value of a specific cell of the sudoku.
+
+        Parameters:
+            - column - column index of the cell (integer between 1 and the size)
+            - row - row index of the cell (integer between 1 and the size)
+
+        Returns:
+            - integer value of the cell (0 for empty)
+        '''
+
+        return self.__grid[self.__index(column, row)]
+
+    def set_number(self, column:int, row:int, value:int) -> None:
+        '''
+        Method to set the integer value of a specific cell of the sudoku.
+
+        Parameters:
+            - column - column index of the cell (integer between 1 and the size)
+            - row - row index of the cell (integer between 1 and the size)
+            - value - integer value of the cell (between 1 and the size, or 0 for empty)
+        '''
+
+        # Check that the value parameter is valid
+        if type(value) is not int or value not in range(0, self.__layout.size + 1):
+            raise Exception("Invalid Value")
+
+        # Update the grid with the new value
+        self._set_cell(self.__index(column, row), value)
+
+    def _get_cell(self, index:int) -> int:
+        '''
+        Method to get the integer value of a cell without any validation. For use within the package only.
+
+        Parameters:
+            - index - index of the cell in seed order
+
+        Returns:
+            - integer value of the cell (0 for empty)
+        '''
+
+        return self.__grid[index]
+
+    def _set_cell(self, index:int, value:int) -> None:
+        '''
+        Method to set the integer value of a cell without any validation. For use within the package only.
+
+        Parameters:
+            - index - index of the cell in seed order
+            - value - integer value of the cell (0 for empty)
+        '''
+
+        grid, masks, counts = self.__grid, self.__masks, self.__counts
+        stride = self.__layout.size + 1
+
+        # Remove the old value from the counts and masks of the row, column and box
+        old = grid[index]
+        if old != 0:
+            bit = 1 << old
+            for unit in self.__layout.cell_units[index]:
+                counts[unit * stride + old] -= 1
+                if counts[unit * stride + old] == 0:
+                    masks[unit] &= ~bit
+                else:
+                    self.__conflicts -= 1
+        else:
+            self.__empty -= 1
 
         # Update the grid with the new value
-        self.__grid[row-1][column-1] = value
+        grid[index] = value
+
+        # Add the new value to the counts and masks of the row, column and box
+        if value != 0:
+            bit = 1 << value
+            for unit in self.__layout.cell_units[index]:
+                if counts[unit * stride + value] != 0:
+                    self.__conflicts += 1
+                counts[unit * stride + value] += 1
+                masks[unit] |= bit
+        else:
+            self.__empty += 1
+
+    def __rebuild_units(self) -> None:
+        '''
+        Method to rebuild the unit masks and counts from the values in the grid (expects them to be empty).
+        '''
+
+        grid, masks, counts = self.__grid, self.__masks, self.__counts
+        stride = self.__layout.size + 1
+
+        # Loop through all the filled cells adding their value to the row, column and box
+        for index in range(self.__layout.cells):
+            value = grid[index]
+            if value == 0: continue
+
+            self.__empty -= 1
+
+            bit = 1 << value
+            for unit in self.__layout.cell_units[index]:
+                if counts[unit * stride + value] != 0:
+                    self.__conflicts += 1
+                counts[unit * stride + value] += 1
+                masks[unit] |= bit
+
+    def _options_mask(self, index:int) -> int:
+        '''
+        Method to get the bit mask of valid options for a cell without any validation. For use within the
+        package only.
+
+        Parameters:
+            - index - index of the cell in seed order
+
+        Returns:
+            - bit mask of the values which are not present elsewhere in the row, column or box of the cell
+        '''
+
+        masks, counts = self.__masks, self.__counts
+        row, column, box = self.__layout.cell_units[index]
+
+        # Get the masks of the values present in the row, column and box
+        row_mask, column_mask, box_mask = masks[row], masks[column], masks[box]
+
+        # Ignore the value of the cell itself, unless it also appears elsewhere in the unit
+        value = self.__grid[index]
+        if value != 0:
+            bit = 1 << value
+            stride = self.__layout.size + 1
+            if counts[row * stride + value] == 1: row_mask &= ~bit
+            if counts[column * stride + value] == 1: column_mask &= ~bit
+            if counts[box * stride + value] == 1: box_mask &= ~bit
+
+        # Return the mask of values not present in the row, column or box
+        return self.__layout.full_mask & ~(row_mask | column_mask | box_mask)
+
+    def __unit_values(self, unit:int, ignore=None) -> list:
+        '''
+        Method to get all unique values in a unit of the sudoku.
+
+        Parameters:
+            - unit - index of the unit
+            - ignore (optional) - index of a cell to ignore in the list of values
+
+        Returns:
+            - list of the unique integer values in the unit (excluding the potential ignored cell)
+        '''
+
+        return list(set(self.__grid[index] for index in self.__layout.unit_cells[unit] if index != ignore))
+
+    def __to_cell_values(self, values:list) -> list:
+        '''
+        Method to convert a list of integer values to a list of Cell_Value enums.
+
+        Parameters:
+            - values - list of integer values
+
+        Returns:
+            - list of the Cell_Value enums of the values
+        '''
+
+        # Check that the values can be represented by the Cell_Value enum
+        if any(value >= len(CELL_VALUES) for value in values):
+            raise Exception("Invalid Value. Use the integer methods for values larger than 9")
+
+        return [CELL_VALUES[value] for value in values]
 
     def get_row_values(self, row:int, ignore=None) -> list:
         '''
         Method to get all unique values in a specified row of the sudoku.
 
         Parameters:
-            - row - row index of the cell (integer between 1 and 9)
+            - row - row index of the cell (integer between 1 and the size)
             - ignore (optional) - column index of a cell to ignore in the list of values
 
         Returns:
             - list of unique cell values in the specified row (excluding potential ignored column)
         '''
 
+        size = self.__layout.size
+
         # Check that the row coordinate is valid
-        if type(row) is not int or row not in range(1, 10):
+        if type(row) is not int or row not in range(1, size + 1):
             raise Exception("Invalid Index")
 
         # Check that the ignore coordinate is valid
-        if ignore is not None and (type(ignore) is not int or ignore not in range(1, 10)):
+        if ignore is not None and (type(ignore) is not int or ignore not in range(1, size + 1)):
             raise Exception("Invalid Index")
 
-        # Set for all the unique values in the row (using set to remove duplicates)
-        values = set()
-
-        # Loop through all the cells in the row
-        for column in range(1, 10):
-            # If the cell is being ignored, skip the column
-            if ignore is not None and column == ignore: continue
-
-            # Add the cell value to the set
-            values.add(self.get_value(column, row))
+        # Get the unique values in the row, ignoring the cell in the ignored column
+        values = self.__unit_values(row - 1, None if ignore is None else (ignore - 1) * size + row - 1)
 
         # Return the collection of values as a list
-        return list(values)
+        return self.__to_cell_values(values)
 
     def get_column_values(self, column:int, ignore=None) -> list:
         '''
         Method to get all unique values in a specified column of the sudoku.
 
         Parameters:
-            - column - column index of the cell (integer between 1 and 9)
+            - column - column index of the cell (integer between 1 and the size)
             - ignore (optional) - row index of a cell to ignore in the list of values
 
         Returns:
             - list of unique cell values in the specified column (excluding potential ignored row)
         '''
 
+        size = self.__layout.size
+
         # Check that the column coordinate is valid
-        if type(column) is not int or column not in range(1, 10):
+        if type(column) is not int or column not in range(1, size + 1):
             raise Exception("Invalid Index")
 
         # Check that the ignore coordinate is valid
-        if ignore is not None and (type(ignore) is not int or ignore not in range(1, 10)):
+        if ignore is not None and (type(ignore) is not int or ignore not in range(1, size + 1)):
             raise Exception("Invalid Index")
 
-        # Set for all the unique values in the column (using set to remove duplicates)
-        values = set()
-
-        # Loop through all the cells in the column
-        for row in range(1, 10):
-            # If the cell is being ignored, skip the row
-            if ignore is not None and row == ignore: continue
-
-            # Add the cell value to the set
-            values.add(self.get_value(column, row))
+        # Get the unique values in the column, ignoring the cell in the ignored row
+        values = self.__unit_values(size + column - 1, None if ignore is None else (column - 1) * size + ignore - 1)
 
         # Return the collection of values as a list
-        return list(values)
+        return self.__to_cell_values(values)
 
     def get_box_values(self, column:int, row:int, ignore=False) -> list:
         '''
         Method to get all unique values in a specified box of the sudoku.
 
         Parameters:
-            - column - column index of the cell (integer between 1 and 9)
-            - row - row index of the cell (integer between 1 and 9)
+            - column - column index of the cell (integer between 1 and the size)
+            - row - row index of the cell (integer between 1 and the size)
             - ignore (optional) - boolean whether to ignore cell in the list of values (default False)
 
         Returns:
@@ -205,58 +452,54 @@ class Sudoku:
         '''
 
         # Check that the row and column coordinate is valid
-        if type(column) is not int or type(row) is not int or column not in range(1, 10) or row not in range(1, 10):
-            raise Exception("Invalid Index")
+        index = self.__index(column, row)
 
         # Check that the ignore coordinate is valid
         if type(ignore) is not bool:
             raise Exception("Invalid Ignore")
 
-        # Set for all the unique values in the box (using set to remove duplicates)
-        values = set()
-
-        # Calculate the top left corner index of the box that contains the cell
-        box_row = math.floor((row-1)/3) * 3 + 1
-        box_column = math.floor((column-1)/3) * 3 + 1
-
-        # Loop through all cells in the box
-        for row_index in range(box_row, box_row + 3):
-            for column_index in range(box_column, box_column + 3):
-                # If the cell is being ignored, skip it
-                if ignore and row_index == row and column_index == column: continue
-
-                # Add the cell value to the set
-                values.add(self.get_value(column_index, row_index))
+        # Get the unique values in the box of the cell, ignoring the cell itself if requested
+        values = self.__unit_values(self.__layout.cell_units[index][2], index if ignore else None)
 
         # Return the collection of values as a list
-        return list(values)
+        return self.__to_cell_values(values)
 
     def cell_options(self, column:int, row:int) -> list:
         '''
         Method to get all valid options to be put in a specific box of the sudoku.
 
         Parameters:
-            - column - column index of the cell (integer between 1 and 9)
-            - row - row index of the cell (integer between 1 and 9)
+            - column - column index of the cell (integer between 1 and the size)
+            - row - row index of the cell (integer between 1 and the size)
 
         Returns:
             - list of valid options for the cell value of the specified cell
         '''
 
         # Check that the row and column coordinate is valid
-        if type(column) is not int or type(row) is not int or column not in range(1, 10) or row not in range(1, 10):
-            raise Exception("Invalid Index")
+        index = self.__index(column, row)
+
+        # Check that the options can be represented by the Cell_Value enum
+        if self.__layout.size > 9:
+            raise Exception("Invalid Value. Use number_options for grids larger than 9 x 9")
 
-        # Create a set of all potential values
-        options = set([Cell_Value(x) for x in range(1, 10)])
+        # Return the list of values not present in the row, column or box
+        return list(MASK_VALUES[self._options_mask(index)])
 
-        # Remove any cell values present in the row, column and box
-        options -= set(self.get_row_values(row, ignore=column))
-        options -= set(self.get_column_values(column, ignore=row))
-        options -= set(self.get_box_values(column, row, ignore=True))
+    def number_options(self, column:int, row:int) -> list:
+        '''
+        Method to get all valid integer values to be put in a specific cell of the sudoku.
 
-        # Return the collection of valid values as a list
-        return list(options)
+        Parameters:
+            - column - column index of the cell (integer between 1 and the size)
+            - row - row index of the cell (integer between 1 and the size)
+
+        Returns:
+            - list of valid integer values for the specified cell
+        '''
+
+        # Return the list of values not present in the row, column or box
+        return list(self.__layout.mask_values[self._options_mask(self.__index(column, row))])
 
     def valid(self, empty_as_valid=False) -> bool:
         '''
@@ -269,22 +512,47 @@ class Sudoku:
             - bool - whether the existing sudoku grid is valid
         '''
 
-        # Loop through all cells in the sudoku grid
-        for column in range(1, 10):
-            for row in range(1, 10):
-                # Get the list of all valid options for the cell
-                options = self.cell_options(column, row)
+        # The grid is invalid if any value is repeated in a row, column or box
+        if self.__conflicts != 0:
+            return False
+
+        # If specified to accept empty cells, the grid is valid
+        if empty_as_valid:
+            return True
+
+        # Otherwise the grid is only valid if there are no empty cells
+        return self.__empty == 0
+
+    def conflicting_cells(self) -> list:
+        '''
+        Method to find the cells whose value is repeated in their row, column or box.
+
+        Returns:
+            - list of (column, row) coordinates of the conflicting cells
+        '''
+
+        # If there are no repeated values, no cells conflict
+        if self.__conflicts == 0:
+            return []
+
+        grid, counts = self.__grid, self.__counts
+        size = self.__layout.size
+
+        # List of the coordinates of conflicting cells
+        cells = []
 
-                # If specified to accept empty cells, add this to the valid list
-                if empty_as_valid:
-                    options += [Cell_Value.EMPTY]
+        # Loop through all filled cells, checking if their value appears more than once in any of their units
+        for index in range(self.__layout.cells):
+            value = grid[index]
+            if value == 0: continue
 
-                # Check that the actual cell value is in the list of valid options
-                if self.get_value(column, row) not in options:
-                    return False
+            for unit in self.__layout.cell_units[index]:
+                if counts[unit * (size + 1) + value] > 1:
+                    cells += [(index // size + 1, index % size + 1)]
+                    break
 
-        # If all cells have passed the check, return valid
-        return True
+        # Return the list of conflicting cells
+        return cells
 
     def fill(self, clear=False, find_all=False) -> None:
         '''
@@ -304,90 +572,271 @@ class Sudoku:
         elif not self.valid(empty_as_valid=True):
             raise Exception("Existing Sudoku Grid is not Valid")
 
-        # List of empty cells locations
-        empty = []
+        # If all the cells are already filled, return
+        if self.__empty == 0:
+            return [self.get_seed()] if find_all else None
 
-        # Loop through all cells in the grid to identify the empty locations
-        for column in range(1, 10):
-            for row in range(1, 10):
-                if self.get_value(column, row) == Cell_Value.EMPTY:
-                    empty += [(column, row)]
+        # If it is looking for all seeds, return the seeds of every filled grid
+        if find_all:
+            return list(self.iter_solutions())
 
-        # If all the cells are already filled, return
-        if len(empty) == 0:
-            return
+        # List of the indices of the empty cells in the grid
+        empty = [index for index in range(self.__layout.cells) if self.__grid[index] == 0]
 
-        # Randomly shuffle the cell locations
-        random.shuffle(empty)
+        # Fill the sudoku in place with the cheap forward checking search, stopping at the first filled grid
+        # (the candidate grid search is only used where its techniques pay off, when counting solutions).
+        # A search which takes too many steps is restarted in a new random order with a larger budget, as a
+        # few unlucky early choices can leave a large grid with a huge search
+        budget = [FILL_BUDGET * self.__layout.cells]
+        while True:
+            # Randomly shuffle the empty cells (used to break ties when choosing the next cell to fill)
+            random.shuffle(empty)
+            remaining = budget[:]
 
-        # Initialise the list of all seeds if find_all is True
-        if find_all:
-            self.__seeds = list()
+            for _ in self.__fill_forward(empty, remaining):
+                return
+
+            # If the whole search was run without running out of steps, the sudoku can not be filled
+            if remaining[0] > 0:
+                break
 
-        # Call the recursive function to fill the sudoku grid
-        if not self.__fill_backtrack(empty, find_all):
-            # If it is looking for all seeds it returns them
-            if find_all:
-                # Get the list of all seeds, delete it from the object and return it
-                seeds = self.__seeds
-                del self.__seeds
-                return seeds
+            budget[0] *= 2
 
-            raise Exception("Could not find a valid sudoku grid")
+        raise Exception("Could not find a valid sudoku grid")
 
-    def __fill_backtrack(self, locations:list, find_all=False) -> bool:
+    def count_solutions(self, limit=2) -> tuple:
         '''
-        Recursive method to fill a sudoku with valid values, to create a valid filled in sudoku grid.
+        Method to count the number of ways the empty cells of the sudoku can be filled, stopping as soon as
+        the limit is reached. The sudoku itself is not changed.
 
         Parameters:
-            - locations - list of remaining locations in the sudoku which are empty (yet to be filled)
-            - find_all (optional) - whether to find just one sudoku or many
+            - limit (optional) - number of solutions after which to stop counting (default is 2, None counts all)
 
         Returns:
-            - bool - whether a valid sudoku has been created
+            - number of solutions found (at most the limit)
+            - list of the seeds of the first two distinct solutions found
         '''
 
-        # Base Case - if the list of locations yet to be filled is empty (i.e. sudoku is full)
-        if len(locations) == 0:
-            self.print_terminal()
+        # Check that the limit is valid
+        if limit is not None and (type(limit) is not int or limit < 1):
+            raise Exception("Invalid Limit")
 
-            # If all sudoku grids are to be found, add the current seed to the list, and carry on searching
-            if find_all:
-                self.__seeds += [self.get_seed()]
-                return True
+        # A sudoku with repeated values has no solutions
+        if not self.valid(empty_as_valid=True):
+            return 0, []
 
-            return True
+        count = 0
+        solutions = []
+
+        # Loop through the filled grids found by the search
+        for values in self.__solutions():
+            count += 1
+
+            # Keep the seeds of the first two solutions
+            if len(solutions) < 2:
+                solutions += [Cell_Value.encode_seed(values)]
+
+            # Stop searching once the limit is reached
+            if limit is not None and count >= limit:
+                break
+
+        # Return the number of solutions and the first solutions found
+        return count, solutions
+
+    def iter_solutions(self):
+        '''
+        Generator to lazily find all the ways the empty cells of the sudoku can be filled, in a random order.
+        The search runs on its own candidate grid, so the sudoku itself is not changed.
+
+        Yields:
+            - seed of each valid filled in sudoku grid, as soon as the search finds it
+        '''
+
+        # A sudoku with repeated values has no solutions
+        if not self.valid(empty_as_valid=True):
+            return
+
+        # Yield the seed of each filled grid found by the search
+        for values in self.__solutions():
+            yield Cell_Value.encode_seed(values)
+
+    def __solutions(self):
+        '''
+        Generator to set up the candidate grid of the sudoku and search it for filled grids.
+
+        Yields:
+            - values of each filled grid found by the search
+        '''
+
+        # Create the candidates of every cell from the filled cells of the grid
+        candidates = Candidate_Grid(self.__layout.size)
+        if not candidates.load(self.__grid):
+            return
+
+        # Random order to scan the cells in (used to break ties when choosing the next cell to fill)
+        order = list(range(self.__layout.cells))
+        random.shuffle(order)
+
+        yield from self.__fill_backtrack(candidates, order)
+
+    def __fill_backtrack(self, candidates:Candidate_Grid, order:list):
+        '''
+        Recursive generator to fill a candidate grid with valid values, to create valid filled in sudoku grids.
+        Resuming the generator carries on searching for the next filled grid.
+
+        Before each choice the candidates are propagated to a fixed point (singles, pairs and pointing), so
+        most cells are filled without branching. The unfilled cell with the fewest candidates is then tried
+        with each of its candidates on a copy of the grid.
+
+        The propagation pays off when proving a puzzle has no other solutions. Filling a grid uses the
+        cheaper forward checking search instead.
+
+        Parameters:
+            - candidates - candidate grid holding the values and candidates of the cells
+            - order - order to scan the cells in when choosing the next cell to fill
+
+        Yields:
+            - values of the grid every time it has been completely filled
+        '''
+
+        # If the propagation finds a contradiction, the grid can not be filled
+        if not candidates.propagate():
+            return
 
-        # Get the next location to be filled off the list
-        location = locations[0]
-        column, row = location
+        values, masks = candidates.values, candidates.masks
 
-        # Get the list of options for values which can go into the cell
-        options = self.cell_options(column, row)
+        # Find the unfilled cell with the fewest candidates, ties are broken by the (random) order
+        index, size = -1, self.__layout.size + 1
+        for cell in order:
+            if values[cell] == 0:
+                current_size = bin(masks[cell]).count("1")
+                if current_size < size:
+                    index, size = cell, current_size
 
-        # Shuffle the list of options
+                    # Propagation fills every cell with a single candidate, so two is the fewest possible
+                    if size <= 2: break
+
+        # Base Case - if there are no unfilled cells (i.e. sudoku is full)
+        if index == -1:
+            yield values
+            return
+
+        # Get the list of candidates of the cell and shuffle it
+        options = self.__layout.mask_values[masks[index]][:]
         random.shuffle(options)
 
-        # Loop through the list of options
-        for option in options:
+        # Try each candidate on a copy of the grid, recursively filling the remaining cells
+        for value in options:
+            child = candidates.copy()
+            try:
+                child.assign(index, value)
+            except Contradiction:
+                continue
+
+            yield from self.__fill_backtrack(child, order)
+
+    def __fill_forward(self, empty:list, budget:list):
+        '''
+        Recursive generator to fill the sudoku in place with valid values. Each time a value is generated the
+        grid is completely filled, and resuming the generator carries on searching for the next filled grid.
+
+        The empty cell with the fewest options is filled first. After each value is tried, only the cells
+        sharing a row, column or box with the filled cell are checked for having no options left, and only
+        the row, column and box of the filled cell are checked for a value having nowhere left to go.
+
+        Parameters:
+            - empty - list of the indices of the cells in the sudoku which are empty (yet to be filled)
+            - budget - list holding the number of values left to try, the search stops once it reaches zero
+
+        Yields:
+            - None - every time the sudoku grid has been completely filled
+        '''
+
+        # Base Case - if the list of cells yet to be filled is empty (i.e. sudoku is full)
+        if len(empty) == 0:
+            yield
+            return
+
+        # Stop searching once the budget has run out
+        if budget[0] <= 0:
+            return
+
+        grid, masks = self.__grid, self.__masks
+        layout = self.__layout
+        cell_units, full_mask, mask_sizes = layout.cell_units, layout.full_mask, layout.mask_sizes
+
+        # Find the empty cell with the fewest options, ties are broken by the (random) order of the list
+        position, options, size = 0, 0, layout.size + 1
+        for current, index in enumerate(empty):
+            row, column, box = cell_units[index]
+            current_options = full_mask & ~(masks[row] | masks[column] | masks[box])
+
+            if mask_sizes[current_options] < size:
+                position, options, size = current, current_options, mask_sizes[current_options]
+
+                # A cell can not have fewer than one option (no options means the sudoku can not be filled)
+                if size <= 1: break
+
+        # If the cell has no options, the sudoku can not be filled
+        if size == 0:
+            return
+
+        # Remove the chosen cell from the list of empty cells (by moving the last cell into its place)
+        index = empty[position]
+        empty[position] = empty[-1]
+        empty.pop()
+
+        # Get the list of options for values which can go into the cell and shuffle it
+        values = layout.mask_values[options][:]
+        random.shuffle(values)
+
+        # Loop through the list of options (until the budget runs out)
+        for value in values:
+            if budget[0] <= 0:
+                break
+            budget[0] -= 1
+
             # Try setting the cell to that value
-            self.set_value(column, row, option)
+            self._set_cell(index, value)
 
-            # Check if all other empty cells still have a valid option after this cell has been set
+            # Check if all other empty cells in the row, column and box still have an option (naked singles)
             valid = True
-            for location in locations[1:]:
-                if len(self.cell_options(location[0], location[1])) == 0:
+            for peer in layout.cell_peers[index]:
+                if grid[peer] != 0: continue
+
+                row, column, box = cell_units[peer]
+                if masks[row] | masks[column] | masks[box] == full_mask:
                     valid = False
+                    break
+
+            # Check if every value still has a place in the row, column and box of the filled cell (hidden
+            # singles)
+            if valid:
+                for unit in cell_units[index]:
+                    placed = masks[unit]
+                    for cell in layout.unit_cells[unit]:
+                        if grid[cell] != 0: continue
+
+                        row, column, box = cell_units[cell]
+                        placed |= full_mask & ~(masks[row] | masks[column] | masks[box])
+
+                    if placed != full_mask:
+                        valid = False
+                        break
 
-            # If the sudoku can still be filled, recursively call the fill method with the list of remaining locations
-            if valid and self.__fill_backtrack(locations[1:]):
-                return True
+            # If the sudoku can still be filled, recursively call the fill method with the remaining cells
+            if valid:
+                yield from self.__fill_forward(empty, budget)
 
-            # If the chosen value did not result in a valid sudoku, replace it with an empty value
-            self.set_value(column, row, Cell_Value.EMPTY)
+        # Once all of the options have been tried, replace the value with an empty value
+        self._set_cell(index, 0)
 
-        # If none of the options created a valid sudoku, return false
-        return False
+        # Put the cell back in its original place in the list of empty cells
+        if position == len(empty):
+            empty.append(index)
+        else:
+            empty.append(empty[position])
+            empty[position] = index
 
     def print_terminal(self, size="small") -> None:
         '''
@@ -405,6 +854,27 @@ class Sudoku:
         else:
             raise ValueError("Invalid Size. Size parameter must either be 'small' or 'big' (default is 'small')")
 
+    def __cell_string(self, column:int, row:int) -> str:
+        '''
+        Method to get the string representation of a cell, padded to the width of the largest value.
+
+        Parameters:
+            - column - column index of the cell (integer between 1 and the size)
+            - row - row index of the cell (integer between 1 and the size)
+
+        Returns:
+            - string of the cell value (blank for an empty cell)
+        '''
+
+        # Width of the largest value in the grid
+        width = len(str(self.__layout.size))
+
+        # Get the value of the cell
+        value = self.get_number(column, row)
+
+        # Return a blank string for an empty cell, else the number
+        return " " * width if value == 0 else str(value).rjust(width)
+
     def __print_terminal_small(self) -> None:
         '''
         Method to print the sudoku to the terminal in the small format.
@@ -413,29 +883,36 @@ class Sudoku:
             - terminal - sudoku in small format
         '''
 
+        layout = self.__layout
+        box_height, box_width = layout.box_height, layout.box_width
+
+        # Horizontal line across one box (a space either side of each cell value)
+        line = "━" * (1 + box_width * (len(str(layout.size)) + 1))
+        stacks = layout.size // box_width
+
         # Top border of the sudoku
-        string = "┏━━━━━━━┳━━━━━━━┳━━━━━━━┓" + "\n"
+        string = "┏" + "┳".join([line] * stacks) + "┓" + "\n"
 
         # Loop through each row of the sudoku
-        for row in range(1, 10):
+        for row in range(1, layout.size + 1):
             # If the current row is the first of a new box
-            if row in [4, 7]:
-                string += "┣━━━━━━━╋━━━━━━━╋━━━━━━━┫" + "\n"
+            if row != 1 and (row - 1) % box_height == 0:
+                string += "┣" + "╋".join([line] * stacks) + "┫" + "\n"
 
             # Loop through each column of the row
-            for column in range(1, 10):
+            for column in range(1, layout.size + 1):
                 # If the current column is the first of a new box
-                if column in [1, 4, 7]:
+                if (column - 1) % box_width == 0:
                     string += "┃ "
 
                 # Add the cell value to the string
-                string += str(self.get_value(column, row)) + " "
+                string += self.__cell_string(column, row) + " "
 
             # Add the right border to the line
             string += "┃" + "\n"
 
         # Bottom border of the sudoku
-        string += "┗━━━━━━━┻━━━━━━━┻━━━━━━━┛" + "\n"
+        string += "┗" + "┻".join([line] * stacks) + "┛" + "\n"
 
         # Print the sudoku
         print(string)
@@ -448,35 +925,43 @@ class Sudoku:
             - terminal - sudoku in large format
         '''
 
+        layout = self.__layout
+        box_height, box_width = layout.box_height, layout.box_width
+        stacks = layout.size // box_width
+
+        # Horizontal lines across one cell (a space either side of each cell value)
+        thick = "━" * (len(str(layout.size)) + 2)
+        thin = "─" * (len(str(layout.size)) + 2)
+
         # Top border of the sudoku
-        string = "┏━━━┯━━━┯━━━┳━━━┯━━━┯━━━┳━━━┯━━━┯━━━┓" + "\n"
+        string = "┏" + "┳".join(["┯".join([thick] * box_width)] * stacks) + "┓" + "\n"
 
         # Loop through each row of the sudoku
-        for row in range(1, 10):
+        for row in range(1, layout.size + 1):
             # If the current row is the first of a new box add thick horizontal, else thin
-            if row in [4, 7]:
-                string += "┣━━━┿━━━┿━━━╋━━━┿━━━┿━━━╋━━━┿━━━┿━━━┫" + "\n"
-            elif row in [2, 3, 5, 6, 8, 9]:
-                string += "┠───┼───┼───╂───┼───┼───╂───┼───┼───┨" + "\n"
+            if row != 1 and (row - 1) % box_height == 0:
+                string += "┣" + "╋".join(["┿".join([thick] * box_width)] * stacks) + "┫" + "\n"
+            elif row != 1:
+                string += "┠" + "╂".join(["┼".join([thin] * box_width)] * stacks) + "┨" + "\n"
 
             # Loop through each column of the row
-            for column in range(1, 10):
+            for column in range(1, layout.size + 1):
                 # If the current column is the first of a new box
-                if column in [1, 4, 7]:
+                if (column - 1) % box_width == 0:
                     string += "┃ "
 
                 # Add the cell value to the string
-                string += str(self.get_value(column, row)) + " "
+                string += self.__cell_string(column, row) + " "
 
                 # If the current column is not the last of a box
-                if column in [1, 2, 4, 5, 7, 8]:
+                if column % box_width != 0:
                     string += "│ "
 
             # Add the right border to the line
             string += "┃" + "\n"
 
         # Bottom border of the sudoku
-        string += "┗━━━┷━━━┷━━━┻━━━┷━━━┷━━━┻━━━┷━━━┷━━━┛" + "\n"
+        string += "┗" + "┻".join(["┷".join([thick] * box_width)] * stacks) + "┛" + "\n"
 
         # Print the sudoku
         print(string)
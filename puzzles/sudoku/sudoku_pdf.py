@@ -132,6 +132,14 @@ class Sudoku_PDF(PDF):
             - start_y - Starting y coordinate for the sudoku grid
         '''
 
+        # Get the dimensions of the grid and its boxes
+        size = sudoku.get_size()
+        box_height, box_width = sudoku.get_box_size()
+
+        # Scale the cells and font so that the grid covers the same area as a 9 x 9 grid
+        cell_dim = styling[self.page_size]["cell_dim"] * 9 / size
+        font_size = styling[self.page_size]["font_size"] * 9 / size
+
         # Set the starting coordinates of the sudoku grid
         self.set_xy(start_x, start_y)
 
@@ -139,19 +147,22 @@ class Sudoku_PDF(PDF):
         x, y = self.get_x(), self.get_y()
 
         # Set the font of the sudoku grid
-        self.set_font(family=self.font, style="", size=styling[self.page_size]["font_size"])
+        self.set_font(family=self.font, style="", size=font_size)
 
         # Set the line width for the border of each cell
         self.set_line_width(styling[self.page_size]["thin_width"])
 
         # Loop through the sudoku grid, adding each value as a bordered cell in the document
-        for row in range(1, 10):
-            for column in range(1, 10):
-                self.cell(w=styling[self.page_size]["cell_dim"],
-                             h=styling[self.page_size]["cell_dim"],
-                             txt=str(sudoku.get_value(column, row)),
+        for row in range(1, size + 1):
+            for column in range(1, size + 1):
+                # Get the value of the cell (empty cells are left blank)
+                value = sudoku.get_number(column, row)
+
+                self.cell(w=cell_dim,
+                             h=cell_dim,
+                             txt=str(value) if value != 0 else " ",
                              border=1,
-                             ln=0 if column < 9 else 1,
+                             ln=0 if column < size else 1,
                              align="C")
 
             # Every time a new line is needed, set the x location to the starting x location given
@@ -160,16 +171,16 @@ class Sudoku_PDF(PDF):
         # Set the line width to the thicker value used to outline the groups of cells
         self.set_line_width(styling[self.page_size]["thick_width"])
 
-        # Loop through the locations to place the thicker lines
-        for i in [0, 3, 6, 9]:
-            # Add a vertical line
-            self.line(x + i * styling[self.page_size]["cell_dim"],
+        # Loop through the locations to place the thicker vertical lines
+        for i in range(0, size + 1, box_width):
+            self.line(x + i * cell_dim,
                           y,
-                          x + i * styling[self.page_size]["cell_dim"],
-                          y + 9 * styling[self.page_size]["cell_dim"])
+                          x + i * cell_dim,
+                          y + size * cell_dim)
 
-            # Add a horizontal line
+        # Loop through the locations to place the thicker horizontal lines
+        for i in range(0, size + 1, box_height):
             self.line(x,
-                          y + i * styling[self.page_size]["cell_dim"],
-                          x + 9 * styling[self.page_size]["cell_dim"],
-                          y + i * styling[self.page_size]["cell_dim"])
+                          y + i * cell_dim,
+                          x + size * cell_dim,
+                          y + i * cell_dim)
@@ -5,6 +5,11 @@ from .sudoku import Sudoku
 from .seed_manager import *
 from .sudoku_pdf import Sudoku_PDF
 from .create_difficulty import *
+from .grader import grade_puzzle
+from .cell_value import Cell_Value
+
+# Number of puzzles to try when generating a puzzle of a difficulty level before using the hardest one found
+GENERATE_ATTEMPTS = 100
 
 class Sudoku_Puzzle(I_Puzzle):
 
@@ -19,6 +24,7 @@ class Sudoku_Puzzle(I_Puzzle):
 
         # Set the difficulty level of the puzzle as undefined
         self.__difficulty = Difficulty.UNDEFINED
+        self.__grade = None
 
     def __str__(self):
         return "Sudoku puzzle. Difficulty: " + str(self.__difficulty) + " Puzzle seed: " + str(self.__puzzle.get_seed()) + " Solution seed: " + str(self.__solution.get_seed())
@@ -43,39 +49,118 @@ class Sudoku_Puzzle(I_Puzzle):
 
         self.__solution.print_terminal(size=size)
 
-    def generate(self, difficulty : Difficulty, seed=None) -> None:
+    def generate(self, difficulty : Difficulty, seed=None, size=9, clues=None, symmetry=Symmetry.NONE) -> None:
         '''
         Method to generate a sudoku puzzle.
 
         Parameters:
             - difficulty - the level of difficulty the generated puzzle should have (Difficulty enum)
             - seed (optional) - the seed to use for the puzzle, if not included it uses a random one
+            - size (optional) - the number of rows, columns and boxes in the grid (default is 9)
+            - clues (optional) - the number of filled cells the puzzle should have (default is as few as the
+              difficulty level allows)
+            - symmetry (optional) - the symmetry of the pattern of filled cells (Symmetry enum, default is none)
         '''
 
-        # Set the difficulty of the puzzle as a class variable
-        self.__difficulty = difficulty
-
-        # Check that the seed given is valid
-        if seed is not None and (type(seed) is not str or not Sudoku(seed).valid()):
+        # Check that the seed given is valid (raises an exception for an invalid size)
+        if seed is not None and (type(seed) is not str or not Sudoku(seed, size=size).valid()):
             raise Exception("Invalid seed parameter. Must be a valid seed.")
 
-        # If the seed is not given, find a random one
-        if seed is None:
-            seed = get_seed()
+        # Check that the clues and symmetry are valid
+        if clues is not None and (type(clues) is not int or clues < 0 or clues > size * size):
+            raise Exception("Invalid Clues")
+
+        if type(symmetry) is not Symmetry:
+            raise Exception("Invalid Symmetry")
+
+        # Function to remove the cells for each difficulty level
+        generators = {
+            Difficulty.EASY : generate_easy,
+            Difficulty.MEDIUM : generate_medium,
+            Difficulty.HARD : generate_hard,
+            Difficulty.EXTREME : generate_extreme
+        }
+
+        # Try creating puzzles until one is graded at the requested difficulty level with the requested number
+        # of clues, otherwise keeping the hardest one found (every attempt is at most as hard as the requested
+        # level) with the closest number of clues
+        best = None
+        for _ in range(GENERATE_ATTEMPTS if difficulty in generators else 1):
+            # If the seed is not given, find a random one, transforming a grid from the seed bank (which only
+            # holds 9 x 9 grids) so that each attempt gets a different grid
+            if seed is not None:
+                solution_seed = seed
+            elif size == 9:
+                solution_seed = get_seed(transform=True)
+            else:
+                solution = Sudoku(size=size)
+                solution.fill()
+                solution_seed = solution.get_seed()
+
+            # Create the puzzle from the seed and remove squares depending on the difficulty requested
+            puzzle = Sudoku(solution_seed, size=size)
+            if difficulty in generators:
+                puzzle = generators[difficulty](puzzle, clues, symmetry)
+
+            # Grade the puzzle using the techniques needed to solve it, stopping once it is harder than the
+            # requested level (the digging keeps puzzles at most as hard as the level, so this is rare)
+            grade = grade_puzzle(puzzle, limit=difficulty if difficulty in generators else None)
+
+            # Number of clues more or fewer than requested
+            distance = 0 if clues is None else abs(size * size - puzzle.get_seed().count(Cell_Value.EMPTY.seed()) - clues)
+
+            if best is None or (grade[0].value, -distance) > (best[2][0].value, -best[3]):
+                best = (solution_seed, puzzle, grade, distance)
+
+            if grade[0] == difficulty and distance == 0:
+                break
+
+        # Store the puzzle and its solution, with the difficulty level it was graded at
+        solution_seed, self.__puzzle, self.__grade, _ = best
+        self.__solution = Sudoku(solution_seed, size=size)
+        self.__difficulty = self.__grade[0] if difficulty in generators else difficulty
+
+    def get_puzzle_seed(self) -> str:
+        '''
+        Method to get the seed of the puzzle.
+
+        Returns:
+            - seed of the puzzle (empty cells included)
+        '''
+
+        return self.__puzzle.get_seed()
+
+    def get_solution_seed(self) -> str:
+        '''
+        Method to get the seed of the solution of the puzzle.
+
+        Returns:
+            - seed of the filled solution grid
+        '''
+
+        return self.__solution.get_seed()
+
+    def get_difficulty(self) -> Difficulty:
+        '''
+        Method to get the difficulty of the puzzle.
+
+        Returns:
+            - Difficulty the puzzle was generated at
+        '''
+
+        return self.__difficulty
 
-        # Create sudoku grids using the seed for the puzzle and solution
-        self.__puzzle.from_seed(seed)
-        self.__solution.from_seed(seed)
+    def get_grade(self) -> tuple:
+        '''
+        Method to get the grade of the generated puzzle.
 
-        # Remove squares depending on the difficulty requested
-        if difficulty == Difficulty.EASY:
-            self.__puzzle = generate_easy(self.__puzzle)
-        elif difficulty == Difficulty.MEDIUM:
-            self.__puzzle = generate_medium(self.__puzzle)
-        elif difficulty == Difficulty.HARD:
-            self.__puzzle = generate_hard(self.__puzzle)
-        elif difficulty == Difficulty.EXTREME:
-            self.__puzzle = generate_extreme(self.__puzzle)
+        Returns:
+            - Difficulty of the puzzle
+            - hardest technique needed to solve the puzzle (None if no cells were removed)
+            - score of the puzzle, the sum of the scores of the techniques needed
+        '''
+
+        return self.__grade
 
     def to_pdf(self, include_solution : bool, page_size : Page_Size, filepath : str):
         '''
@@ -88,6 +173,23 @@ class Sudoku_Puzzle(I_Puzzle):
             - filepath - string filepath denoting where to save the pdf document to
         '''
 
+        # Render the PDF document and write it to the specified filepath
+        document = self.render_pdf(include_solution, page_size)
+        with open(filepath, "wb") as file:
+            file.write(document)
+
+    def render_pdf(self, include_solution : bool, page_size : Page_Size) -> bytes:
+        '''
+        Method to render the sudoku puzzle as a pdf document in memory, without writing it to a file.
+
+        Parameters:
+            - include_solution - boolean indicating whether to include the solution on the page
+            - page_size - the size of the page the pdf should be (Page_Size enum)
+
+        Returns:
+            - the bytes of the pdf document
+        '''
+
         # Set up a PDF document with the specified page size
         pdf = Sudoku_PDF(page_size)
 
@@ -97,5 +199,5 @@ class Sudoku_Puzzle(I_Puzzle):
                                      self.__puzzle,
                                      self.__solution if include_solution else None)
 
-        # Output the PDF document to the specified filepath
-        pdf.output(filepath, "F")
+        # Output the PDF document as a string, which fpdf encodes as latin-1
+        return pdf.output(dest="S").encode("latin-1")
@@ -0,0 +1,80 @@
+"""
+Tests for the asyncio puzzle service.
+"""
+
+from ..async_puzzle import Async_Sudoku
+from ..sudoku_puzzle import Sudoku_Puzzle
+from ..sudoku import Sudoku
+from ...puzzle import Difficulty, Page_Size
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import pytest
+
+def test_async_sudoku(tmp_path):
+    """
+    Method to test generating puzzles and rendering them from asyncio code.
+
+    The tests generate puzzles concurrently in worker processes and threads, render them to pdf files,
+    and check cancelling calls which are waiting for a slot.
+    """
+
+    async def run():
+        # Positive case - puzzles are generated concurrently in worker processes
+        async with Async_Sudoku(max_concurrent=2) as service:
+            puzzles = await asyncio.gather(*[service.generate(Difficulty.EASY, size=4) for _ in range(3)])
+            for puzzle in puzzles:
+                assert type(puzzle) is Sudoku_Puzzle and puzzle.get_difficulty() == Difficulty.EASY
+                assert Sudoku(puzzle.get_solution_seed(), size=4).valid()
+
+            # Positive case - the pdf is rendered in a worker and written to the file
+            await service.to_pdf(puzzles[0], True, Page_Size.A4, str(tmp_path / "puzzle.pdf"))
+            assert (tmp_path / "puzzle.pdf").read_bytes().startswith(b"%PDF")
+
+        # Positive case - puzzles are generated in a thread executor, one at a time
+        with ThreadPoolExecutor(2) as executor:
+            service = Async_Sudoku(executor, max_concurrent=1)
+            seed = puzzles[0].get_solution_seed()
+
+            first = asyncio.ensure_future(service.generate(Difficulty.MEDIUM, seed=seed, size=4))
+            second = asyncio.ensure_future(service.generate(Difficulty.MEDIUM, seed=seed, size=4))
+            await asyncio.sleep(0)
+
+            # Positive case - a call waiting for a slot is cancelled
+            second.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await second
+
+            puzzle = await first
+            assert puzzle.get_solution_seed() == seed
+
+            await service.close()
+            assert (await service.generate(Difficulty.EASY, seed=seed, size=4)).get_solution_seed() == seed
+
+            # Negative case - errors of the work are raised to the caller
+            with pytest.raises(Exception) as exception:
+                await service.generate(Difficulty.EASY, size=5)
+            assert "Invalid Size" in str(exception.value)
+
+            with pytest.raises(Exception) as exception:
+                await service.to_pdf(None, True, Page_Size.A4, str(tmp_path / "none.pdf"))
+            assert "Invalid Puzzle" in str(exception.value)
+
+        # Negative case - a closed service does not run work
+        service = Async_Sudoku(max_concurrent=1)
+        await service.close()
+        with pytest.raises(Exception) as exception:
+            await service.generate(Difficulty.EASY, size=4)
+        assert "Service Closed" in str(exception.value)
+
+    asyncio.run(run())
+
+    # Negative case - invalid inputs
+    with pytest.raises(Exception) as exception:
+        Async_Sudoku(executor=1)
+    assert "Invalid Executor" in str(exception.value)
+
+    with ThreadPoolExecutor(1) as executor:
+        for max_concurrent in [0, 1.0]:
+            with pytest.raises(Exception) as exception:
+                Async_Sudoku(executor, max_concurrent=max_concurrent)
+            assert "Invalid Max Concurrent" in str(exception.value)
@@ -0,0 +1,205 @@
+"""
+Tests for the batch methods on arrays of Sudoku grids.
+"""
+
+from ..batch import *
+from ..sudoku import Sudoku
+from ..cell_value import Cell_Value
+import numpy as np
+import random
+import pytest
+
+# List of valid seeds to be used in testing
+seeds = ["ijelhkmfggkmifejlhhflmjgekijegklmihfkmhjifgellifeghkmjmgihklfjeehjfmilgkflkgejhim",
+              "eifhlmgkjkgmfijlhehjlgkefmiglkefhjimimekjghflfhjlmikegmehjgkilfjfimhlegklkgiefmjh",
+              "hgifjmklejlfikehmgemklghijflfjemighkgkhjlfmeimiekhgjfliemgfjlkhfhlmikegjkjghelfim",
+              "fihkmjglelmgehfjikkejlgifmhigmjlhekfjflikehgmehkmfgljihligekmfjgkfhjmielmjefilkhg"]
+
+def random_seeds(count:int) -> list:
+    """
+    Method to create seeds from the valid seeds with random cells changed or emptied.
+
+    Parameters:
+        - count - number of seeds to create
+
+    Returns:
+        - list of seeds
+    """
+
+    result = []
+    for _ in range(count):
+        seed = list(random.choice(seeds))
+        for index in random.sample(range(81), random.randint(0, 4)):
+            seed[index] = Cell_Value(random.randint(0, 9)).seed()
+        result += ["".join(seed)]
+
+    return result
+
+def test_seeds_to_array():
+    """
+    Method to test converting seeds into an array of cell values.
+
+    The tests convert seeds and compares the array to the values of the cells of each sudoku.
+    """
+
+    # Positive case - valid seeds
+    grids = seeds_to_array(seeds)
+
+    assert grids.shape == (len(seeds), 81)
+    assert grids.dtype == np.uint8
+    for row, seed in enumerate(seeds):
+        sudoku = Sudoku(seed=seed)
+        for index in range(81):
+            assert grids[row, index] == sudoku.get_value(index // 9 + 1, index % 9 + 1).value
+
+    # Negative case - invalid seeds
+    for invalid in [["abc"], [seeds[0] + "d"], [seeds[0][:-1] + "a"], [None], [seeds[0], 1]]:
+        with pytest.raises(Exception) as exception:
+            seeds_to_array(invalid)
+        assert "Invalid Seed" in str(exception.value)
+
+def test_load_seed_file(tmp_path):
+    """
+    Method to test loading all the seeds in a seed file into an array.
+
+    The tests write a seed file and checks the array matches the seeds.
+    """
+
+    # Positive case - seed file with a trailing blank line
+    file_path = str(tmp_path / "seeds.txt")
+    with open(file_path, "w") as file:
+        file.write("\n".join(seeds) + "\n")
+
+    assert (load_seed_file(file_path) == seeds_to_array(seeds)).all()
+
+def test_validate_grids(tmp_path):
+    """
+    Method to test validating a batch of sudoku grids.
+
+    The tests validate random grids and compares the results to validating each Sudoku.
+    """
+
+    batch = random_seeds(500)
+    grids = seeds_to_array(batch)
+
+    # Positive case - random grids compared to each Sudoku, with and without empty cells accepted
+    for empty_as_valid in [False, True]:
+        for chunk_size in [1, 7, 65536]:
+            valid, first = validate_grids(grids, empty_as_valid=empty_as_valid, chunk_size=chunk_size)
+
+            for number, seed in enumerate(batch):
+                sudoku = Sudoku(seed=seed)
+
+                # List of the indices of the invalid cells of the sudoku
+                invalid = [(column - 1) * 9 + row - 1 for column, row in sudoku.conflicting_cells()]
+                if not empty_as_valid:
+                    invalid += [index for index in range(81) if seed[index] == Cell_Value.EMPTY.seed()]
+
+                assert valid[number] == sudoku.valid(empty_as_valid=empty_as_valid)
+                assert first[number] == (min(invalid) if len(invalid) > 0 else -1)
+
+    # Positive case - more grids than one chunk holds, with a smaller last chunk, give the same results
+    many = np.concatenate([grids] * 3)
+    valid, first = validate_grids(many, chunk_size=64)
+    whole = validate_grids(many, chunk_size=len(many))
+    assert len(valid) == 1500 and (valid == whole[0]).all() and (first == whole[1]).all()
+    assert many.dtype == np.uint8
+
+    # Positive case - grids given as a seed file
+    file_path = str(tmp_path / "seeds.txt")
+    with open(file_path, "w") as file:
+        file.write("\n".join(batch))
+
+    valid, first = validate_grids(file_path)
+    assert (valid == validate_grids(grids)[0]).all()
+
+    # Positive case - empty batch
+    valid, first = validate_grids(np.zeros((0, 81), dtype=np.uint8))
+    assert len(valid) == 0 and len(first) == 0
+
+    # Negative case - invalid grids
+    for invalid in [np.zeros(81, dtype=np.uint8), np.zeros((2, 80), dtype=np.uint8), np.full((2, 81), 10), np.full((2, 81), -1),
+                    np.full((2, 81), -1, dtype=np.int8), np.zeros((2, 81)), np.full((2, 81), 9.7), np.ones((2, 81), dtype=bool), [["1"] * 81]]:
+        with pytest.raises(Exception) as exception:
+            validate_grids(invalid)
+        assert "Invalid Grids" in str(exception.value)
+
+    # Negative case - invalid chunk size
+    for chunk_size in [0, -1, 1.0, None]:
+        with pytest.raises(Exception) as exception:
+            validate_grids(grids, chunk_size=chunk_size)
+        assert "Invalid Chunk Size" in str(exception.value)
+
+def test_batch_candidates():
+    """
+    Method to test getting the candidates of every cell of a batch of grids.
+
+    The tests compare the candidates of random partially filled grids to the options of each Sudoku.
+    """
+
+    # Positive case - random partially filled grids compared to each Sudoku
+    batch = []
+    for _ in range(50):
+        seed = list(random.choice(seeds))
+        for index in random.sample(range(81), random.randint(0, 81)):
+            seed[index] = Cell_Value.EMPTY.seed()
+        batch += ["".join(seed)]
+
+    candidates = Sudoku_Batch(batch).candidates()
+
+    assert candidates.shape == (50, 81, 9)
+    for number, seed in enumerate(batch):
+        sudoku = Sudoku(seed=seed)
+        for index in range(81):
+            expected = set()
+            if seed[index] == Cell_Value.EMPTY.seed():
+                expected = set([value.value for value in sudoku.cell_options(index // 9 + 1, index % 9 + 1)])
+
+            assert set(np.flatnonzero(candidates[number, index]) + 1) == expected
+
+def test_batch_propagate():
+    """
+    Method to test filling in the singles of a batch of grids.
+
+    The tests propagate grids with cells removed from a valid sudoku, and checks that every cell filled
+    in matches the valid sudoku.
+    """
+
+    # Positive case - grids with cells removed from a valid sudoku
+    batch = []
+    for _ in range(200):
+        seed = list(seeds[0])
+        for index in random.sample(range(81), random.randint(0, 81)):
+            seed[index] = Cell_Value.EMPTY.seed()
+        batch += ["".join(seed)]
+
+    for hidden in [False, True]:
+        sudoku_batch = Sudoku_Batch(batch)
+        sudoku_batch.propagate(hidden=hidden, chunk_size=64)
+
+        assert not sudoku_batch.contradictions().any()
+        for before, after in zip(batch, sudoku_batch.get_seeds()):
+            for index in range(81):
+                assert after[index] == before[index] or (before[index] == Cell_Value.EMPTY.seed() and after[index] in [seeds[0][index], Cell_Value.EMPTY.seed()])
+
+    # Positive case - puzzle solved by singles
+    puzzle = "igddkddddjddemiddddmlddddjdldddjdddghddldgddekdddfdddjdjddddflddddhemddiddddlddkm"
+    sudoku_batch = Sudoku_Batch([puzzle, seeds[1]])
+
+    assert sudoku_batch.propagate() > 0
+    assert sudoku_batch.solved().all()
+    assert sudoku_batch.get_seeds()[1] == seeds[1]
+    assert list(sudoku_batch.get_rounds() > 0) == [True, False]
+
+    # Negative case - grids with no solution
+    sudoku_batch = Sudoku_Batch(np.array([[1, 1] + [0] * 79, [1, 2, 3, 4, 5, 6, 7, 8] + [0] * 9 + [9] + [0] * 63]))
+    sudoku_batch.propagate()
+
+    assert sudoku_batch.contradictions().all()
+    assert not sudoku_batch.solved().any()
+
+    # Negative case - invalid chunk size
+    for chunk_size in [0, -1, 1.0, None]:
+        with pytest.raises(Exception) as exception:
+            Sudoku_Batch(seeds).propagate(chunk_size=chunk_size)
+        assert "Invalid Chunk Size" in str(exception.value)
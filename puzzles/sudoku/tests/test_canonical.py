@@ -0,0 +1,146 @@
+"""
+Tests for the canonical form of sudoku grids under their symmetry group.
+"""
+
+from ..canonical import canonicalize, Grid_Transform, seed_to_grid, row_order_count
+from ..sudoku import Sudoku
+from ..cell_value import Cell_Value
+from ..create_difficulty import generate_extreme
+from ..grid_layout import get_layout
+import random
+import pytest
+
+def random_transform(size:int, transpose:bool) -> Grid_Transform:
+    """
+    Method to create a random transform of the symmetry group of a grid size.
+    """
+
+    layout = get_layout(size)
+
+    # Orders of the columns and rows, keeping the stacks and bands together
+    orders = list()
+    for group in [layout.box_width, layout.box_height]:
+        groups = list(range(size // group))
+        random.shuffle(groups)
+        orders += [[start * group + offset for start in groups for offset in random.sample(range(group), group)]]
+
+    labels = random.sample(range(1, size + 1), size)
+    return Grid_Transform(size, transpose, orders[0], orders[1], [0] + labels)
+
+def test_canonicalize():
+    """
+    Method to test finding the canonical form of a grid.
+
+    The tests transform complete and partial grids randomly and check they have the same canonical form,
+    and that the transform returned gives the canonical form.
+    """
+
+    # Positive case - every transform of a grid has the same canonical form
+    for size in [4, 6, 9]:
+        for _ in range(3):
+            solution = Sudoku(size=size)
+            solution.fill()
+            puzzle = generate_extreme(Sudoku(solution.get_seed(), size=size))
+
+            for seed in [solution.get_seed(), puzzle.get_seed(), Cell_Value.EMPTY.seed() * (size * size)]:
+                canonical, transform = canonicalize(seed, size)
+
+                assert transform.apply(seed) == canonical
+                assert transform.inverse().apply(canonical) == seed
+                assert canonicalize(canonical, size)[0] == canonical
+                assert Sudoku(canonical, size=size).valid(empty_as_valid=True)
+
+                for _ in range(5):
+                    other = random_transform(size, size != 6 and random.random() < 0.5).apply(seed)
+                    assert canonicalize(other, size)[0] == canonical
+
+    # Positive case - a complete grid starts with its values in order
+    solution = Sudoku()
+    solution.fill()
+    assert canonicalize(solution.get_seed())[0].startswith("efghijklm")
+
+    # Negative case - grids which are not transforms of each other
+    one = Sudoku()
+    one.fill()
+    two = Sudoku(one.get_seed())
+    two._set_cell(0, 0)
+    assert canonicalize(one.get_seed())[0] != canonicalize(two.get_seed())[0]
+
+    # Negative case - invalid seeds
+    for seed in [None, 1, "e" * 80, "e" * 81, "a" * 81]:
+        with pytest.raises(Exception) as exception:
+            canonicalize(seed)
+        assert "Invalid Seed" in str(exception.value)
+
+    # Negative case - sizes which are not grids, or have too many row orders to search
+    for size in [7, 16, 25]:
+        with pytest.raises(Exception) as exception:
+            canonicalize("d" * (size * size), size=size)
+        assert "Invalid Size" in str(exception.value)
+
+def test_row_order_count():
+    """
+    Method to test counting the row orders of each grid size.
+    """
+
+    # Positive case - bands in any order and rows in any order within a band
+    assert [row_order_count(size) for size in [4, 6, 9, 12, 16]] == [8, 48, 1296, 31104, 7962624]
+
+    # Positive case - a 12 x 12 grid has few enough row orders to find its canonical form
+    solution = Sudoku(size=12)
+    solution.fill()
+    canonical, transform = canonicalize(solution.get_seed(), 12)
+    assert transform.apply(solution.get_seed()) == canonical
+
+    # Negative case - invalid size
+    with pytest.raises(Exception) as exception:
+        row_order_count(7)
+    assert "Invalid Size" in str(exception.value)
+
+def test_grid_transform():
+    """
+    Method to test transforming grids.
+
+    The tests check transforms keep grids valid and that invalid transforms are rejected.
+    """
+
+    # Positive case - transforms keep a grid valid and are undone by their inverse
+    solution = Sudoku()
+    solution.fill()
+    for _ in range(10):
+        transform = random_transform(9, random.random() < 0.5)
+        seed = transform.apply(solution.get_seed())
+
+        assert Sudoku(seed).valid()
+        assert transform.inverse().apply(seed) == solution.get_seed()
+        assert transform.inverse().inverse() == transform
+
+    # Positive case - random transforms of each size keep grids valid
+    for size in [4, 6, 9, 16]:
+        solution = Sudoku(size=size)
+        solution.fill()
+        for _ in range(10):
+            assert Sudoku(Grid_Transform.random(size).apply(solution.get_seed()), size=size).valid()
+
+    solution = Sudoku()
+    solution.fill()
+
+    # Positive case - transposing swaps the rows and columns
+    transform = Grid_Transform(9, True, range(9), range(9), range(10))
+    assert (seed_to_grid(transform.apply(solution.get_seed())) == seed_to_grid(solution.get_seed()).T).all()
+
+    # Negative case - seeds which do not match the transform
+    for seed in [None, solution.get_seed()[:80], "a" * 81, "e" * 16]:
+        with pytest.raises(Exception) as exception:
+            Grid_Transform.random().apply(seed)
+        assert "Invalid Seed" in str(exception.value)
+
+    # Negative case - transforms which break up the rows, columns or boxes, or change empty cells
+    for arguments in [(9, True, range(9), range(9), [1, 0] + list(range(2, 10))),
+                      (9, False, [0, 3, 1, 2, 4, 5, 6, 7, 8], range(9), range(10)),
+                      (9, False, range(9), [0, 1, 2, 3, 4, 5, 6, 7, 7], range(10)),
+                      (9, 1, range(9), range(9), range(10)),
+                      (6, True, range(6), range(6), range(7))]:
+        with pytest.raises(Exception) as exception:
+            Grid_Transform(*arguments)
+        assert "Invalid Transform" in str(exception.value)
@@ -3,6 +3,8 @@ Tests for the Cell Value Enum Class.
 """
 
 from ..cell_value import Cell_Value
+import random
+import pytest
 
 def test_str():
     """
@@ -57,3 +59,53 @@ def test_create():
     assert Cell_Value.SEVEN == Cell_Value(7)
     assert Cell_Value.EIGHT == Cell_Value(8)
     assert Cell_Value.NINE == Cell_Value(9)
+
+def test_decode_seed():
+    """
+    Method to test the method to convert a seed into integer cell values.
+
+    The tests decode seeds and compares the values to the values of the cell values in the seed.
+    """
+
+    # Positive case - seeds of random cell values
+    for _ in range(100):
+        cells = [Cell_Value(random.randint(0, 9)) for _ in range(random.randint(0, 100))]
+        seed = "".join([cell.seed() for cell in cells])
+
+        assert Cell_Value.decode_seed(seed) == bytes([cell.value for cell in cells])
+
+    # Negative case - seeds containing invalid characters
+    for seed in ["c", "n", "defghijklmn", "ddd1", "dĀ", "☃", None, 1, True]:
+        with pytest.raises(Exception) as exception:
+            Cell_Value.decode_seed(seed)
+        assert "Invalid Seed" in str(exception.value)
+
+    # Positive case - seeds of larger grids with values past 9
+    for size in [16, 25]:
+        values = bytes([random.randint(0, size) for _ in range(size * size)])
+        seed = "".join([chr(value + 100) for value in values])
+
+        assert Cell_Value.decode_seed(seed, size) == values
+        assert Cell_Value.encode_seed(values) == seed
+
+    # Negative case - seeds with values larger than the size of the grid
+    for seed, size in [("n", 9), ("i", 4), ("k", 6), ("u", 16), ("~", 25)]:
+        with pytest.raises(Exception) as exception:
+            Cell_Value.decode_seed(seed, size)
+        assert "Invalid Seed" in str(exception.value)
+
+def test_encode_seed():
+    """
+    Method to test the method to convert integer cell values into a seed.
+
+    The tests encode integer values and compares the seed to the seed of each cell value.
+    """
+
+    # Positive case - random integer values
+    for _ in range(100):
+        cells = [Cell_Value(random.randint(0, 9)) for _ in range(random.randint(0, 100))]
+
+        seed = Cell_Value.encode_seed(bytearray([cell.value for cell in cells]))
+
+        assert seed == "".join([cell.seed() for cell in cells])
+        assert Cell_Value.decode_seed(seed) == bytes([cell.value for cell in cells])
@@ -0,0 +1,121 @@
+"""
+Tests for the methods removing cells to create puzzles of each difficulty.
+"""
+
+from .. import create_difficulty
+from ..create_difficulty import generate_easy, generate_medium, generate_hard, generate_extreme, Symmetry
+from ..propagation import Candidate_Grid, Technique
+from ..sudoku import Sudoku
+from ..cell_value import Cell_Value
+import pytest
+
+def test_generate_easy():
+    """
+    Method to test the method to create an easy puzzle.
+
+    The tests remove cells from filled sudokus and check the puzzle is at a fixed point and can be solved
+    back to the filled sudoku with singles.
+    """
+
+    # Positive case - puzzles of each size are solved with singles and no more cells can be removed
+    for size in [4, 6, 9, 16]:
+        for _ in range(5):
+            solution = Sudoku(size=size)
+            solution.fill()
+            puzzle = generate_easy(Sudoku(solution.get_seed(), size=size))
+
+            grid = Candidate_Grid(size)
+            grid.load(Cell_Value.decode_seed(puzzle.get_seed(), size))
+            assert grid.propagate(techniques=[Technique.NAKED_SINGLE, Technique.HIDDEN_SINGLE]) == True
+            assert Cell_Value.encode_seed(grid.values) == solution.get_seed()
+
+            for index in range(size * size):
+                value = puzzle._get_cell(index)
+                if value == 0:
+                    assert solution._get_cell(index) != 0
+                    continue
+
+                puzzle._set_cell(index, 0)
+                assert create_difficulty.__singles_inference(puzzle, index, value) == False
+                puzzle._set_cell(index, value)
+
+def test_generate_harder():
+    """
+    Method to test the methods to create puzzles harder than easy.
+
+    The tests remove cells from filled sudokus and check the puzzles have unique solutions and fewer clues
+    than the easy puzzles of the same sudoku.
+    """
+
+    # Positive case - harder puzzles have a unique solution and at most as many clues as the easy puzzle
+    for generate in [generate_medium, generate_extreme]:
+        for _ in range(3):
+            solution = Sudoku()
+            solution.fill()
+            puzzle = generate(Sudoku(solution.get_seed()))
+
+            count, solutions = puzzle.count_solutions()
+            assert count == 1
+            assert solutions == [solution.get_seed()]
+
+            # No cell of an extreme puzzle can be removed without losing the unique solution
+            if generate is generate_extreme:
+                for index in range(81):
+                    value = puzzle._get_cell(index)
+                    if value != 0:
+                        puzzle._set_cell(index, 0)
+                        assert puzzle.count_solutions()[0] == 2
+                        puzzle._set_cell(index, value)
+
+def test_symmetry():
+    """
+    Method to test removing cells in symmetric patterns and down to a number of clues.
+
+    The tests remove cells with each symmetry and check the pattern of the filled cells and the number of
+    clues left.
+    """
+
+    # Positive case - symmetric cells of each symmetry
+    assert Symmetry.NONE.orbit(10, 9) == (10,)
+    assert Symmetry.ROTATIONAL.orbit(0, 9) == (0, 80)
+    assert Symmetry.ROTATIONAL.orbit(40, 9) == (40,)
+    assert Symmetry.ROTATIONAL.orbit(5, 4) == (5, 10)
+    assert Symmetry.MIRROR.orbit(0, 9) == (0, 72)
+    assert Symmetry.MIRROR.orbit(39, 9) == (39,)
+    assert Symmetry.MIRROR.orbit(11, 6) == (11, 29)
+
+    # Positive case - the filled cells of the puzzles are symmetric
+    for generate in [generate_easy, generate_medium, generate_hard, generate_extreme]:
+        for symmetry in [Symmetry.ROTATIONAL, Symmetry.MIRROR]:
+            solution = Sudoku()
+            solution.fill()
+            puzzle = generate(Sudoku(solution.get_seed()), symmetry=symmetry)
+
+            for index in range(81):
+                for other in symmetry.orbit(index, 9):
+                    assert (puzzle._get_cell(index) == 0) == (puzzle._get_cell(other) == 0)
+
+            assert puzzle.count_solutions() == (1, [solution.get_seed()])
+
+    # Positive case - cells are only removed down to the number of clues requested (cells removed in pairs
+    # can leave one more clue than requested)
+    for clues in [81, 60, 45, 36]:
+        for symmetry in [Symmetry.NONE, Symmetry.ROTATIONAL]:
+            solution = Sudoku()
+            solution.fill()
+            puzzle = generate_extreme(Sudoku(solution.get_seed()), clues=clues, symmetry=symmetry)
+            count = 81 - puzzle.get_seed().count(Cell_Value.EMPTY.seed())
+
+            assert count == clues if symmetry == Symmetry.NONE else clues <= count <= clues + 1
+            assert puzzle.count_solutions()[0] == 1
+
+    # Negative case - invalid clues and symmetries
+    for clues in [-1, 82, 24.0, "24", [24]]:
+        with pytest.raises(Exception) as exception:
+            generate_easy(Sudoku(solution.get_seed()), clues=clues)
+        assert "Invalid Clues" in str(exception.value)
+
+    for symmetry in [None, 1, "ROTATIONAL", Cell_Value.ONE]:
+        with pytest.raises(Exception) as exception:
+            generate_easy(Sudoku(solution.get_seed()), symmetry=symmetry)
+        assert "Invalid Symmetry" in str(exception.value)
@@ -0,0 +1,113 @@
+"""
+Tests for the Dancing Links Class.
+"""
+
+from ..dancing_links import Dancing_Links
+from ..sudoku import Sudoku
+from ..cell_value import Cell_Value
+import random
+import pytest
+
+# Valid complete seed to be used in testing
+solution = "ijelhkmfggkmifejlhhflmjgekijegklmihfkmhjifgellifeghkmjmgihklfjeehjfmilgkflkgejhim"
+
+# Seeds of sudoku puzzles with a unique solution (the second has only 17 given cells)
+unique_seeds = ["igddkddddjddemiddddmlddddjdldddjdddghddldgddekdddfdddjdjddddflddddhemddiddddlddkm",
+                "dddddddedhdddddddddfdddddddddddidhdkddldddgddddedmddddgddhddfdddideddddddddldjddd"]
+
+def test_solve():
+    """
+    Method to test the method to find the first solution of a sudoku.
+
+    The tests solve sudokus and checks the solutions are valid and keep the given cells.
+    """
+
+    solver = Dancing_Links()
+
+    # Positive case - complete valid sudoku is its own solution
+    solver.load(solution)
+    assert solver.solve() == solution
+
+    # Positive case - sudokus with cells removed from a valid sudoku
+    for _ in range(50):
+        seed = list(solution)
+        for index in random.sample(range(81), random.randint(0, 81)):
+            seed[index] = Cell_Value.EMPTY.seed()
+        seed = "".join(seed)
+
+        solver.load(Sudoku(seed=seed))
+        solved = solver.solve()
+
+        assert Sudoku(seed=solved).valid() == True
+        for index in range(81):
+            assert seed[index] == Cell_Value.EMPTY.seed() or solved[index] == seed[index]
+
+    # Negative case - sudoku with conflicting given cells
+    solver.load(Cell_Value.ONE.seed() * 2 + Cell_Value.EMPTY.seed() * 79)
+    assert solver.solve() == None
+
+    # Negative case - sudoku with no solution
+    solver.load("".join([Cell_Value(value).seed() for value in range(1, 9)]) + "d" * 9 + Cell_Value.NINE.seed() + "d" * 63)
+    assert solver.solve() == None
+
+    # Negative case - invalid puzzle
+    for puzzle in [None, 1, True, [solution]]:
+        with pytest.raises(Exception) as exception:
+            solver.load(puzzle)
+        assert "Invalid Puzzle" in str(exception.value)
+
+def test_solve_all():
+    """
+    Method to test the method to find all the solutions of a sudoku.
+
+    The tests find the solutions of sudokus with a known number of solutions.
+    """
+
+    # Positive case - sudoku with a unique solution
+    for seed in unique_seeds:
+        solutions = Dancing_Links(seed).solve_all()
+
+        assert len(solutions) == 1
+        assert Sudoku(seed=solutions[0]).valid() == True
+
+    # Positive case - empty sudoku with a limit
+    solutions = Dancing_Links(Sudoku()).solve_all(limit=20)
+
+    assert len(solutions) == 20
+    assert len(set(solutions)) == 20
+    for seed in solutions:
+        assert Sudoku(seed=seed).valid() == True
+
+    # Negative case - invalid limit
+    for limit in [0, -1, 1.0, "1", True]:
+        with pytest.raises(Exception) as exception:
+            Dancing_Links(Sudoku()).solve_all(limit=limit)
+        assert "Invalid Limit" in str(exception.value)
+
+def test_count_solutions():
+    """
+    Method to test the method to count the solutions of a sudoku.
+
+    The tests count the solutions of sudokus and compares them to the solutions found.
+    """
+
+    # Positive case - sudoku with a unique solution
+    for seed in unique_seeds:
+        assert Dancing_Links(seed).count_solutions() == 1
+
+    # Positive case - empty sudoku with a limit
+    assert Dancing_Links(Sudoku()).count_solutions(limit=100) == 100
+
+    # Positive case - sudokus with cells removed from a valid sudoku
+    for _ in range(20):
+        seed = list(solution)
+        for index in random.sample(range(81), random.randint(45, 55)):
+            seed[index] = Cell_Value.EMPTY.seed()
+        seed = "".join(seed)
+
+        solver = Dancing_Links(seed)
+
+        assert solver.count_solutions(limit=50) == len(solver.solve_all(limit=50))
+
+    # Negative case - sudoku with no solution
+    assert Dancing_Links(Cell_Value.ONE.seed() * 2 + Cell_Value.EMPTY.seed() * 79).count_solutions() == 0
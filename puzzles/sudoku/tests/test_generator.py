@@ -0,0 +1,49 @@
+"""
+Tests for the parallel batch generation of puzzles.
+"""
+
+from ..generator import generate_many
+from ..sudoku import Sudoku
+from ..cell_value import Cell_Value
+from ..grader import grade_puzzle
+from ...puzzle import Difficulty
+import pytest
+
+def test_generate_many():
+    """
+    Method to test the method to generate many puzzles in parallel.
+
+    The tests generate small batches of puzzles and check each puzzle matches its solution, and that runs
+    with the same seed create the same puzzles.
+    """
+
+    # Positive case - every puzzle is created with its solution and difficulty
+    records = list(generate_many(10, Difficulty.EASY, workers=2, seed=1, size=4, chunk_size=3))
+    assert len(records) == 10
+
+    for puzzle_seed, solution_seed, difficulty in records:
+        assert Sudoku(solution_seed, size=4).valid()
+        assert difficulty == Difficulty.EASY
+        assert all(cell in [Cell_Value.EMPTY.seed(), solution] for cell, solution in zip(puzzle_seed, solution_seed))
+
+    # Positive case - the same seed creates the same puzzles whatever the number of workers
+    assert sorted(generate_many(10, Difficulty.EASY, workers=1, seed=1, size=4, chunk_size=3)) == sorted(records)
+    assert sorted(generate_many(6, Difficulty.MEDIUM, workers=3, seed=2, size=6)) == sorted(generate_many(6, Difficulty.MEDIUM, workers=1, seed=2, size=6))
+
+    # Positive case - the scores the workers graded the puzzles with are added to the records
+    scored = list(generate_many(10, Difficulty.EASY, workers=2, seed=1, size=4, chunk_size=3, scores=True))
+    assert sorted(record[:3] for record in scored) == sorted(records)
+    for puzzle_seed, _, _, score in scored:
+        assert score == grade_puzzle(Sudoku(puzzle_seed, size=4))[2]
+
+    # Positive case - no puzzles
+    assert list(generate_many(0, Difficulty.EASY)) == []
+
+    # Negative case - invalid parameters
+    for parameters in [{"n" : -1}, {"n" : "10"}, {"difficulty" : Difficulty.UNDEFINED}, {"difficulty" : 1},
+                       {"workers" : 0}, {"seed" : "1"}, {"chunk_size" : 0}, {"scores" : 1}]:
+        arguments = {"n" : 10, "difficulty" : Difficulty.EASY}
+        arguments.update(parameters)
+        with pytest.raises(Exception) as exception:
+            list(generate_many(**arguments))
+        assert "Invalid" in str(exception.value)
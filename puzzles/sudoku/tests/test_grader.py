@@ -0,0 +1,76 @@
+"""
+Tests for the sudoku difficulty grader.
+"""
+
+from ..grader import grade_puzzle, SEARCH_SCORE
+from ..propagation import Technique
+from ..sudoku import Sudoku
+from ..create_difficulty import generate_easy, generate_medium, generate_hard
+from ...puzzle import Difficulty
+import pytest
+
+# Puzzle which can be solved with singles and pointing
+MEDIUM_SEED = "hddddddiedgdfdddddddddddddhddkdddjfdddddledddddddddgddldddhdddddddjddkddidddddddd"
+
+# Puzzle which can not be solved without guessing
+EXTREME_SEED = "dldhdddddddkdedjddiddddgdhdgddddfiddddedkdddddddiddddmddigddddkdfdddldgdddddjdmdd"
+
+def test_grade_puzzle():
+    """
+    Method to test the method to grade the difficulty of a puzzle.
+
+    The tests grade puzzles with known techniques needed and check the difficulty, technique and score.
+    """
+
+    # Positive case - puzzles generated at each difficulty are graded at most at that difficulty
+    for generate, difficulty in [(generate_easy, Difficulty.EASY), (generate_medium, Difficulty.MEDIUM), (generate_hard, Difficulty.HARD)]:
+        for _ in range(5):
+            solution = Sudoku()
+            solution.fill()
+            grade = grade_puzzle(generate(solution))
+
+            assert grade[0].value <= difficulty.value
+            assert grade[2] > 0
+
+    # Positive case - filled sudoku needs no techniques
+    sudoku = Sudoku()
+    sudoku.fill()
+    assert grade_puzzle(sudoku) == (Difficulty.EASY, None, 0)
+
+    # Positive case - puzzle needing pointing
+    difficulty, technique, score = grade_puzzle(Sudoku(MEDIUM_SEED))
+    assert difficulty == Difficulty.MEDIUM
+    assert technique == Technique.POINTING
+
+    # Positive case - puzzle needing guessing
+    difficulty, technique, score = grade_puzzle(Sudoku(EXTREME_SEED))
+    assert difficulty == Difficulty.EXTREME
+    assert score > SEARCH_SCORE
+
+    # Positive case - grading stops once the limit is exceeded
+    assert grade_puzzle(Sudoku(MEDIUM_SEED), limit=Difficulty.EASY)[0] == Difficulty.MEDIUM
+    assert grade_puzzle(Sudoku(MEDIUM_SEED), limit=Difficulty.MEDIUM)[0] == Difficulty.MEDIUM
+    assert grade_puzzle(Sudoku(EXTREME_SEED), limit=Difficulty.MEDIUM)[0] == Difficulty.HARD
+    assert grade_puzzle(Sudoku(EXTREME_SEED), limit=Difficulty.HARD)[0] == Difficulty.EXTREME
+
+    # Negative case - puzzles with conflicting values
+    for seed in ["e" * 81, "ee" + "d" * 79]:
+        with pytest.raises(Exception) as exception:
+            grade_puzzle(Sudoku(seed))
+        assert "Invalid Puzzle" in str(exception.value)
+
+    # Negative case - puzzle with more than one solution
+    with pytest.raises(Exception) as exception:
+        grade_puzzle(Sudoku())
+    assert "unique solution" in str(exception.value)
+
+    # Negative case - invalid puzzles and limits
+    for puzzle in [None, MEDIUM_SEED, 1]:
+        with pytest.raises(Exception) as exception:
+            grade_puzzle(puzzle)
+        assert "Invalid Puzzle" in str(exception.value)
+
+    for limit in [Difficulty.UNDEFINED, 1, "EASY", True]:
+        with pytest.raises(Exception) as exception:
+            grade_puzzle(Sudoku(MEDIUM_SEED), limit=limit)
+        assert "Invalid Limit" in str(exception.value)
@@ -0,0 +1,51 @@
+"""
+Tests for the Grid Layout Class.
+"""
+
+from ..grid_layout import Grid_Layout, get_layout
+import pytest
+
+def test_grid_layout():
+    """
+    Method to test the tables of the layout of a grid size.
+
+    The tests create layouts of different sizes and check the box dimensions, units and peers of the cells.
+    """
+
+    # Positive case - box dimensions of the supported sizes
+    for size, box_size in [(4, (2, 2)), (6, (2, 3)), (8, (2, 4)), (9, (3, 3)), (12, (3, 4)), (16, (4, 4)), (25, (5, 5))]:
+        layout = get_layout(size)
+        assert (layout.box_height, layout.box_width) == box_size
+        assert layout.cells == size * size
+        assert layout.units == size * 3
+
+    # Positive case - every unit holds each cell once and every cell has the same number of peers
+    for size in [4, 6, 9, 16]:
+        layout = get_layout(size)
+        box_height, box_width = layout.box_height, layout.box_width
+
+        for unit in range(layout.units):
+            assert len(layout.unit_cells[unit]) == size
+            for index in layout.unit_cells[unit]:
+                assert unit in layout.cell_units[index]
+
+        for index in range(layout.cells):
+            assert len(layout.cell_peers[index]) == 3 * size - box_height - box_width - 1
+            assert index not in layout.cell_peers[index]
+
+    # Positive case - mask tables give the number and values of the bits set
+    for size in [9, 16, 25]:
+        layout = get_layout(size)
+        assert layout.mask_sizes[layout.full_mask] == size
+        assert list(layout.mask_values[layout.full_mask]) == list(range(1, size + 1))
+        assert layout.mask_sizes[(1 << 2) | (1 << size)] == 2
+        assert list(layout.mask_values[(1 << 2) | (1 << size)]) == [2, size]
+
+    # Positive case - layouts are cached
+    assert get_layout(16) is get_layout(16)
+
+    # Negative case - invalid sizes
+    for size in [-1, 0, 1, 2, 3, 5, 7, 13, 26, 36, 9.0, "9", None, True]:
+        with pytest.raises(Exception) as exception:
+            Grid_Layout(size)
+        assert "Invalid Size" in str(exception.value)
@@ -0,0 +1,143 @@
+"""
+Tests for the packed binary seed file format.
+"""
+
+from ..packed_seeds import *
+from ..sudoku import Sudoku
+import pytest
+
+def test_pack_seed():
+    """
+    Method to test packing seeds into bytes.
+
+    The tests pack complete and partial grids of each size and check they unpack to the same seed.
+    """
+
+    # Positive case - complete and partial grids of each size
+    for size in [4, 6, 9, 16, 25]:
+        solution = Sudoku(size=size)
+        solution.fill()
+        seed = solution.get_seed()
+
+        for grid in [seed, "d" + seed[1:], seed[:-1] + "d", "d" * (size * size)]:
+            packed = pack_seed(grid, size)
+            assert len(packed) == record_size(size)
+            assert unpack_seed(packed, size) == grid
+
+    # Positive case - a 9 x 9 seed takes less than half the space of a line of the text seed file
+    assert record_size() == 34
+
+    # Positive case - the packing tables of a size are only created once
+    assert get_packing(9) is get_packing(9)
+    assert get_packing(9)[:3] == (34, 81, 10 ** 81)
+
+    # Negative case - invalid sizes
+    for size in [7, "9", [9]]:
+        with pytest.raises(Exception) as exception:
+            get_packing(size)
+        assert "Invalid Size" in str(exception.value)
+
+    # Negative case - invalid seeds and packed seeds
+    for seed in [None, 1, "e" * 80, "a" * 81, "n" * 81]:
+        with pytest.raises(Exception) as exception:
+            pack_seed(seed)
+        assert "Invalid Seed" in str(exception.value)
+
+    for data in [b"", b"\x00" * 33, b"\xff" * 34]:
+        with pytest.raises(Exception) as exception:
+            unpack_seed(data)
+        assert "Invalid Packed Seed" in str(exception.value)
+
+def test_packed_seed_file(tmp_path):
+    """
+    Method to test writing and reading packed seed files.
+
+    The tests write seeds as a stream, read them back in order and by index, convert to and from the text
+    format and check corrupted files are found.
+    """
+
+    seeds = list()
+    for seed in Sudoku().iter_solutions():
+        seeds += [seed]
+        if len(seeds) == 50:
+            break
+
+    file_path = str(tmp_path / "seeds.bin")
+
+    # Positive case - seeds written in blocks are read back in order and by index
+    for block_records, checksums in [(7, True), (10, True), (50, True), (7, False)]:
+        with Packed_Seed_Writer(file_path, block_records=block_records, checksums=checksums) as writer:
+            writer.write(seeds[0])
+            assert writer.write_many(iter(seeds[1:])) == len(seeds) - 1
+            assert len(writer) == len(seeds)
+
+        with Packed_Seed_Reader(file_path, verify=True) as reader:
+            assert len(reader) == len(seeds)
+            assert reader.get_size() == 9
+            assert list(reader) == seeds
+            assert [reader[index] for index in [49, 0, 13, 7, 6]] == [seeds[index] for index in [49, 0, 13, 7, 6]]
+            assert reader.verify() == True
+
+    # Positive case - converting to and from the text format
+    text_path = str(tmp_path / "seeds.txt")
+    with open(text_path, "w") as file:
+        file.write("\n".join(seeds) + "\n\n")
+
+    assert text_to_packed(text_path, file_path, block_records=16) == len(seeds)
+    assert packed_to_text(file_path, str(tmp_path / "copy.txt")) == len(seeds)
+    with open(str(tmp_path / "copy.txt"), "r") as file:
+        assert file.read() == "\n".join(seeds) + "\n"
+
+    # Positive case - grids of other sizes and empty files
+    with Packed_Seed_Writer(file_path, size=4) as writer:
+        writer.write("d" * 16)
+    with Packed_Seed_Reader(file_path) as reader:
+        assert reader.get_size() == 4 and list(reader) == ["d" * 16]
+
+    with Packed_Seed_Writer(file_path):
+        pass
+    with Packed_Seed_Reader(file_path) as reader:
+        assert len(reader) == 0 and reader.verify() == True
+
+    # Negative case - a corrupted record is found by its block's checksum
+    text_to_packed(text_path, file_path, block_records=16)
+    with open(file_path, "r+b") as file:
+        file.seek(PACKED_HEADER.size + 20 * record_size() + PACKED_CHECKSUM.size + 5)
+        byte = file.read(1)
+        file.seek(-1, 1)
+        file.write(bytes([byte[0] ^ 1]))
+
+    with Packed_Seed_Reader(file_path, verify=True) as reader:
+        assert reader.verify() == False
+        assert reader[0] == seeds[0]
+        with pytest.raises(Exception) as exception:
+            reader[20]
+        assert "Invalid Checksum" in str(exception.value)
+
+    # Negative case - invalid indexes
+    with Packed_Seed_Reader(file_path) as reader:
+        for index in [-1, len(seeds), 1.0, "1", None]:
+            with pytest.raises(Exception) as exception:
+                reader[index]
+            assert "Invalid Index" in str(exception.value)
+
+    # Negative case - files which are not packed seed files, or are cut short
+    with open(file_path, "rb") as file:
+        data = file.read()
+
+    for contents in [b"", b"SUDOKUPS", data[:-1], b"X" + data[1:], data + b"\x00"]:
+        with open(file_path, "wb") as file:
+            file.write(contents)
+        with pytest.raises(Exception) as exception:
+            Packed_Seed_Reader(file_path)
+        assert "Invalid Seed File" in str(exception.value)
+
+    # Negative case - invalid writer parameters
+    for block_records in [0, -1, 1 << 16, 1.0]:
+        with pytest.raises(Exception) as exception:
+            Packed_Seed_Writer(file_path, block_records=block_records)
+        assert "Invalid Block Records" in str(exception.value)
+
+    with pytest.raises(Exception) as exception:
+        Packed_Seed_Writer(file_path, size=7)
+    assert "Invalid Size" in str(exception.value)
@@ -0,0 +1,160 @@
+"""
+Tests for the Candidate Grid Class.
+"""
+
+from ..propagation import Candidate_Grid, Technique
+from ..sudoku import Sudoku
+from ..cell_value import Cell_Value
+from ..create_difficulty import generate_easy
+
+# Bit mask of every value in a 9 x 9 grid
+FULL_MASK = 0b1111111110
+
+def test_naked_single():
+    """
+    Method to test filling cells with a single candidate left.
+
+    The tests remove all but one candidate from a cell and check it is filled and removed from its peers.
+    """
+
+    # Positive case - cell with one candidate is filled
+    grid = Candidate_Grid()
+    grid.eliminate(0, FULL_MASK & ~(1 << 3))
+    counts = {}
+
+    assert grid.propagate(techniques=[Technique.NAKED_SINGLE], counts=counts) == True
+    assert grid.values[0] == 3
+    assert all(grid.masks[peer] & (1 << 3) == 0 for peer in grid.layout.cell_peers[0])
+    assert counts == {Technique.NAKED_SINGLE: 1}
+
+    # Negative case - two cells in a row with the same single candidate
+    grid = Candidate_Grid()
+    grid.eliminate(0, FULL_MASK & ~(1 << 3))
+    grid.eliminate(36, FULL_MASK & ~(1 << 3))
+
+    assert grid.propagate() == False
+
+def test_hidden_single():
+    """
+    Method to test filling cells which are the only place left in a unit for a value.
+
+    The tests remove a value from all but one cell of a row and check the cell is filled.
+    """
+
+    # Positive case - only place in the first row for a four
+    grid = Candidate_Grid()
+    for column in range(1, 9):
+        grid.eliminate(column * 9, 1 << 4)
+
+    assert grid.propagate(techniques=[Technique.HIDDEN_SINGLE]) == True
+    assert grid.values[0] == 4
+
+    # Positive case - not applied when it is not allowed
+    grid = Candidate_Grid()
+    for column in range(1, 9):
+        grid.eliminate(column * 9, 1 << 4)
+
+    assert grid.propagate(techniques=[Technique.NAKED_SINGLE]) == True
+    assert grid.values[0] == 0
+
+    # Negative case - a value with no place left in a row
+    grid = Candidate_Grid()
+    for column in range(9):
+        grid.eliminate(column * 9, 1 << 4)
+
+    assert grid.propagate() == False
+
+def test_pairs():
+    """
+    Method to test removing candidates using naked and hidden pairs.
+
+    The tests set up pairs in the first row and check the candidates removed.
+    """
+
+    pair = (1 << 1) | (1 << 2)
+
+    # Positive case - naked pair in the first row (and first box)
+    grid = Candidate_Grid()
+    grid.eliminate(0, FULL_MASK & ~pair)
+    grid.eliminate(9, FULL_MASK & ~pair)
+
+    assert grid.propagate(techniques=[Technique.NAKED_PAIR]) == True
+    for cell in set(grid.layout.unit_cells[0]) | set(grid.layout.unit_cells[18]):
+        if cell not in [0, 9]:
+            assert grid.masks[cell] & pair == 0
+    assert grid.masks[0] == pair and grid.masks[9] == pair
+
+    # Positive case - hidden pair in the first row
+    grid = Candidate_Grid()
+    for column in range(2, 9):
+        grid.eliminate(column * 9, pair)
+
+    assert grid.propagate(techniques=[Technique.HIDDEN_PAIR]) == True
+    assert grid.masks[0] == pair and grid.masks[9] == pair
+
+    # Negative case - three values with only the same two places in a row
+    grid = Candidate_Grid()
+    for column in range(2, 9):
+        grid.eliminate(column * 9, pair | (1 << 3))
+
+    assert grid.propagate(techniques=[Technique.HIDDEN_PAIR]) == False
+
+def test_pointing():
+    """
+    Method to test removing candidates using pointing and claiming.
+
+    The tests restrict a value to one row of the first box (and one box of the first row) and check the
+    candidates removed.
+    """
+
+    box = [column * 9 + row for column in range(3) for row in range(3)]
+
+    # Positive case - a five in the first box can only go in the first row
+    grid = Candidate_Grid()
+    for cell in box:
+        if cell % 9 != 0:
+            grid.eliminate(cell, 1 << 5)
+
+    assert grid.propagate(techniques=[Technique.POINTING]) == True
+    for column in range(3, 9):
+        assert grid.masks[column * 9] & (1 << 5) == 0
+
+    # Positive case - a seven in the first row can only go in the first box
+    grid = Candidate_Grid()
+    for column in range(3, 9):
+        grid.eliminate(column * 9, 1 << 7)
+
+    assert grid.propagate(techniques=[Technique.POINTING]) == True
+    for cell in box:
+        assert (grid.masks[cell] & (1 << 7) == 0) == (cell % 9 != 0)
+
+def test_solve():
+    """
+    Method to test solving puzzles with propagation alone.
+
+    The tests remove cells which can be inferred with singles from filled grids and check the propagation
+    fills them back in.
+    """
+
+    # Positive case - puzzles with inferable cells removed are solved with singles
+    for size in [4, 9, 16]:
+        for _ in range(5):
+            solution = Sudoku(size=size)
+            solution.fill()
+            puzzle = generate_easy(Sudoku(solution.get_seed(), size=size))
+
+            grid = Candidate_Grid(size)
+            assert grid.load(Cell_Value.decode_seed(puzzle.get_seed(), size)) == True
+            assert grid.propagate(techniques=[Technique.NAKED_SINGLE, Technique.HIDDEN_SINGLE]) == True
+            assert grid.solved() == True
+            assert Cell_Value.encode_seed(grid.values) == solution.get_seed()
+
+    # Positive case - copies are independent of the original
+    grid = Candidate_Grid()
+    copy = grid.copy()
+    copy.assign(0, 1)
+    assert grid.values[0] == 0 and grid.masks[9] == FULL_MASK
+
+    # Negative case - conflicting given cells
+    grid = Candidate_Grid()
+    assert grid.load(Cell_Value.decode_seed(Cell_Value.ONE.seed() * 2 + Cell_Value.EMPTY.seed() * 79)) == False
@@ -0,0 +1,93 @@
+"""
+Tests for the SQLite puzzle bank.
+"""
+
+from ..puzzle_bank import Puzzle_Bank
+from ..generator import generate_many
+from ..grader import grade_puzzle
+from ..sudoku import Sudoku
+from ...puzzle import Difficulty
+import sqlite3
+import pytest
+
+def test_puzzle_bank(tmp_path):
+    """
+    Method to test adding puzzles to the bank and serving them.
+
+    The tests add generated puzzles in batches and check they are each served once, matching the
+    difficulty and clue counts asked for.
+    """
+
+    file_path = str(tmp_path / "puzzles.db")
+    records = list(generate_many(12, Difficulty.EASY, workers=1, seed=3, size=6))
+
+    with Puzzle_Bank(file_path) as bank:
+        # Positive case - puzzles are added in batches, skipping duplicates
+        assert bank.add_puzzles([record + (None, 6) for record in records], batch_size=5) == 12
+        assert bank.add_puzzles([records[0] + (None, 6)]) == 0
+        assert bank.count() == 12
+        assert bank.count(Difficulty.EASY) == 12 and bank.count(Difficulty.HARD) == 0
+
+        # Positive case - puzzles are served once with the clues asked for
+        clues = sorted(36 - puzzle.count("d") for puzzle, _, _ in records)
+        puzzle, solution, difficulty, count, score = bank.take(Difficulty.EASY, min_clues=clues[-1], size=6)
+        assert (puzzle, solution, difficulty) in records
+        assert count == clues[-1] and score == grade_puzzle(Sudoku(puzzle, size=6))[2]
+        assert bank.count(served=True) == 1
+
+        served = [puzzle]
+        while True:
+            taken = bank.take(Difficulty.EASY, min_clues=clues[0], max_clues=clues[5], size=6)
+            if taken is None:
+                break
+            assert clues[0] <= taken[3] <= clues[5]
+            served += [taken[0]]
+
+        assert len(served) == len(set(served))
+        assert bank.take(Difficulty.HARD, size=6) is None
+        assert bank.take(Difficulty.EASY) is None
+
+        while bank.take(Difficulty.EASY, size=6) is not None:
+            pass
+        assert bank.count(served=False) == 0
+
+    # Positive case - the bank is kept when reopened, and uses write ahead logging
+    with Puzzle_Bank(file_path) as bank:
+        assert bank.count() == 12
+        assert bank.fill(2, Difficulty.EASY, workers=1, seed=4, size=4) == 2
+        assert bank.take(Difficulty.EASY, max_score=10 ** 6, size=4) is not None
+
+    connection = sqlite3.connect(file_path)
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    connection.close()
+
+    # Negative case - invalid records save nothing from their batch
+    solution = Sudoku()
+    solution.fill()
+    puzzle = "d" + solution.get_seed()[1:]
+    other = Sudoku()
+    other.fill()
+
+    with Puzzle_Bank(file_path) as bank:
+        for record in [None, (puzzle,), (puzzle, solution.get_seed(), Difficulty.UNDEFINED),
+                       (puzzle, solution.get_seed(), 1), (puzzle, other.get_seed(), Difficulty.EASY),
+                       (puzzle, solution.get_seed(), Difficulty.EASY, -1), (puzzle[:-1], solution.get_seed(), Difficulty.EASY)]:
+            with pytest.raises(Exception) as exception:
+                bank.add_puzzles([(puzzle, solution.get_seed(), Difficulty.EASY), record])
+            assert "Invalid" in str(exception.value)
+        assert bank.count() == 14
+
+        # Negative case - invalid queries
+        for difficulty in [None, 1, Difficulty.UNDEFINED]:
+            with pytest.raises(Exception) as exception:
+                bank.take(difficulty)
+            assert "Invalid Difficulty" in str(exception.value)
+
+        for clues in [-1, 1.0, "1"]:
+            with pytest.raises(Exception) as exception:
+                bank.take(Difficulty.EASY, min_clues=clues)
+            assert "Invalid Range" in str(exception.value)
+
+        with pytest.raises(Exception) as exception:
+            bank.add_puzzles([], batch_size=0)
+        assert "Invalid Batch Size" in str(exception.value)
@@ -0,0 +1,86 @@
+"""
+Tests for the pool of pre-generated puzzles.
+"""
+
+from ..puzzle_pool import Puzzle_Pool
+from ..sudoku import Sudoku
+from ...puzzle import Difficulty
+import time
+import pytest
+
+def test_puzzle_pool():
+    """
+    Method to test puzzles are served from the pool and the pool is refilled in the background.
+
+    The tests fill a pool of small grids, take puzzles until it drops below the low water mark and check
+    it is refilled.
+    """
+
+    # Positive case - the pool is filled to its target in the background
+    with Puzzle_Pool(target=4, low_water=2, difficulties=[Difficulty.EASY, Difficulty.MEDIUM], workers=1, size=4) as pool:
+        assert pool.wait_full(timeout=120)
+        assert pool.count(Difficulty.EASY) == 4 and pool.count(Difficulty.MEDIUM) == 4
+
+        # Positive case - ready puzzles are taken without waiting
+        start = time.perf_counter()
+        records = [pool.take(Difficulty.EASY) for _ in range(3)]
+        assert time.perf_counter() - start < 0.01
+
+        for puzzle, solution, difficulty in records:
+            assert Sudoku(solution, size=4).valid() and len(puzzle) == 16
+            assert all(cell == "d" or cell == value for cell, value in zip(puzzle, solution))
+            assert difficulty == Difficulty.EASY
+
+        # Positive case - the pool is refilled once it drops below the low water mark, for every level at once
+        for _ in range(3):
+            pool.take(Difficulty.MEDIUM)
+        assert pool.wait_full(timeout=120)
+        assert pool.count(Difficulty.EASY) == 4 and pool.count(Difficulty.MEDIUM) == 4
+
+        # Positive case - the same worker processes keep refilling the pool
+        for _ in range(3):
+            while pool.take(Difficulty.EASY) is not None:
+                pass
+            assert pool.wait_full(timeout=120)
+
+    # Positive case - a pool which is not started has no puzzles ready
+    pool = Puzzle_Pool(target=2, difficulties=[Difficulty.EASY], workers=1, size=4, start=False)
+    assert pool.take(Difficulty.EASY) is None
+    assert pool.take(Difficulty.EASY, timeout=0.01) is None
+    pool.start()
+    assert pool.take(Difficulty.EASY, timeout=120) is not None
+    pool.close()
+
+    # Positive case - a closed pool stops waiting for puzzles once it is empty
+    while pool.take(Difficulty.EASY) is not None:
+        pass
+    assert pool.take(Difficulty.EASY, timeout=None) is None
+
+    # Negative case - errors while refilling are raised when taking puzzles
+    with Puzzle_Pool(target=2, difficulties=[Difficulty.EASY], size=5) as pool:
+        with pytest.raises(Exception) as exception:
+            pool.take(Difficulty.EASY, timeout=120)
+        assert "Invalid Size" in str(exception.value)
+
+    # Negative case - invalid inputs
+    for options, message in [({"target" : 0}, "Invalid Target"), ({"target" : 2, "low_water" : 2}, "Invalid Low Water"),
+                             ({"difficulties" : []}, "Invalid Difficulties"), ({"difficulties" : [Difficulty.UNDEFINED]}, "Invalid Difficulties"),
+                             ({"workers" : 0}, "Invalid Workers")]:
+        with pytest.raises(Exception) as exception:
+            Puzzle_Pool(start=False, **options)
+        assert message in str(exception.value)
+
+    pool = Puzzle_Pool(difficulties=[Difficulty.EASY], start=False)
+    for difficulty in [None, Difficulty.HARD]:
+        with pytest.raises(Exception) as exception:
+            pool.take(difficulty)
+        assert "Invalid Difficulty" in str(exception.value)
+
+    with pytest.raises(Exception) as exception:
+        pool.take(Difficulty.EASY, timeout=-1)
+    assert "Invalid Timeout" in str(exception.value)
+
+    pool.close()
+    with pytest.raises(Exception) as exception:
+        pool.start()
+    assert "Pool Closed" in str(exception.value)
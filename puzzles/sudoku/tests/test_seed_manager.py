@@ -35,8 +35,10 @@ def set_down():
     This will remove the test seeds file.
     """
 
-    # Remove the seeds file
+    # Remove the seeds file and its duplicate index
     os.remove(file_name)
+    if os.path.exists(os.path.splitext(file_name)[0] + ".idx"):
+        os.remove(os.path.splitext(file_name)[0] + ".idx")
 
 def test_get_seed():
     """
@@ -57,12 +59,59 @@ def test_get_seed():
     for _ in range(100):
         assert get_seed() in seeds
 
+    # Positive case - transformed seeds are valid grids with the canonical form of a stored seed
+    canonical = [canonicalize(seed)[0] for seed in seeds]
+    transformed = [get_seed(transform=True) for _ in range(50)]
+    for seed in transformed:
+        assert Sudoku(seed).valid()
+        assert canonicalize(seed)[0] in canonical
+    assert len(set(transformed)) > 40
+    assert canonicalize(get_seed(index=1, transform=True))[0] == canonical[1]
+
+    # Negative case - invalid transform option
+    for transform in [1, "True", None]:
+        with pytest.raises(Exception) as exception:
+            get_seed(transform=transform)
+        assert "Invalid Transform" in str(exception.value)
+
+    # Positive case - the seed file does not depend on the working directory
+    directory = os.getcwd()
+    os.chdir(os.path.dirname(directory))
+    try:
+        assert seed_count() == len(seeds)
+        assert get_seed(index=len(seeds) - 1) == seeds[-1]
+    finally:
+        os.chdir(directory)
+
+    # Positive case - seeds saved after a file without a final line ending
+    save_seed("ekfhlgjimgilmjekfhhmjkfielgfhklemigjmgijkhfelljeigfmhkkfhgijlmejemfhlgkiilgemkhjf")
+    assert seed_count() == len(seeds) + 1
+    assert get_seed(index=len(seeds)) == "ekfhlgjimgilmjekfhhmjkfielgfhklemigjmgijkhfelljeigfmhkkfhgijlmejemfhlgkiilgemkhjf"
+    assert get_seed(index=len(seeds) - 1) == seeds[-1]
+
     # Negative case - invalid index
-    for index in [-3, -2, -1, 4, 5, 6, 1.0, "index", False]:
+    for index in [-3, -2, -1, 5, 6, 1.0, "index", False]:
         with pytest.raises(Exception) as exception:
             get_seed(index=index)
         assert "Invalid Index" in str(exception.value)
 
+    # Negative case - seed file without fixed size records
+    file = open(file_name, "a")
+    file.write("efg\n")
+    file.close()
+
+    with pytest.raises(Exception) as exception:
+        get_seed()
+    assert "Invalid Seed File" in str(exception.value)
+
+    # Negative case - empty seed file
+    open(file_name, "w").close()
+
+    assert seed_count() == 0
+    with pytest.raises(Exception) as exception:
+        get_seed()
+    assert "Empty Seed File" in str(exception.value)
+
     # Call the set down function to reverse the setup
     set_down()
 
@@ -94,26 +143,166 @@ def test_save_seed():
     # Call the set down function to reverse the setup
     set_down()
 
-# Takes too long
-# def test_mutate_seed():
-#     """
-#     Method to test getting all the valid mutations of a seed.
-#
-#     This checks that all valid mutations of a seed are found.
-#     """
-#
-#     file = open(file_name, "w")
-#     file.close()
-#
-#     # Mutate a short seed
-#     mutate_seed("defg")
-#
-#     # Read the list of mutated seeds found
-#     file = open(file_name, "r")
-#     seeds = file.readlines()
-#     file.close()
-#
-#     assert len(seeds) == 1
+def test_save_seeds():
+    """
+    Method to test saving many seeds to the seed file at once.
+
+    This saves batches of seeds with duplicates and checks only the new seeds are saved, including when
+    the duplicate index has to grow or be rebuilt.
+    """
+
+    # Call the setup function
+    setup()
+
+    # Generate seeds which are not in the seed file
+    new = list()
+    for seed in Sudoku().iter_solutions():
+        if seed not in seeds:
+            new += [seed]
+        if len(new) == 600:
+            break
+
+    # Positive case - duplicates within the batch and of the seed file are skipped
+    assert save_seeds(seeds + new[:10] + new[:10], batch_size=7) == 10
+    assert save_seeds(iter(new)) == len(new) - 10
+    assert save_seeds(new) == 0
+    assert seed_count() == len(seeds) + len(new)
+    assert [get_seed(index=i) for i in range(seed_count())] == seeds + new
+
+    # Positive case - the index grows past its smallest size
+    with Seed_Index() as index:
+        assert index.count() == len(seeds) + len(new)
+        assert all(index.contains(seed) for seed in seeds + new)
+        assert not index.contains(swap(new[0], "e", "f"))
+
+    # Positive case - the index is rebuilt when the seed file is replaced
+    file = open(file_name, "w")
+    file.write("\n".join(new[:3]))
+    file.close()
+
+    assert save_seeds(seeds + new[:3]) == len(seeds)
+    assert seed_count() == len(seeds) + 3
+
+    # Positive case - seeds appended without the index are added to it
+    file = open(file_name, "a")
+    file.write(new[3] + "\n")
+    file.close()
+
+    assert save_seeds(new[:5]) == 1
+    assert get_seed(index=len(seeds) + 4) == new[4]
+
+    # Positive case - canonical forms save one seed for the transforms of a grid
+    assert save_seeds([swap(new[5], "e", "f"), new[5], swap(new[5], "g", "m")], canonical=True) == 1
+    assert save_seed(swap(new[6], "h", "i"), canonical=True) is None
+    with pytest.raises(Exception) as exception:
+        save_seed(new[6], canonical=True)
+    assert "Duplicate Seed" in str(exception.value)
+    assert seed_count() == len(seeds) + 7
+
+    # Negative case - invalid seeds save nothing
+    for batch in [new[5:7] + ["sadnasdnasd"], [new[5], 1], [new[5], new[5].replace("e", "f", 1)]]:
+        with pytest.raises(Exception) as exception:
+            save_seeds(batch)
+        assert "Invalid Seed" in str(exception.value)
+    assert seed_count() == len(seeds) + 7
+
+    # Negative case - invalid batch size and canonical
+    for canonical in [1, "True", None]:
+        with pytest.raises(Exception) as exception:
+            save_seeds(new, canonical=canonical)
+        assert "Invalid Canonical" in str(exception.value)
+
+    for batch_size in [0, -1, 1.0, "1", None]:
+        with pytest.raises(Exception) as exception:
+            save_seeds(new, batch_size=batch_size)
+        assert "Invalid Batch Size" in str(exception.value)
+
+    # Call the set down function to reverse the setup
+    set_down()
+
+def test_generate_seeds():
+    """
+    Method to test generating seeds and saving them to the seed file.
+
+    This generates a limited number of seeds in small batches and checks they are all saved.
+    """
+
+    # Call the setup function
+    setup()
+
+    # Positive case - seeds saved in batches
+    assert generate_seeds(limit=25, batch_size=7) == 25
+
+    file = open(file_name, "r")
+    lines = [line.strip() for line in file.readlines()]
+    file.close()
+
+    assert len(lines) == len(seeds) + 25
+    assert len(set(lines)) == len(lines)
+    assert lines[:len(seeds)] == seeds
+    for line in lines:
+        assert Sudoku(line).valid()
+
+    # Negative case - invalid limit and batch size
+    for limit in [0, -1, 1.0, "1"]:
+        with pytest.raises(Exception) as exception:
+            generate_seeds(limit=limit)
+        assert "Invalid Limit" in str(exception.value)
+
+    for batch_size in [0, -1, 1.0, "1", None]:
+        with pytest.raises(Exception) as exception:
+            generate_seeds(limit=1, batch_size=batch_size)
+        assert "Invalid Batch Size" in str(exception.value)
+
+    # Call the set down function to reverse the setup
+    set_down()
+
+def test_mutate_seed():
+    """
+    Method to test finding and saving the relabellings of a seed.
+
+    This mutates a seed with a limit and checks the seeds saved are valid relabellings of it.
+    """
+
+    # Call the setup function
+    setup()
+
+    # Positive case - the first seeds found swap a single pair of values
+    assert mutate_seed(seeds[0], limit=36, batch_size=5) == 36
+    swaps = [get_seed(index=i) for i in range(len(seeds), seed_count())]
+    assert len(set(swaps)) == 36
+    for seed in swaps:
+        assert sum(1 for one, two in zip(seed, seeds[0]) if one != two) == 18
+
+    # Positive case - seeds already saved are not saved again
+    assert mutate_seed(seeds[0], limit=500, batch_size=64) == 500 - 36
+    assert seed_count() == len(seeds) + 500
+
+    for index in range(len(seeds), seed_count()):
+        seed = get_seed(index=index)
+        assert Sudoku(seed).valid()
+
+        # Relabelling maps each value of the original seed to a single value
+        assert len(set(zip(seeds[0], seed))) == 9
+
+    # Negative case - invalid seed, limit and batch size
+    for seed in [True, "sadnasdnasd", seeds[0].replace("e", "f", 1)]:
+        with pytest.raises(Exception) as exception:
+            mutate_seed(seed)
+        assert "Invalid Seed" in str(exception.value)
+
+    for limit in [0, -1, 1.0, "1"]:
+        with pytest.raises(Exception) as exception:
+            mutate_seed(seeds[0], limit=limit)
+        assert "Invalid Limit" in str(exception.value)
+
+    for batch_size in [0, -1, 1.0, "1", None]:
+        with pytest.raises(Exception) as exception:
+            mutate_seed(seeds[0], limit=1, batch_size=batch_size)
+        assert "Invalid Batch Size" in str(exception.value)
+
+    # Call the set down function to reverse the setup
+    set_down()
 
 def test_swap():
     """
@@ -4,6 +4,7 @@ Tests for the Sudoku Class.
 
 from ..sudoku import Sudoku
 from ..cell_value import Cell_Value
+from ..dancing_links import Dancing_Links
 import random
 import pytest
 from io import StringIO
@@ -146,6 +147,40 @@ def test_clear():
         for row in range(1, 10):
                 assert sudoku.get_value(column, row) == Cell_Value.EMPTY
 
+def test_equality():
+    """
+    Method to test the methods to compare and hash Sudoku grids.
+
+    The tests create sudoku grids from seeds and checks grids with the same values are equal.
+    """
+
+    # Positive case - sudokus with the same random values are equal and have the same hash
+    for _ in range(100):
+        cells = [Cell_Value(random.randint(0, 9)) for _ in range(81)]
+        seed = "".join([cell.seed() for cell in cells])
+
+        sudoku = Sudoku(seed=seed)
+        other = Sudoku(seed=seed)
+
+        assert sudoku == other
+        assert hash(sudoku) == hash(other)
+        assert len(set([sudoku, other])) == 1
+
+    # Negative case - sudokus with a different cell value are not equal
+    sudoku = Sudoku()
+    other = Sudoku()
+    other.set_value(random.randint(1, 9), random.randint(1, 9), Cell_Value.ONE)
+
+    assert sudoku != other
+
+    # Negative case - sudokus are not equal to other types
+    for value in [None, 0, "", Sudoku().get_seed(), Cell_Value.EMPTY]:
+        assert sudoku != value
+
+    # Negative case - no attributes can be added outside of the slots
+    with pytest.raises(AttributeError):
+        sudoku.attribute = 1
+
 def test_get_set_value():
     """
     Method to test the methods to get and set a value from a given Sudoku.
@@ -458,6 +493,23 @@ def test_cell_options():
                 assert len(options) == 8
                 assert set(options) == set([Cell_Value(value) for value in range(1, 10)]) - set([cell_value])
 
+    # Positive case - random cell values set and cleared, compared to the values in the row, column and box
+    sudoku = Sudoku()
+    for _ in range(500):
+        sudoku.set_value(random.randint(1, 9), random.randint(1, 9), Cell_Value(random.randint(0, 9)))
+
+        column, row = random.randint(1, 9), random.randint(1, 9)
+
+        expected = set([Cell_Value(value) for value in range(1, 10)])
+        expected -= set(sudoku.get_row_values(row, ignore=column))
+        expected -= set(sudoku.get_column_values(column, ignore=row))
+        expected -= set(sudoku.get_box_values(column, row, ignore=True))
+
+        options = sudoku.cell_options(column, row)
+
+        assert len(options) == len(expected)
+        assert set(options) == expected
+
     # Negative case - invalid column and row number
     for column in [-10, -1, 0, 10, 11, 1.0, 2.5, "One", Cell_Value.ONE, Sudoku()]:
         for row in [-10, -1, 0, 10, 11, 1.0, 2.5, "One", Cell_Value.ONE, Sudoku()]:
@@ -539,6 +591,183 @@ def test_valid():
         assert sudoku.valid() == False
         assert sudoku.valid(empty_as_valid=True) == False
 
+def test_conflicting_cells():
+    """
+    Method to test the method to find the cells which conflict with another cell in the sudoku.
+
+    The tests create a sudoku and compares the conflicting cells to the cells found by brute force.
+    """
+
+    # Positive case - empty sudoku and valid sudoku
+    assert Sudoku().conflicting_cells() == []
+    assert Sudoku("ijelhkmfggkmifejlhhflmjgekijegklmihfkmhjifgellifeghkmjmgihklfjeehjfmilgkflkgejhim").conflicting_cells() == []
+
+    # Positive case - duplicate row value in a valid sudoku
+    sudoku = Sudoku("ijelhkmfgikmifejlhhflmjgekijegklmihfkmhjifgellifeghkmjmgihklfjeehjfmilgkflkgejhim")
+    assert set(sudoku.conflicting_cells()) == set([(1, 1), (2, 1), (2, 4)])
+
+    # Positive case - random values set and cleared, compared to the cells found using cell options
+    sudoku = Sudoku()
+    for _ in range(500):
+        sudoku.set_value(random.randint(1, 9), random.randint(1, 9), Cell_Value(random.randint(0, 9)))
+
+        expected = set()
+        for column in range(1, 10):
+            for row in range(1, 10):
+                value = sudoku.get_value(column, row)
+                if value != Cell_Value.EMPTY and value not in sudoku.cell_options(column, row):
+                    expected.add((column, row))
+
+        assert set(sudoku.conflicting_cells()) == expected
+        assert sudoku.valid(empty_as_valid=True) == (len(expected) == 0)
+
+def test_fill():
+    """
+    Method to test the method to fill a sudoku with valid values.
+
+    The tests fill empty and partially filled sudokus and checks the result is a valid sudoku.
+    """
+
+    # Positive case - empty sudoku
+    seeds = set()
+    for _ in range(20):
+        sudoku = Sudoku()
+        sudoku.fill(clear=True)
+
+        assert sudoku.valid() == True
+        seeds.add(sudoku.get_seed())
+
+    # Positive case - filling an empty sudoku is random
+    assert len(seeds) > 1
+
+    # Positive case - partially filled sudoku keeps the given values
+    seed = "ijelhkmfggkmifejlhhflmjgekijegklmihfkmhjifgellifeghkmjmgihklfjeehjfmilgkflkgejhim"
+    for _ in range(20):
+        partial = list(seed)
+        for index in random.sample(range(81), random.randint(0, 81)):
+            partial[index] = Cell_Value.EMPTY.seed()
+        partial = "".join(partial)
+
+        sudoku = Sudoku(seed=partial)
+        sudoku.fill()
+
+        assert sudoku.valid() == True
+        for index in range(81):
+            assert partial[index] == Cell_Value.EMPTY.seed() or sudoku.get_seed()[index] == partial[index]
+
+    # Negative case - invalid existing sudoku
+    with pytest.raises(Exception) as exception:
+        sudoku = Sudoku(seed=Cell_Value.ONE.seed() * 2 + Cell_Value.EMPTY.seed() * 79)
+        sudoku.fill()
+    assert "Existing Sudoku Grid is not Valid" in str(exception.value)
+
+    # Negative case - sudoku which can not be filled
+    with pytest.raises(Exception) as exception:
+        sudoku = Sudoku(seed="".join([Cell_Value(value).seed() for value in range(1, 9)]) + "d" * 9 + Cell_Value.NINE.seed() + "d" * 63)
+        sudoku.fill()
+    assert "Could not find a valid sudoku grid" in str(exception.value)
+
+def test_fill_find_all():
+    """
+    Method to test the method to fill a sudoku finding all of the valid filled grids.
+
+    The tests fill partially filled sudokus and compares the grids found to the grids found by the
+    Dancing Links solver.
+    """
+
+    seed = "ijelhkmfggkmifejlhhflmjgekijegklmihfkmhjifgellifeghkmjmgihklfjeehjfmilgkflkgejhim"
+
+    # Positive case - partially filled sudokus
+    for _ in range(20):
+        partial = list(seed)
+        for index in random.sample(range(81), random.randint(0, 50)):
+            partial[index] = Cell_Value.EMPTY.seed()
+        partial = "".join(partial)
+
+        sudoku = Sudoku(seed=partial)
+        seeds = sudoku.fill(find_all=True)
+
+        assert len(seeds) == len(set(seeds))
+        assert set(seeds) == set(Dancing_Links(partial).solve_all())
+
+        # The sudoku is left unchanged once all the grids have been found
+        assert sudoku.get_seed() == partial
+
+def test_iter_solutions():
+    """
+    Method to test the generator of the solutions of a sudoku.
+
+    The tests take solutions from the generator and checks they are valid and distinct.
+    """
+
+    # Positive case - empty sudoku gives distinct valid grids lazily
+    sudoku = Sudoku()
+    solutions = sudoku.iter_solutions()
+
+    seeds = [next(solutions) for _ in range(50)]
+
+    assert len(set(seeds)) == 50
+    for seed in seeds:
+        assert Sudoku(seed=seed).valid() == True
+
+    # The sudoku is not changed by the search
+    assert sudoku == Sudoku()
+
+    # Positive case - complete sudoku is its own only solution
+    seed = "ijelhkmfggkmifejlhhflmjgekijegklmihfkmhjifgellifeghkmjmgihklfjeehjfmilgkflkgejhim"
+    assert list(Sudoku(seed=seed).iter_solutions()) == [seed]
+
+    # Negative case - sudoku with conflicting values has no solutions
+    assert list(Sudoku(seed=Cell_Value.ONE.seed() * 81).iter_solutions()) == []
+
+def test_count_solutions():
+    """
+    Method to test the method to count the solutions of a sudoku.
+
+    The tests count the solutions of sudokus with a known number of solutions.
+    """
+
+    # Positive case - sudoku with a unique solution
+    seed = "igddkddddjddemiddddmlddddjdldddjdddghddldgddekdddfdddjdjddddflddddhemddiddddlddkm"
+    sudoku = Sudoku(seed=seed)
+    count, solutions = sudoku.count_solutions()
+
+    assert count == 1
+    assert solutions == [Dancing_Links(seed).solve()]
+    assert sudoku.get_seed() == seed
+
+    # Positive case - empty sudoku stops at the limit
+    for limit in [1, 2, 5, 50]:
+        count, solutions = Sudoku().count_solutions(limit=limit)
+
+        assert count == limit
+        assert len(solutions) == min(limit, 2)
+        assert len(set(solutions)) == len(solutions)
+        for solution in solutions:
+            assert Sudoku(seed=solution).valid() == True
+
+    # Positive case - sudokus with cells removed from a valid sudoku, compared to the Dancing Links solver
+    seed = "ijelhkmfggkmifejlhhflmjgekijegklmihfkmhjifgellifeghkmjmgihklfjeehjfmilgkflkgejhim"
+    for _ in range(20):
+        partial = list(seed)
+        for index in random.sample(range(81), random.randint(40, 55)):
+            partial[index] = Cell_Value.EMPTY.seed()
+        partial = "".join(partial)
+
+        count, solutions = Sudoku(seed=partial).count_solutions(limit=None)
+
+        assert count == Dancing_Links(partial).count_solutions()
+        assert set(solutions).issubset(set(Dancing_Links(partial).solve_all()))
+
+    # Positive case - sudoku with conflicting values has no solutions
+    assert Sudoku(seed=Cell_Value.ONE.seed() * 81).count_solutions() == (0, [])
+
+    # Negative case - invalid limit
+    for limit in [0, -1, 1.0, "1", True]:
+        with pytest.raises(Exception) as exception:
+            Sudoku().count_solutions(limit=limit)
+        assert "Invalid Limit" in str(exception.value)
+
 def test_print_terminal():
     """
     Method to test the method to get a list of valid options for a cell from a given Sudoku.
@@ -612,3 +841,76 @@ def test_print_terminal():
             sudoku = Sudoku()
             sudoku.print_terminal(size=size)
         assert "Invalid Size" in str(exception.value)
+
+def test_grid_sizes():
+    """
+    Method to test sudoku grids of sizes other than 9 x 9.
+
+    The tests fill grids of each size and check the seeds, values, options and printing of the grids.
+    """
+
+    # Positive case - filled grids of each size are valid and their seeds recreate them
+    for size in [4, 6, 8, 12, 16, 25]:
+        sudoku = Sudoku(size=size)
+        sudoku.fill()
+
+        assert sudoku.get_size() == size
+        assert sudoku.valid()
+        assert len(sudoku.get_seed()) == size * size
+        assert Sudoku(sudoku.get_seed(), size=size) == sudoku
+        assert Sudoku(sudoku.get_seed(), size=size) != Sudoku(size=size)
+
+        # Every row, column and box holds each value once
+        box_height, box_width = sudoku.get_box_size()
+        for index in range(1, size + 1):
+            assert sorted([sudoku.get_number(column, index) for column in range(1, size + 1)]) == list(range(1, size + 1))
+            assert sorted([sudoku.get_number(index, row) for row in range(1, size + 1)]) == list(range(1, size + 1))
+
+        for row in range(1, size + 1, box_height):
+            for column in range(1, size + 1, box_width):
+                values = [sudoku.get_number(column + x, row + y) for x in range(box_width) for y in range(box_height)]
+                assert sorted(values) == list(range(1, size + 1))
+
+    # Positive case - options of an emptied cell in a 16 x 16 grid
+    sudoku = Sudoku(size=16)
+    sudoku.fill()
+    value = sudoku.get_number(7, 11)
+    sudoku.set_number(7, 11, 0)
+    assert sudoku.number_options(7, 11) == [value]
+    assert sudoku.valid(empty_as_valid=True)
+    assert not sudoku.valid()
+
+    # Positive case - partial 6 x 6 grid has the same solutions as the exact cover solver finds
+    sudoku = Sudoku(size=6)
+    sudoku.fill()
+    for index in random.sample(range(36), 20):
+        sudoku._set_cell(index, 0)
+    solutions = list(sudoku.iter_solutions())
+    assert len(solutions) >= 1
+    assert set(solutions) == set(Dancing_Links(sudoku.get_seed()).solve_all())
+
+    # Positive case - printing a 16 x 16 grid shows two digit values
+    capturedOutput = StringIO()
+    sys.stdout = capturedOutput
+    Sudoku("t" * 256, size=16).print_terminal(size="big")
+    sys.stdout = sys.__stdout__
+    assert "16" in capturedOutput.getvalue()
+    assert capturedOutput.getvalue().count("┃") == 16 * 5
+
+    # Negative case - invalid sizes
+    for size in [0, 2, 3, 5, 7, 11, 26, 9.0, "9", None]:
+        with pytest.raises(Exception) as exception:
+            Sudoku(size=size)
+        assert "Invalid Size" in str(exception.value)
+
+    # Negative case - seeds which do not match the size of the grid
+    for seed, size in [("d" * 81, 4), ("d" * 16, 9), ("i" * 16, 4), ("k" * 36, 6), ("u" * 256, 16)]:
+        with pytest.raises(Exception) as exception:
+            Sudoku(seed, size=size)
+        assert "Invalid Seed" in str(exception.value)
+
+    # Negative case - values larger than the size of the grid
+    for value in [-1, 5, 10, 1.0, None]:
+        with pytest.raises(Exception) as exception:
+            Sudoku(size=4).set_number(1, 1, value)
+        assert "Invalid Value" in str(exception.value)